@@ -0,0 +1,76 @@
+"""
+Compares delivering the same Message through the synchronous post() and the awaitable post_async() against an
+in-process fake client that simulates Web API latency.
+
+    python -m benchmarks.async_delivery [--messages 500] [--latency 0.01]
+"""
+import argparse
+import asyncio
+import time
+
+from pyblock_builder.surfaces import Message
+from pyblock_builder.blocks import Section, Divider, Context
+from pyblock_builder.objects import Text
+
+
+class FakeClient:
+    def __init__(self, latency):
+        self.latency = latency
+
+    def chat_postMessage(self, **kwargs):
+        time.sleep(self.latency)
+        return {"ok": True, "channel": kwargs["channel"]}
+
+
+class FakeAsyncClient:
+    def __init__(self, latency):
+        self.latency = latency
+
+    async def chat_postMessage(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        return {"ok": True, "channel": kwargs["channel"]}
+
+
+def build_message():
+    return (Message()
+            .set_channel("C0000000000")
+            .set_text("Incident update")
+            .add_blocks(
+                Section().set_text("*Incident:* database failover in progress"),
+                Divider(),
+                Context().add_elements(Text().set_text("Posted by the incident bot"))
+            ))
+
+
+def bench_sync(message, count, latency):
+    client = FakeClient(latency)
+    start = time.perf_counter()
+    for _ in range(count):
+        message.post(client)
+    return time.perf_counter() - start
+
+
+async def bench_async(message, count, latency):
+    client = FakeAsyncClient(latency)
+    start = time.perf_counter()
+    await asyncio.gather(*(message.post_async(client) for _ in range(count)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.01)
+    args = parser.parse_args()
+
+    message = build_message()
+    sync_time = bench_sync(message, args.messages, args.latency)
+    async_time = asyncio.run(bench_async(message, args.messages, args.latency))
+
+    print(f"{args.messages} posts at {args.latency * 1000:.0f} ms simulated latency")
+    print(f"  post()        {sync_time:8.3f} s  {args.messages / sync_time:10.1f} msg/s")
+    print(f"  post_async()  {async_time:8.3f} s  {args.messages / async_time:10.1f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
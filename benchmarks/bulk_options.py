@@ -0,0 +1,61 @@
+"""
+Compares building a static select menu option by option with chained setters against StaticSelectMenu.from_columns(),
+for plain lists and, when NumPy is installed, NumPy arrays. The time includes rendering the menu JSON.
+
+    python -m benchmarks.bulk_options [--rows 100 10000 100000] [--repeat 3]
+"""
+import argparse
+import time
+
+from pyblock_builder.elements import StaticSelectMenu
+from pyblock_builder.objects import Option
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def chained(texts, values):
+    return StaticSelectMenu().set_options(
+        *[Option().set_text(text).set_value(value) for text, value in zip(texts, values)]
+    ).json
+
+
+def bulk(texts, values):
+    return StaticSelectMenu.from_columns(texts, values).json
+
+
+def best_of(repeat, build, *columns):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build(*columns)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        texts = [f"Team {i}" for i in range(rows)]
+        values = [str(i) for i in range(rows)]
+        cases = [("chained setters", chained, texts, values), ("from_columns(list)", bulk, texts, values)]
+        if numpy is not None:
+            cases.append(("from_columns(ndarray)", bulk, numpy.array(texts), numpy.arange(rows)))
+
+        print(f"{rows} options")
+        baseline = None
+        for name, build, *columns in cases:
+            elapsed = best_of(args.repeat, build, *columns)
+            baseline = baseline or elapsed
+            print(f"  {name:22} {elapsed * 1e3:9.2f} ms  {elapsed / rows * 1e9:7.0f} ns/option  "
+                  f"{baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
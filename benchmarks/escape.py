@@ -0,0 +1,60 @@
+"""
+Measures md.escape() on user-supplied fields, md.escape_all() on a column of them, and what auto-escape mode adds to
+the md helpers and to mrkdwn Text objects.
+
+    python -m benchmarks.escape [--number 100000] [--rows 10000]
+"""
+import argparse
+import timeit
+
+from pyblock_builder.mrkdwn import md
+from pyblock_builder.objects import Text
+
+CLEAN = "Quarterly report for the platform team, week 42"
+DIRTY = "Q&A: <!channel> should not be pinged > twice"
+
+_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def per_call(number, func, *args):
+    return timeit.timeit(lambda: func(*args), number=number) * 1_000_000 / number
+
+
+def translate(text):
+    return text.translate(_TABLE)
+
+
+def mrkdwn_text(text):
+    return Text().set_text(text).as_mrkdwn()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=100000)
+    parser.add_argument("--rows", type=int, default=10000)
+    args = parser.parse_args()
+
+    print("µs per call")
+    for name, text in (("clean", CLEAN), ("dirty", DIRTY)):
+        print(f"  escape {name:5}      {per_call(args.number, md.escape, text):6.3f}   "
+              f"str.translate {per_call(args.number, translate, text):6.3f}")
+
+    rows = [DIRTY if i % 10 == 0 else CLEAN for i in range(args.rows)]
+    number = max(args.number // args.rows, 10)
+    print(f"µs per {args.rows} rows, one in ten needing escapes")
+    print(f"  escape_all         {per_call(number, md.escape_all, rows):9.1f}   "
+          f"escape() per row {per_call(number, lambda: [md.escape(row) for row in rows]):9.1f}")
+
+    print("µs per call, auto-escape off / on")
+    for name, func, arg in (("bold", md.bold, DIRTY), ("bullet_list", md.bullet_list, [CLEAN, DIRTY, CLEAN]),
+                            ("mrkdwn Text", mrkdwn_text, DIRTY)):
+        md.disable_auto_escape()
+        off = per_call(args.number, func, arg)
+        md.enable_auto_escape()
+        on = per_call(args.number, func, arg)
+        print(f"  {name:18} {off:6.3f} / {on:6.3f}")
+    md.disable_auto_escape()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Measures the cold-start import time of pyblock_builder with `python -X importtime` and fails when it exceeds a
+budget, so it can guard cold-start time in CI.
+
+    python -m benchmarks.import_time [--runs 15] [--budget-ms 40]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = [
+    "from pyblock_builder.elements import Button",
+    "from pyblock_builder.blocks import Section, Actions",
+    "from pyblock_builder.surfaces import Message",
+    "from pyblock_builder.surfaces import Modal; from pyblock_builder.blocks import Input; "
+    "from pyblock_builder.elements import PlainTextInput",
+]
+
+
+def import_time_us(statement):
+    """
+    Runs the statement in a fresh interpreter and returns the total time spent importing modules it pulled in,
+    along with the names of the pyblock_builder modules that were imported.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True
+    ).stderr
+    baseline = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"],
+        capture_output=True, text=True, check=True
+    ).stderr
+    preloaded = {line.rsplit("|", 1)[1].strip() for line in baseline.splitlines() if line.startswith("import time:")}
+
+    total = 0
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        if name in preloaded:
+            continue
+        total += int(self_us)
+        if name.startswith("pyblock_builder"):
+            modules.append(name)
+    return total, modules
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="fail if the median import time of any scenario exceeds this many milliseconds")
+    args = parser.parse_args()
+
+    over_budget = False
+    for statement in SCENARIOS:
+        samples = []
+        modules = []
+        for _ in range(args.runs):
+            total, modules = import_time_us(statement)
+            samples.append(total)
+        median_ms = statistics.median(samples) / 1000
+        print(f"{median_ms:8.2f} ms  {len(modules):3d} modules  {statement}")
+        if args.budget_ms is not None and median_ms > args.budget_ms:
+            over_budget = True
+
+    if over_budget:
+        print(f"Import time budget of {args.budget_ms} ms exceeded")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Compares the JSON backends on realistic views: the time to encode a large AppHome and a Modal with each backend, and
+the time the Slack client spends encoding a views.publish request body when the view is passed as a dict versus
+pre-encoded with send_pre_encoded().
+
+    python -m benchmarks.json_encoders [--iterations 2000] [--sections 40]
+"""
+import argparse
+import importlib.util
+import json
+import time
+
+from benchmarks.memory import build_app_home, build_modal
+from pyblock_builder.blocks import Divider, Section
+from pyblock_builder.elements import OverflowMenu
+from pyblock_builder.objects import Fields, Option
+from pyblock_builder.serialization import dumps, set_backend
+
+
+def client_encode(body):
+    # What the Slack client does with the keyword arguments of a JSON request
+    return json.dumps(body).encode()
+
+
+def timed(iterations, function, *args):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function(*args)
+    return (time.perf_counter() - start) / iterations
+
+
+def large_app_home(sections):
+    app_home = build_app_home(0)
+    for n in range(sections):
+        app_home.add_blocks(
+            Section()
+            .set_text(f"*Incident {n}* — paging <@U{n:08d}>\nImpact: checkout latency above SLO for 12 minutes")
+            .set_fields(Fields().add_field("*Severity*").add_field(f"SEV{n % 4}").add_field("*Status*")
+                        .add_field("Investigating"))
+            .add_accessory(OverflowMenu().set_action_id(f"incident_{n}").set_options(
+                Option().set_text("Acknowledge").set_value("ack"), Option().set_text("Resolve").set_value("resolve"))),
+            Divider()
+        )
+    return app_home
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--sections", type=int, default=40)
+    args = parser.parse_args()
+    views = {"AppHome": large_app_home(args.sections).view, "Modal": build_modal(0).view}
+
+    backends = ["json"]
+    if importlib.util.find_spec("orjson") is not None:
+        backends.append("orjson")
+    else:
+        print("orjson is not installed; only the standard library backend is measured")
+
+    for name, view in views.items():
+        print(f"{name}: {len(view['blocks'])} blocks, {len(dumps(view)) / 1024:.1f} KiB")
+        for backend in backends:
+            set_backend(backend)
+            print(f"  dumps() with {backend:7} {timed(args.iterations, dumps, view) * 1e6:9.1f} us")
+
+            body = {"user_id": "U1", "view": view}
+            pre_encoded = {"user_id": "U1", "view": dumps(view).decode()}
+            as_dict = timed(args.iterations, client_encode, body)
+            as_string = timed(args.iterations, lambda: client_encode({"user_id": "U1", "view": dumps(view).decode()}))
+            print(f"    request body, view as dict       {as_dict * 1e6:9.1f} us")
+            print(f"    request body, pre-encoded view   {as_string * 1e6:9.1f} us  "
+                  f"(of which the client encodes {timed(args.iterations, client_encode, pre_encoded) * 1e6:.1f} us)")
+
+
+if __name__ == "__main__":
+    main()
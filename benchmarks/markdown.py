@@ -0,0 +1,105 @@
+"""
+Compares markdown_to_mrkdwn() with a pipeline of regex substitutions of the kind it replaces, on runbooks of growing
+size, to check that the converter's time grows linearly with the input.
+
+Each runbook repeats a section with a heading, paragraphs with bold, italic, code and links, a nested list, a quote
+and a code block. The pipeline runs one re.sub() per construct over the whole text and handles less of Markdown, so
+its output is not the same; it is only a baseline for time. Its lazy (.+?) patterns scan to the end of the line from
+every delimiter that has no match, which the second table shows on single lines with a stray * in each word.
+
+    python -m benchmarks.markdown [--kilobytes 16 64 256 1024] [--line-kilobytes 4 8 16 32]
+"""
+import argparse
+import re
+import time
+
+from pyblock_builder.mrkdwn import markdown_to_mrkdwn
+
+SECTION = """## Step {n}: drain node `db-{n}`
+
+When the **primary** replica lags by more than *30 seconds*, drain it before restarting. See
+[the dashboard](https://grafana.example.com/d/db?var-node=db-{n}&from=now-1h) and ~~the old wiki~~ for context.
+
+- Check replication:
+  - `SELECT * FROM pg_stat_replication;`
+  - compare **lag** with the *threshold*
+- Drain with the script below
+
+> Do __not__ restart more than one node at a time.
+
+```
+./drain.sh --node db-{n} --wait 300
+```
+
+---
+"""
+
+PIPELINE = [
+    (re.compile(r"&"), "&amp;"),
+    (re.compile(r"<"), "&lt;"),
+    (re.compile(r">"), "&gt;"),
+    (re.compile(r"^#{1,6}\s+(.+?)\s*#*$", re.M), r"*\1*"),
+    (re.compile(r"\*\*(.+?)\*\*"), "\x00\\1\x00"),
+    (re.compile(r"__(.+?)__"), "\x00\\1\x00"),
+    (re.compile(r"(?<![*\w])\*(?!\s)(.+?)(?<!\s)\*(?![*\w])"), r"_\1_"),
+    (re.compile(r"\x00"), "*"),
+    (re.compile(r"~~(.+?)~~"), r"~\1~"),
+    (re.compile(r"\[([^\]]*)\]\(([^)\s]+)[^)]*\)"), r"<\2|\1>"),
+    (re.compile(r"^(\s*)[-*+]\s+", re.M), r"\1• "),
+    (re.compile(r"^&gt;\s?", re.M), ">"),
+    (re.compile(r"^-{3,}$", re.M), "---"),
+    (re.compile(r"```\w*\n"), "```"),
+]
+
+
+def regex_pipeline(text):
+    for pattern, replacement in PIPELINE:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def runbook(size):
+    sections = []
+    length = 0
+    n = 0
+    while length < size:
+        section = SECTION.format(n=n)
+        sections.append(section)
+        length += len(section)
+        n += 1
+    return "".join(sections)
+
+
+def unmatched_line(size):
+    return "price *a " * (size // 9)
+
+
+def measure(convert, text, number=3):
+    best = float("inf")
+    for _ in range(number):
+        start = time.perf_counter()
+        convert(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--kilobytes", type=float, nargs="+", default=[16, 64, 256, 1024])
+    parser.add_argument("--line-kilobytes", type=float, nargs="+", default=[4, 8, 16, 32])
+    args = parser.parse_args()
+
+    for title, make, sizes in (("runbooks", runbook, args.kilobytes),
+                               ("one line, unmatched *", unmatched_line, args.line_kilobytes)):
+        print(f"{title:<22} converter: ms     MB/s   regex pipeline: ms     MB/s")
+        for kilobytes in sizes:
+            text = make(int(kilobytes * 1024))
+            megabytes = len(text) / 1_000_000
+            converter = measure(markdown_to_mrkdwn, text)
+            pipeline = measure(regex_pipeline, text, number=1)
+            print(f"{kilobytes:7.0f} KB {converter:24.2f} {megabytes / converter * 1000:8.1f} "
+                  f"{pipeline:18.2f} {megabytes / pipeline * 1000:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
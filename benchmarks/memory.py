@@ -0,0 +1,117 @@
+"""
+Measures the memory held by representative Modal and AppHome layouts with tracemalloc.
+
+With --baseline, the same layouts are also built with the builders of another checkout, i.e. one made with
+`git worktree add /tmp/baseline <commit>`, in a separate interpreter, and the two are reported side by side.
+
+    python -m benchmarks.memory [--surfaces 1000] [--intern] [--baseline /tmp/baseline]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+
+from pyblock_builder.blocks import Actions, Context, Divider, Header, Input, Section
+from pyblock_builder.elements import (Button, DatePicker, MultiUsersSelect, OverflowMenu, PlainTextInput,
+                                      StaticSelectMenu)
+from pyblock_builder.objects import Fields, Option, Text
+from pyblock_builder.surfaces import AppHome, Modal
+
+
+def build_modal(i):
+    options = [Option().set_text(f"Priority {n}").set_value(str(n)) for n in range(10)]
+    return (Modal()
+            .set_title("File a ticket")
+            .set_submit_label("Submit")
+            .set_close_label("Cancel")
+            .set_callback_id(f"ticket_{i}")
+            .set_private_metadata(f"C{i:08d}")
+            .add_blocks(
+                Section().set_text("Tell us what went wrong and we will get back to you."),
+                Input().set_label("Summary").add_element(PlainTextInput().set_action_id("summary")),
+                Input().set_label("Details").add_element(
+                    PlainTextInput().set_action_id("details").enable_multiline().set_max_length(3000)),
+                Input().set_label("Priority").add_element(
+                    StaticSelectMenu().set_action_id("priority").set_options(*options).set_initial_option(options[0])),
+                Input().set_label("Watchers").add_element(MultiUsersSelect().set_action_id("watchers"))
+                .set_optional(True),
+                Input().set_label("Due date").add_element(DatePicker().set_action_id("due")).set_optional(True),
+                Context().add_elements(Text().set_text("Tickets are triaged every morning."))
+            ))
+
+
+def build_app_home(i):
+    blocks = [Header().set_text("Your week"), Section().set_text(f"Hello <@U{i:08d}>, here is what is coming up.")]
+    for n in range(8):
+        blocks.append(Section()
+                      .set_text(f"*Meeting {n}*\nRoom {n}, 10:{n:02d}")
+                      .set_fields(Fields().add_field("*Owner*").add_field(f"<@U{n:08d}>"))
+                      .add_accessory(OverflowMenu().set_action_id(f"meeting_{n}").set_options(
+                          Option().set_text("Reschedule").set_value("reschedule"),
+                          Option().set_text("Cancel").set_value("cancel"))))
+        blocks.append(Divider())
+    blocks.append(Actions().add_elements(
+        Button().set_label("New meeting").set_action_id("new_meeting").primary(),
+        Button().set_label("Settings").set_action_id("settings")
+    ))
+    return AppHome().set_callback_id("home").add_blocks(*blocks)
+
+
+SURFACES = (("Modal", build_modal), ("AppHome", build_app_home))
+
+# Run by --baseline in a fresh interpreter, with the other checkout first on sys.path so that its builders are the
+# ones imported; the benchmarks package itself is still found in the current directory
+BASELINE = """
+import json, sys
+sys.path.insert(0, sys.argv[1])
+from benchmarks.memory import SURFACES, measure
+print(json.dumps({name: measure(build, int(sys.argv[2])) for name, build in SURFACES}))
+"""
+
+
+def measure(build, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    surfaces = [build(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del surfaces
+    return (after - before) / count
+
+
+def measure_baseline(path, count):
+    """
+    Measures the surfaces built with the builders of another checkout
+    :return: dict of surface name to bytes per surface
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, "-c", BASELINE, os.path.abspath(path), str(count)],
+                            cwd=root, capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--surfaces", type=int, default=1000)
+    parser.add_argument("--intern", action="store_true", help="share labels and option texts through an InternPool")
+    parser.add_argument("--baseline", default=None,
+                        help="checkout of pyblock_builder to compare with, i.e. a worktree of an earlier commit")
+    args = parser.parse_args()
+    baseline = measure_baseline(args.baseline, args.surfaces) if args.baseline else None
+    if args.intern:
+        from pyblock_builder.objects import enable_interning
+        enable_interning()
+
+    print(f"bytes per surface, averaged over {args.surfaces} surfaces")
+    for name, build in SURFACES:
+        held = measure(build, args.surfaces)
+        if baseline is None:
+            print(f"  {name:8} {held:9.0f}")
+        else:
+            print(f"  {name:8} baseline {baseline[name]:9.0f}   current {held:9.0f}   ({held / baseline[name]:.0%})")
+
+
+if __name__ == "__main__":
+    main()
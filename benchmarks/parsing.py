@@ -0,0 +1,59 @@
+"""
+Times loading a 100-block modal view back into builder objects with Modal.from_json() and rendering it again, with
+no blocks changed, with one block changed, and with every block materialized, next to rebuilding it from scratch.
+
+    python -m benchmarks.parsing [--number 1000]
+"""
+import argparse
+import time
+
+from benchmarks.validation import build_large_modal
+from pyblock_builder.serialization import dumps
+from pyblock_builder.surfaces import Modal
+
+
+def untouched(data):
+    return Modal.from_json(data).view
+
+
+def change_one(data):
+    modal = Modal.from_json(data)
+    modal._blocks[0].set_text("Updated")
+    return modal.view
+
+
+def materialize_all(data):
+    modal = Modal.from_json(data)
+    for block in modal._blocks:
+        block.materialize()
+    return modal.view
+
+
+def rebuild(data):
+    return build_large_modal().view
+
+
+def per_call(number, func, *args):
+    start = time.perf_counter()
+    for _ in range(number):
+        func(*args)
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    view = build_large_modal().view
+    data = dumps(view)
+    assert untouched(data) == view and materialize_all(data) == view
+
+    print(f"100-block modal ({len(data)} bytes), microseconds per call averaged over {args.number} calls")
+    for name, func in (("load, no changes", untouched), ("load, change one block", change_one),
+                       ("load, materialize all", materialize_all), ("rebuild with builders", rebuild)):
+        print(f"  {name:24} {per_call(args.number, func, data):9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Measures split_text() on log excerpts of growing size, to check that its time grows linearly with the input.
+
+Each excerpt is a code block of log lines with links and bold spans in them. The same text with the line breaks
+replaced by spaces checks the path that cuts inside lines longer than the limit.
+
+    python -m benchmarks.splitter [--megabytes 1 2 4 8]
+"""
+import argparse
+import time
+
+from pyblock_builder.mrkdwn import split_text
+
+
+def log_excerpt(size):
+    lines = []
+    length = 0
+    i = 0
+    while length < size:
+        line = (f"2024-05-0{i % 9 + 1} 12:{i % 60:02d}:07 WARN request {i} to "
+                f"<https://api.example.com/v1/items/{i}|item {i}> took *{i % 997} ms* (retry {i % 3})")
+        lines.append(line)
+        length += len(line) + 1
+        i += 1
+    return "```\n" + "\n".join(lines) + "\n```"
+
+
+def measure(text):
+    start = time.perf_counter()
+    chunks = sum(1 for _ in split_text(text))
+    return time.perf_counter() - start, chunks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--megabytes", type=float, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print("size       lines: ms     MB/s  chunks   one long line: ms     MB/s  chunks")
+    for megabytes in args.megabytes:
+        text = log_excerpt(int(megabytes * 1_000_000))
+        lines_time, lines_chunks = measure(text)
+        line_time, line_chunks = measure(text.replace("\n", " "))
+        print(f"{megabytes:5.1f} MB  {lines_time * 1000:14.1f} {megabytes / lines_time:8.1f} {lines_chunks:7} "
+              f"{line_time * 1000:18.1f} {megabytes / line_time:8.1f} {line_chunks:7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compares md.table() with padding each row by hand and packing the rows into code blocks, on a table of metrics.
+
+The NumPy case, where the numeric columns are arrays, only runs when NumPy is installed.
+
+    python -m benchmarks.table [--rows 10000] [--number 10]
+"""
+import argparse
+import timeit
+
+from pyblock_builder.mrkdwn import md
+
+
+def per_call(number, func, *args):
+    return timeit.timeit(lambda: func(*args), number=number) * 1_000_000 / number
+
+
+def metrics(rows):
+    return ([f"service-{i}" for i in range(rows)], [i * 37 % 1000 for i in range(rows)],
+            [round(i / 7, 2) for i in range(rows)], ["ok" if i % 5 else "degraded" for i in range(rows)])
+
+
+HEADERS = ("service", "requests", "p99 ms", "status")
+
+
+def by_hand(columns):
+    cells = [[str(value) for value in column] for column in columns]
+    widths = [max(len(header), *map(len, column)) for header, column in zip(HEADERS, cells)]
+    line = "  ".join(f"{{:{'>' if index in (1, 2) else '<'}{width}}}" for index, width in enumerate(widths))
+    head = line.format(*HEADERS) + "\n" + "  ".join("-" * width for width in widths)
+    blocks, lines, length = [], [], len(head) + 7
+    for row in zip(*cells):
+        text = line.format(*row)
+        if length + len(text) + 1 > 3000:
+            blocks.append(md.codeblock(head + "\n" + "\n".join(lines)))
+            lines, length = [], len(head) + 7
+        lines.append(text)
+        length += len(text) + 1
+    blocks.append(md.codeblock(head + "\n" + "\n".join(lines)))
+    return blocks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    columns = metrics(args.rows)
+    pages = md.table(columns, HEADERS)
+    print(f"{args.rows} rows in {len(pages)} code blocks, longest {max(map(len, pages))} characters")
+    print(f"  by hand         {per_call(args.number, by_hand, columns) / 1000:8.2f} ms")
+    print(f"  md.table        {per_call(args.number, md.table, columns, HEADERS) / 1000:8.2f} ms")
+    try:
+        import numpy
+    except ImportError:
+        print("  md.table NumPy  skipped, NumPy is not installed")
+        return
+    arrays = (columns[0], numpy.array(columns[1]), numpy.array(columns[2]), columns[3])
+    print(f"  md.table NumPy  {per_call(args.number, md.table, arrays, HEADERS) / 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
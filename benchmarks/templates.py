@@ -0,0 +1,56 @@
+"""
+Compares building a per-user digest message with the builder classes against rendering a precompiled Template.
+
+    python -m benchmarks.templates [--users 10000]
+"""
+import argparse
+import time
+
+from pyblock_builder.blocks import Section, Context, Divider, Actions
+from pyblock_builder.elements import Button
+from pyblock_builder.mrkdwn import md
+from pyblock_builder.objects import Text
+from pyblock_builder.surfaces import Message
+from pyblock_builder.templates import Slot, Template
+
+
+def build_digest(user_name, unread, channel):
+    return (Message()
+            .set_channel(channel)
+            .set_text("Your daily digest")
+            .add_blocks(
+                Section().set_text(f"Good morning, {md.bold(user_name)}!"),
+                Section().set_text(f"You have {unread} unread mentions."),
+                Divider(),
+                Actions().add_elements(
+                    Button().set_label("Open inbox").set_action_id("open_inbox").set_value(user_name).primary(),
+                    Button().set_label("Snooze").set_action_id("snooze").set_value(user_name)
+                ),
+                Context().add_elements(Text().set_text("Sent by the digest bot"))
+            ))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=10000)
+    args = parser.parse_args()
+    users = [(f"user{i}", i % 17, f"D{i:08d}") for i in range(args.users)]
+
+    start = time.perf_counter()
+    for user_name, unread, channel in users:
+        build_digest(user_name, unread, channel).to_payload()
+    builder_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    template = Template(build_digest(Slot("user_name"), Slot("unread"), Slot("channel")))
+    for user_name, unread, channel in users:
+        template.render(user_name=user_name, unread=unread, channel=channel)
+    template_time = time.perf_counter() - start
+
+    print(f"{args.users} digests")
+    print(f"  builders           {builder_time:8.3f} s  {builder_time / args.users * 1e6:8.2f} us/render")
+    print(f"  Template.render()  {template_time:8.3f} s  {template_time / args.users * 1e6:8.2f} us/render")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Times validating a 100-block modal, next to the cost of rendering and encoding the same view, to show the validator
+is cheap enough to run before every Web API call.
+
+    python -m benchmarks.validation [--number 1000]
+"""
+import argparse
+import time
+
+from pyblock_builder.blocks import Actions, Context, Divider, Input, Section
+from pyblock_builder.elements import Button, OverflowMenu, PlainTextInput, StaticSelectMenu
+from pyblock_builder.objects import Fields, Option, Text
+from pyblock_builder.serialization import dumps
+from pyblock_builder.surfaces import Modal, validate
+
+
+def build_large_modal():
+    options = Option.from_columns([f"Priority {n}" for n in range(10)], range(10))
+    blocks = []
+    for n in range(20):
+        blocks.append(Section()
+                      .set_text(f"*Item {n}*\nDetails for item {n}")
+                      .set_fields(Fields().add_field("*Owner*").add_field(f"<@U{n:08d}>"))
+                      .add_accessory(OverflowMenu().set_action_id(f"item_{n}").set_options(
+                          Option().set_text("Edit").set_value("edit"),
+                          Option().set_text("Delete").set_value("delete"))))
+        blocks.append(Input().set_label(f"Note {n}").add_element(PlainTextInput().set_action_id(f"note_{n}")))
+        blocks.append(Input().set_label(f"Priority {n}").add_element(
+            StaticSelectMenu().set_action_id(f"priority_{n}").set_options(options)))
+        blocks.append(Context().add_elements(Text().set_text(f"Updated {n} minutes ago")))
+        blocks.append(Divider() if n % 2 else Actions().add_elements(
+            Button().set_label("Approve").set_action_id(f"approve_{n}").primary(),
+            Button().set_label("Reject").set_action_id(f"reject_{n}").danger()))
+    return Modal().set_title("Review").set_submit_label("Save").add_blocks(*blocks)
+
+
+def per_call(number, func, *args):
+    start = time.perf_counter()
+    for _ in range(number):
+        func(*args)
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    modal = build_large_modal()
+    view = modal.view
+    assert len(view["blocks"]) == 100 and validate(view) == [], validate(view)
+
+    print(f"100-block modal, microseconds per call averaged over {args.number} calls")
+    print(f"  render view    {per_call(args.number, lambda: modal.view):9.1f}")
+    print(f"  encode view    {per_call(args.number, dumps, view):9.1f}")
+    print(f"  validate view  {per_call(args.number, validate, view):9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Times reading every field of a 100-input view_submission payload: by walking state.values by hand to find each
+action_id, with ViewState alone, and with ViewState and the StateSchema of the modal.
+
+    python -m benchmarks.view_state [--number 1000]
+"""
+import argparse
+import time
+from datetime import date
+
+from pyblock_builder.blocks import Input
+from pyblock_builder.elements import DatePicker, PlainTextInput
+from pyblock_builder.surfaces import Modal, ViewState
+
+FIELDS = 100
+
+
+def build_modal():
+    blocks = []
+    for n in range(FIELDS):
+        element = DatePicker() if n % 2 else PlainTextInput()
+        blocks.append(Input().set_block_id(f"b{n}").set_label(f"Field {n}").add_element(element.set_action_id(f"f{n}")))
+    return Modal().set_title("Survey").set_submit_label("Send").add_blocks(*blocks)
+
+
+def build_payload():
+    values = {}
+    for n in range(FIELDS):
+        if n % 2:
+            values[f"b{n}"] = {f"f{n}": {"type": "datepicker", "selected_date": "2024-05-01"}}
+        else:
+            values[f"b{n}"] = {f"f{n}": {"type": "plain_text_input", "value": f"answer {n}"}}
+    return {"type": "view_submission", "view": {"state": {"values": values}}}
+
+
+def by_hand(payload, schema):
+    values = payload["view"]["state"]["values"]
+    result = {}
+    for n in range(FIELDS):
+        action_id = f"f{n}"
+        for actions in values.values():
+            if action_id in actions:
+                state = actions[action_id]
+                if state["type"] == "datepicker":
+                    result[action_id] = date.fromisoformat(state["selected_date"])
+                else:
+                    result[action_id] = state["value"]
+                break
+    return result
+
+
+def with_view_state(payload, schema):
+    state = ViewState.from_payload(payload, schema)
+    return {f"f{n}": state[f"f{n}"] for n in range(FIELDS)}
+
+
+def per_call(number, func, *args):
+    start = time.perf_counter()
+    for _ in range(number):
+        func(*args)
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    payload = build_payload()
+    schema = build_modal().state_schema()
+    assert by_hand(payload, None) == with_view_state(payload, None) == with_view_state(payload, schema)
+
+    print(f"reading {FIELDS} fields, microseconds per payload averaged over {args.number} payloads")
+    print(f"  walking state.values by hand  {per_call(args.number, by_hand, payload, None):9.1f}")
+    print(f"  ViewState                     {per_call(args.number, with_view_state, payload, None):9.1f}")
+    print(f"  ViewState with StateSchema    {per_call(args.number, with_view_state, payload, schema):9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Compares building a long report with nested md helper calls against MrkdwnWriter, both ending with the report cut
+into chunks of at most 3000 characters for Section blocks, for time and for the peak memory used while building.
+
+Each row of the report is a bullet with a bold service name, a link to its dashboard and an inline code status,
+under a quoted summary. The writer is measured writing each row as five fragments with its own methods, and as one
+fragment composed with the helpers.
+
+    python -m benchmarks.writer [--rows 5000] [--number 20]
+"""
+import argparse
+import timeit
+import tracemalloc
+
+from pyblock_builder.mrkdwn import MrkdwnWriter, md
+
+
+def per_call(number, func, *args):
+    return timeit.timeit(lambda: func(*args), number=number) * 1_000_000 / number
+
+
+def nested(rows):
+    items = [f"{md.bold(f'service-{i}')} {md.link(f'https://grafana.example.com/d/{i}', 'dashboard')} "
+             f"{md.inline_code('healthy' if i % 7 else 'degraded')}" for i in range(rows)]
+    report = md.blockquote(f"{md.bold('Weekly health')}\n{rows} services checked") + "\n" + md.bullet_list(items)
+    # Cut at line ends into chunks that fit in a Section, as callers of the helpers have to
+    chunks, lines, length = [], [], 0
+    for line in report.split("\n"):
+        if length + len(line) + 1 > 3000 and lines:
+            chunks.append("\n".join(lines))
+            lines, length = [], 0
+        lines.append(line)
+        length += len(line) + 1
+    chunks.append("\n".join(lines))
+    return chunks
+
+
+def written(rows):
+    writer = MrkdwnWriter()
+    writer.blockquote("*Weekly health*").blockquote(f"{rows} services checked")
+    for i in range(rows):
+        (writer.bullet().bold(f"service-{i}").text(" ").link(f"https://grafana.example.com/d/{i}", "dashboard")
+         .text(" ").inline_code("healthy" if i % 7 else "degraded"))
+    return list(writer.chunks())
+
+
+def written_rows(rows):
+    writer = MrkdwnWriter()
+    writer.blockquote("*Weekly health*").blockquote(f"{rows} services checked")
+    for i in range(rows):
+        writer.bullet().markup(f"{md.bold(f'service-{i}')} "
+                               f"{md.link(f'https://grafana.example.com/d/{i}', 'dashboard')} "
+                               f"{md.inline_code('healthy' if i % 7 else 'degraded')}")
+    return list(writer.chunks())
+
+
+def peak_memory(func, *args):
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    chunks = written(args.rows)
+    print(f"{args.rows} rows in {len(chunks)} chunks, longest {max(map(len, chunks))} characters")
+    for name, build in (("nested helpers", nested), ("MrkdwnWriter methods", written),
+                        ("MrkdwnWriter rows", written_rows)):
+        print(f"  {name:22} {per_call(args.number, build, args.rows) / 1000:8.2f} ms "
+              f"{peak_memory(build, args.rows) / 1024:8.0f} KiB peak")
+
+
+if __name__ == "__main__":
+    main()
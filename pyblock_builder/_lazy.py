@@ -0,0 +1,28 @@
+import sys
+
+
+def lazy_module(name: str, exports: dict):
+    """
+    Builds the module-level __getattr__ and __dir__ (PEP 562) of a package whose names are imported from its
+    submodules only when first accessed. Importing a package then costs nothing for the submodules that are not
+    used, keeping cold-start time low. A name is stored in the package once imported, so later lookups skip
+    __getattr__.
+    :param name: String; the __name__ of the package
+    :param exports: Dict of each exported name to the relative name of the submodule defining it, i.e. ".button"
+    :return: Tuple of the __getattr__ and __dir__ functions
+    """
+    namespace = sys.modules[name].__dict__
+
+    def __getattr__(attribute):
+        module = exports.get(attribute)
+        if module is None:
+            raise AttributeError(f"module {name!r} has no attribute {attribute!r}")
+        from importlib import import_module
+        value = getattr(import_module(module, name), attribute)
+        namespace[attribute] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,9 +1,29 @@
-from .actions import Actions
-from .divider import Divider
-from .context import Context
-from .file import File
-from .header import Header
-from .image import Image
-from .input import Input
-from .section import Section
-from .video import Video
\ No newline at end of file
+from pyblock_builder import _lazy
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .actions import Actions
+    from .divider import Divider
+    from .context import Context
+    from .file import File
+    from .header import Header
+    from .image import Image
+    from .input import Input
+    from .section import Section
+    from .video import Video
+
+_EXPORTS = {
+    "Actions": ".actions",
+    "Divider": ".divider",
+    "Context": ".context",
+    "File": ".file",
+    "Header": ".header",
+    "Image": ".image",
+    "Input": ".input",
+    "Section": ".section",
+    "Video": ".video",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = _lazy.lazy_module(__name__, _EXPORTS)
@@ -1,22 +1,34 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
 
 class Context:
     """
     A Python class representing a Context block from the Slack BlockKit UI framework\n
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_type", "_block_id", "_elements")
+
     def __init__(self):
         self._type = "context"
-        self._block_id = ""
+        self._block_id = None
         self._elements = []
-        self.block = {
+
+    @property
+    def block(self) -> dict:
+        """
+        The block as a Slack API dict, built from the current attributes
+        """
+        block = {
             "type": self._type,
-            "elements": self._elements
+            "elements": [element.json for element in self._elements]
         }
+        if self._block_id is not None:
+            block["block_id"] = self._block_id
+        return block
 
     def set_block_id(self, block_id: str) -> Self:
         """
@@ -26,7 +38,6 @@ class Context:
         :return: self
         """
         self._block_id = block_id
-        self.block["block_id"] = self._block_id
         return self
 
     def add_elements(self, *elements) -> Self:
@@ -36,6 +47,21 @@ class Context:
         :return: self
         """
         for element in elements:
-            self._elements.append(element.json)
-        self.block["elements"] = self._elements
+            self._elements.append(element)
         return self
+
+    def freeze(self) -> Frozen:
+        """
+        Encodes the block to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.block)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the block to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.block)
@@ -1,23 +1,37 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
 
 class File:
     """
     A Python class representing a File block from the Slack BlockKit UI framework\n
     Works on: Message
     """
+    __slots__ = ("_type", "_block_id", "_external_id", "_source")
+
     def __init__(self):
         self._type = "file"
-        self._block_id = ""
-        self._external_id = ""
+        self._block_id = None
+        self._external_id = None
         self._source = "remote"
-        self.block = {
+
+    @property
+    def block(self) -> dict:
+        """
+        The block as a Slack API dict, built from the current attributes
+        """
+        block = {
             "type": self._type,
             "source": self._source
         }
+        if self._block_id is not None:
+            block["block_id"] = self._block_id
+        if self._external_id is not None:
+            block["external_id"] = self._external_id
+        return block
 
     def set_block_id(self, block_id: str) -> Self:
         """
@@ -27,7 +41,6 @@ class File:
         :return: self
         """
         self._block_id = block_id
-        self.block["block_id"] = self._block_id
         return self
 
     def set_external_id(self, external_id: str) -> Self:
@@ -37,7 +50,6 @@ class File:
         :return: self
         """
         self._external_id = external_id
-        self.block["external_id"] = self._external_id
         return self
 
     def set_source(self, source: str) -> Self:
@@ -47,5 +59,20 @@ class File:
         :return: self
         """
         self._source = source
-        self.block["source"] = self._source
         return self
+
+    def freeze(self) -> Frozen:
+        """
+        Encodes the block to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.block)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the block to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.block)
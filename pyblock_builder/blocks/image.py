@@ -1,8 +1,9 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
 from pyblock_builder.objects.text import Text
 
 
@@ -11,15 +12,32 @@ class Image:
     A Python class representing an Image block from the Slack BlockKit UI framework\n
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_type", "_block_id", "_image_url", "_alt_text", "_title")
+
     def __init__(self):
         self._type = "image"
-        self._block_id = ""
-        self._image_url = ""
-        self._alt_text = ""
+        self._block_id = None
+        self._image_url = None
+        self._alt_text = None
         self._title = None
-        self.block = {
+
+    @property
+    def block(self) -> dict:
+        """
+        The block as a Slack API dict, built from the current attributes
+        """
+        block = {
             "type": self._type
         }
+        if self._block_id is not None:
+            block["block_id"] = self._block_id
+        if self._image_url is not None:
+            block["image_url"] = self._image_url
+        if self._alt_text is not None:
+            block["alt_text"] = self._alt_text
+        if self._title is not None:
+            block["title"] = self._title.json
+        return block
 
     def set_block_id(self, block_id: str) -> Self:
         """
@@ -29,7 +47,6 @@ class Image:
         :return: self
         """
         self._block_id = block_id
-        self.block["block_id"] = self._block_id
         return self
 
     def set_image_url(self, url: str) -> Self:
@@ -39,7 +56,6 @@ class Image:
         :return: self
         """
         self._image_url = url
-        self.block["image_url"] = self._image_url
         return self
 
     def set_alt_text(self, alt_text: str) -> Self:
@@ -49,7 +65,6 @@ class Image:
         :return: self
         """
         self._alt_text = alt_text
-        self.block["alt_text"] = self._alt_text
         return self
 
     def set_title(self, title_text: str) -> Self:
@@ -59,6 +74,20 @@ class Image:
         :return: self
         """
         self._title = Text().set_text(title_text)
-        self.block["title"] = self._title.json
         return self
 
+    def freeze(self) -> Frozen:
+        """
+        Encodes the block to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.block)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the block to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.block)
@@ -1,9 +1,10 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
-from pyblock_builder.objects.text import Text
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
+from pyblock_builder.objects.text import label
 
 
 class Input:
@@ -11,17 +12,38 @@ class Input:
     A Python class representing an Input block from the Slack BlockKit UI framework\n
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_type", "_block_id", "_label", "_element", "_dispatch_action", "_hint", "_optional")
+
     def __init__(self):
         self._type = "input"
-        self._block_id = ""
-        self._label = ""
-        self._element = {}
-        self._dispatch_action = False
+        self._block_id = None
+        self._label = None
+        self._element = None
+        self._dispatch_action = None
         self._hint = None
-        self._optional = False
-        self.block = {
+        self._optional = None
+
+    @property
+    def block(self) -> dict:
+        """
+        The block as a Slack API dict, built from the current attributes
+        """
+        block = {
             "type": self._type
         }
+        if self._block_id is not None:
+            block["block_id"] = self._block_id
+        if self._label is not None:
+            block["label"] = self._label.json
+        if self._element is not None:
+            block["element"] = self._element.json
+        if self._dispatch_action is not None:
+            block["dispatch_action"] = self._dispatch_action
+        if self._hint is not None:
+            block["hint"] = self._hint.json
+        if self._optional is not None:
+            block["optional"] = self._optional
+        return block
 
     def set_block_id(self, block_id: str) -> Self:
         """
@@ -31,7 +53,6 @@ class Input:
         :return: self
         """
         self._block_id = block_id
-        self.block["block_id"] = self._block_id
         return self
 
     def set_label(self, label_text: str) -> Self:
@@ -40,8 +61,7 @@ class Input:
         :param label_text: String; max 2,000 chars
         :return: self
         """
-        self._label = Text().set_text(label_text)
-        self.block["label"] = self._label.json
+        self._label = label(label_text)
         return self
 
     def add_element(self, element) -> Self:
@@ -50,8 +70,7 @@ class Input:
         :param element: A PlainTextInput, Checkboxes, RadioButtons, SelectMenu, MultiSelectMenu, or DatePicker element
         :return: self
         """
-        self._element = element.json
-        self.block["element"] = self._element
+        self._element = element
         return self
 
     def set_dispatch_action(self, value: bool) -> Self:
@@ -61,7 +80,6 @@ class Input:
         :return: self
         """
         self._dispatch_action = value
-        self.block["dispatch_action"] = self._dispatch_action
         return self
 
     def set_hint(self, hint_text: str) -> Self:
@@ -70,8 +88,7 @@ class Input:
         :param hint_text: String; max 2,000 chars
         :return: self
         """
-        self._hint = Text().set_text(hint_text)
-        self.block["hint"] = self._hint.json
+        self._hint = label(hint_text)
         return self
 
     def set_optional(self, value: bool) -> Self:
@@ -81,6 +98,20 @@ class Input:
         :return: self
         """
         self._optional = value
-        self.block["optional"] = self._optional
         return self
 
+    def freeze(self) -> Frozen:
+        """
+        Encodes the block to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.block)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the block to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.block)
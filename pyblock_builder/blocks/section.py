@@ -1,8 +1,9 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
 from pyblock_builder.objects.text import Text
 
 
@@ -11,15 +12,32 @@ class Section:
     A Python class representing a Section block from the Slack BlockKit UI framework\n
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_type", "_block_id", "_text", "_fields", "_accessory")
+
     def __init__(self):
         self._type = "section"
-        self._block_id = ""
-        self._text = ""
+        self._block_id = None
+        self._text = None
         self._fields = None
         self._accessory = None
-        self.block = {
+
+    @property
+    def block(self) -> dict:
+        """
+        The block as a Slack API dict, built from the current attributes
+        """
+        block = {
             "type": self._type
         }
+        if self._block_id is not None:
+            block["block_id"] = self._block_id
+        if self._text is not None:
+            block["text"] = self._text.json
+        if self._fields is not None:
+            block["fields"] = self._fields.fields
+        if self._accessory is not None:
+            block["accessory"] = self._accessory.json
+        return block
 
     def set_block_id(self, block_id: str) -> Self:
         """
@@ -29,7 +47,6 @@ class Section:
         :return: self
         """
         self._block_id = block_id
-        self.block["block_id"] = self._block_id
         return self
 
     def set_text(self, text, mrkdwn=True) -> Self:
@@ -52,7 +69,6 @@ class Section:
                     self._text = text.as_mrkdwn()
             else:
                 self._text = Text().set_text(text).as_mrkdwn()
-        self.block["text"] = self._text.json
         return self
 
     def set_fields(self, fields_obj) -> Self:
@@ -62,8 +78,7 @@ class Section:
         :param fields_obj: Fields object; max number of fields is 10, max chars per field is 2,000
         :return: self
         """
-        self._fields = fields_obj.fields
-        self.block["fields"] = self._fields
+        self._fields = fields_obj
         return self
 
     def add_accessory(self, accessory) -> Self:
@@ -73,5 +88,20 @@ class Section:
         :return: Nothing
         """
         self._accessory = accessory
-        self.block["accessory"] = self._accessory.json
         return self
+
+    def freeze(self) -> Frozen:
+        """
+        Encodes the block to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.block)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the block to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.block)
@@ -1,8 +1,9 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
 from pyblock_builder.objects.text import Text
 
 
@@ -11,21 +12,50 @@ class Video:
     A Python class representing a Video block from the Slack BlockKit UI framework\n
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_type", "_block_id", "_alt_text", "_author_name", "_description", "_provider_icon_url", "_provider_name", "_title", "_title_url", "_thumbnail_url", "_video_url")
+
     def __init__(self):
         self._type = 'video'
-        self._block_id = ""
-        self._alt_text = ""
-        self._author_name = ""
+        self._block_id = None
+        self._alt_text = None
+        self._author_name = None
         self._description = None
-        self._provider_icon_url = ""
-        self._provider_name = ""
+        self._provider_icon_url = None
+        self._provider_name = None
         self._title = None
-        self._title_url = ""
-        self._thumbnail_url = ""
-        self._video_url = ""
-        self.block = {
-            "type": self.type,
+        self._title_url = None
+        self._thumbnail_url = None
+        self._video_url = None
+
+    @property
+    def block(self) -> dict:
+        """
+        The block as a Slack API dict, built from the current attributes
+        """
+        block = {
+            "type": self._type
         }
+        if self._block_id is not None:
+            block["block_id"] = self._block_id
+        if self._alt_text is not None:
+            block["alt_text"] = self._alt_text
+        if self._author_name is not None:
+            block["author_name"] = self._author_name
+        if self._description is not None:
+            block["description"] = self._description.json
+        if self._provider_icon_url is not None:
+            block["provider_icon_url"] = self._provider_icon_url
+        if self._provider_name is not None:
+            block["provider_name"] = self._provider_name
+        if self._title is not None:
+            block["title"] = self._title.json
+        if self._title_url is not None:
+            block["title_url"] = self._title_url
+        if self._thumbnail_url is not None:
+            block["thumbnail_url"] = self._thumbnail_url
+        if self._video_url is not None:
+            block["video_url"] = self._video_url
+        return block
 
     def set_block_id(self, block_id: str) -> Self:
         """
@@ -35,7 +65,6 @@ class Video:
         :return: self
         """
         self._block_id = block_id
-        self.block["block_id"] = self._block_id
         return self
 
     def set_alt_text(self, alt_text: str) -> Self:
@@ -45,7 +74,6 @@ class Video:
         :return: self
         """
         self._alt_text = alt_text
-        self.block["alt_text"] = self._alt_text
         return self
 
     def set_author_name(self, author_name: str) -> Self:
@@ -55,7 +83,6 @@ class Video:
         :return: self
         """
         self._author_name = author_name
-        self.block["author_name"] = self._author_name
         return self
 
     def set_description(self, descriptive_text: str) -> Self:
@@ -65,7 +92,6 @@ class Video:
         :return: self
         """
         self._description = Text().set_text(descriptive_text)
-        self.block["description"] = self._description.json
         return self
 
     def set_provider_icon_url(self, provider_icon_url: str) -> Self:
@@ -75,7 +101,6 @@ class Video:
         :return: self
         """
         self._provider_icon_url = provider_icon_url
-        self.block["provider_icon_url"] = self._provider_icon_url
         return self
 
     def set_provider_name(self, provider_name: str) -> Self:
@@ -85,7 +110,6 @@ class Video:
         :return: self
         """
         self._provider_name = provider_name
-        self.block["provider_name"] = self._provider_name
         return self
 
     def set_title(self, title_text: str) -> Self:
@@ -95,7 +119,6 @@ class Video:
         :return: self
         """
         self._title = Text().set_text(title_text)
-        self.block["title"] = self._title.json
         return self
 
     def set_title_url(self, title_url: str) -> Self:
@@ -106,7 +129,6 @@ class Video:
         :return: self
         """
         self._title_url = title_url
-        self.block["title_url"] = self._title_url
         return self
 
     def set_thumbnail_url(self, thumbnail_url: str) -> Self:
@@ -116,7 +138,6 @@ class Video:
         :return: self
         """
         self._thumbnail_url = thumbnail_url
-        self.block["thumbnail_url"] = self._thumbnail_url
         return self
 
     def set_video_url(self, video_url: str) -> Self:
@@ -127,5 +148,20 @@ class Video:
         :return: self
         """
         self._video_url = video_url
-        self.block["video_url"] = self._video_url
         return self
+
+    def freeze(self) -> Frozen:
+        """
+        Encodes the block to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.block)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the block to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.block)
@@ -0,0 +1,21 @@
+from pyblock_builder import _lazy
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .rate_limit import RateLimiter, TokenBucket
+    from .retry import RetryPolicy
+    from .dedupe import UpdateDeduplicator
+    from .dispatch import send, send_async
+
+_EXPORTS = {
+    "RateLimiter": ".rate_limit",
+    "TokenBucket": ".rate_limit",
+    "RetryPolicy": ".retry",
+    "UpdateDeduplicator": ".dedupe",
+    "send": ".dispatch",
+    "send_async": ".dispatch",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = _lazy.lazy_module(__name__, _EXPORTS)
@@ -0,0 +1,67 @@
+import threading
+
+
+class UpdateDeduplicator:
+    """
+    A bounded LRU of the fingerprint of the last payload sent for each (channel, ts) message. Used by
+    Message.suppress_unchanged_updates() to skip chat.update calls that would not change anything. One instance may be
+    shared by many Message objects, i.e. when a status message is rebuilt from scratch on every refresh.
+    """
+    def __init__(self, max_entries: int = 1024):
+        """
+        :param max_entries: (Optional) Integer; number of messages to remember before evicting the least recently
+        updated; defaults to 1024
+        """
+        self._max_entries = max_entries
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+        self._counters = {
+            "sent": 0,
+            "suppressed": 0,
+            "evicted": 0,
+        }
+
+    @property
+    def counters(self) -> dict:
+        """
+        A snapshot of the counters: sent, suppressed and evicted.
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def is_unchanged(self, key: tuple, fingerprint: bytes) -> bool:
+        """
+        Checks whether the fingerprint matches the last one recorded for the message, counting a suppressed update
+        if it does.
+        :param key: Tuple of (channel, ts)
+        :param fingerprint: Bytes; from Message.fingerprint()
+        :return: bool
+        """
+        with self._lock:
+            if self._fingerprints.get(key) == fingerprint:
+                self._fingerprints[key] = self._fingerprints.pop(key)
+                self._counters["suppressed"] += 1
+                return True
+            return False
+
+    def record(self, key: tuple, fingerprint: bytes):
+        """
+        Records the fingerprint of a payload that was sent for the message.
+        :param key: Tuple of (channel, ts)
+        :param fingerprint: Bytes; from Message.fingerprint()
+        """
+        with self._lock:
+            self._fingerprints.pop(key, None)
+            self._fingerprints[key] = fingerprint
+            self._counters["sent"] += 1
+            while len(self._fingerprints) > self._max_entries:
+                del self._fingerprints[next(iter(self._fingerprints))]
+                self._counters["evicted"] += 1
+
+    def forget(self, key: tuple):
+        """
+        Drops the fingerprint recorded for the message, i.e. after it has been deleted.
+        :param key: Tuple of (channel, ts)
+        """
+        with self._lock:
+            self._fingerprints.pop(key, None)
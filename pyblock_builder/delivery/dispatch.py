@@ -0,0 +1,52 @@
+def api_method_name(client_method: str) -> str:
+    """
+    Converts the name of a Slack client method into its Web API method name, i.e. chat_postMessage to chat.postMessage
+    :param client_method: String
+    :return: str
+    """
+    return client_method.replace("_", ".")
+
+
+def send(slack_client, client_method: str, kwargs: dict, rate_limiter=None, retry_policy=None):
+    """
+    Calls a Web API method through the Slack client, waiting on the rate limiter before each attempt and retrying
+    according to the retry policy, if given.
+    :param slack_client: an instance of the Slack Bolt for Python's app.client
+    :param client_method: String; name of the client method, i.e. "chat_postMessage"
+    :param kwargs: Arguments for the Web API method
+    :param rate_limiter: (Optional) RateLimiter
+    :param retry_policy: (Optional) RetryPolicy
+    :return: Slack API response
+    """
+    method = getattr(slack_client, client_method)
+
+    def attempt():
+        if rate_limiter is not None:
+            rate_limiter.acquire(api_method_name(client_method), kwargs.get("channel"))
+        return method(**kwargs)
+
+    if retry_policy is None:
+        return attempt()
+    return retry_policy.run(attempt)
+
+
+async def send_async(slack_client, client_method: str, kwargs: dict, rate_limiter=None, retry_policy=None):
+    """
+    Awaitable version of send() for AsyncWebClient-style clients.
+    :param slack_client: an instance of the Slack Bolt for Python's AsyncApp.client (or any AsyncWebClient)
+    :param client_method: String; name of the client method, i.e. "chat_postMessage"
+    :param kwargs: Arguments for the Web API method
+    :param rate_limiter: (Optional) RateLimiter
+    :param retry_policy: (Optional) RetryPolicy
+    :return: Slack API response
+    """
+    method = getattr(slack_client, client_method)
+
+    async def attempt():
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async(api_method_name(client_method), kwargs.get("channel"))
+        return await method(**kwargs)
+
+    if retry_policy is None:
+        return await attempt()
+    return await retry_policy.run_async(attempt)
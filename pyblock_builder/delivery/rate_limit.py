@@ -0,0 +1,218 @@
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing_extensions import Self
+import threading
+import time
+
+# Requests per minute allowed by each of Slack's Web API rate limit tiers
+TIER_LIMITS = {
+    1: 1,
+    2: 20,
+    3: 50,
+    4: 100,
+}
+
+# Rate limit tier of each Web API method called by the surfaces. chat.postMessage has no tier: Slack limits it per
+# channel, which the per-channel buckets pace, with a workspace-wide cap that can be set with set_workspace_limit()
+METHOD_TIERS = {
+    "chat.postEphemeral": 4,
+    "chat.scheduleMessage": 3,
+    "chat.scheduledMessages.list": 3,
+    "chat.update": 3,
+    "chat.delete": 3,
+    "views.open": 4,
+    "views.update": 4,
+    "views.push": 4,
+    "views.publish": 4,
+}
+
+# Web API methods limited to one message per second per channel
+PER_CHANNEL_METHODS = ("chat.postMessage",)
+
+# Number of channel buckets kept before refilled ones are dropped; the threshold doubles if most are still in use
+CHANNEL_SWEEP_SIZE = 256
+
+
+class TokenBucket:
+    """
+    A token bucket refilled continuously at a fixed rate, used by RateLimiter to pace requests
+    """
+    def __init__(self, rate: float, capacity: float, clock):
+        """
+        :param rate: Float; tokens added per second
+        :param capacity: Float; maximum number of tokens the bucket holds, i.e. the largest allowed burst
+        :param clock: Callable returning the current time in seconds
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+
+    def reserve(self) -> float:
+        """
+        Takes one token from the bucket, going into debt if it is empty.
+        :return: Number of seconds to wait before the token may be used
+        """
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+    def is_full(self) -> bool:
+        """
+        Checks whether the bucket has refilled, in which case it behaves the same as a new bucket.
+        :return: bool
+        """
+        return self._tokens + (self._clock() - self._updated) * self.rate >= self.capacity
+
+
+class RateLimiter:
+    """
+    A client-side rate limiter keyed by Web API method and Slack rate limit tier, with per-channel buckets for the
+    chat.postMessage limit of one message per second per channel and an optional workspace-wide cap on
+    chat.postMessage. Pass it to a surface with set_rate_limiter() to pace its delivery methods.\n
+    Any object with acquire(method, channel=None) and an awaitable acquire_async(method, channel=None) can be used in
+    its place.
+    """
+    def __init__(self, clock=time.monotonic, sleep=time.sleep, async_sleep=None):
+        """
+        :param clock: (Optional) Callable returning the current time in seconds; defaults to time.monotonic
+        :param sleep: (Optional) Callable used to wait in acquire(); defaults to time.sleep
+        :param async_sleep: (Optional) Awaitable callable used to wait in acquire_async(); defaults to asyncio.sleep
+        """
+        self._clock = clock
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+        self._tier_limits = dict(TIER_LIMITS)
+        self._method_tiers = dict(METHOD_TIERS)
+        self._burst = {}
+        self._per_channel = True
+        self._channel_rate = 1.0
+        self._workspace_bucket = None
+        self._method_buckets = {}
+        self._channel_buckets = {}
+        self._sweep_size = CHANNEL_SWEEP_SIZE
+        self._lock = threading.Lock()
+
+    def set_tier_limit(self, tier: int, requests_per_minute: float, burst: float = None) -> Self:
+        """
+        (Optional) Overrides the number of requests per minute allowed for a tier.
+        :param tier: Integer; 1 through 4
+        :param requests_per_minute: Float
+        :param burst: (Optional) Float; number of requests that may be sent back-to-back. Defaults to a tenth of a
+        minute's allowance.
+        :return: self
+        """
+        self._tier_limits[tier] = requests_per_minute
+        if burst is not None:
+            self._burst[tier] = burst
+        self._method_buckets.clear()
+        return self
+
+    def set_method_tier(self, method: str, tier: int) -> Self:
+        """
+        (Optional) Sets the tier of a Web API method not already known to the limiter.
+        :param method: String; Web API method name, i.e. "chat.update"
+        :param tier: Integer; 1 through 4
+        :return: self
+        """
+        self._method_tiers[method] = tier
+        self._method_buckets.pop(method, None)
+        return self
+
+    def set_workspace_limit(self, requests_per_minute: float, burst: float = None) -> Self:
+        """
+        (Optional) Caps the chat.postMessage calls sent to all channels together, which are otherwise only paced per
+        channel.
+        :param requests_per_minute: Float
+        :param burst: (Optional) Float; number of messages that may be sent back-to-back. Defaults to a tenth of a
+        minute's allowance.
+        :return: self
+        """
+        burst = burst if burst is not None else max(1.0, requests_per_minute / 10)
+        self._workspace_bucket = TokenBucket(requests_per_minute / 60, burst, self._clock)
+        return self
+
+    def disable_per_channel_limit(self) -> Self:
+        """
+        (Optional) Stops pacing chat.postMessage to one message per second per channel.
+        :return: self
+        """
+        self._per_channel = False
+        return self
+
+    def _method_bucket(self, method: str) -> TokenBucket | None:
+        bucket = self._method_buckets.get(method)
+        if bucket is None:
+            tier = self._method_tiers.get(method)
+            if tier is None:
+                return None
+            per_minute = self._tier_limits[tier]
+            burst = self._burst.get(tier, max(1.0, per_minute / 10))
+            bucket = self._method_buckets[method] = TokenBucket(per_minute / 60, burst, self._clock)
+        return bucket
+
+    def _channel_bucket(self, channel: str) -> TokenBucket:
+        bucket = self._channel_buckets.get(channel)
+        if bucket is None:
+            if len(self._channel_buckets) >= self._sweep_size:
+                self._sweep_channel_buckets()
+            bucket = self._channel_buckets[channel] = TokenBucket(self._channel_rate, 1, self._clock)
+        return bucket
+
+    def _sweep_channel_buckets(self):
+        # Refilled buckets are dropped, as a new one is created in the same state if the channel is used again
+        self._channel_buckets = {channel: bucket for channel, bucket in self._channel_buckets.items()
+                                 if not bucket.is_full()}
+        self._sweep_size = max(CHANNEL_SWEEP_SIZE, 2 * len(self._channel_buckets))
+
+    def reserve(self, method: str, channel: str = None) -> float:
+        """
+        Reserves a request slot for a Web API method without waiting for it.
+        :param method: String; Web API method name, i.e. "chat.postMessage"
+        :param channel: (Optional) String; the channel the request targets
+        :return: Number of seconds to wait before sending the request
+        """
+        with self._lock:
+            delay = 0.0
+            bucket = self._method_bucket(method)
+            if bucket is not None:
+                delay = bucket.reserve()
+            if method in PER_CHANNEL_METHODS:
+                if channel and self._per_channel:
+                    delay = max(delay, self._channel_bucket(channel).reserve())
+                if self._workspace_bucket is not None:
+                    delay = max(delay, self._workspace_bucket.reserve())
+            return delay
+
+    def acquire(self, method: str, channel: str = None) -> float:
+        """
+        Blocks until a request to the Web API method may be sent.
+        :param method: String; Web API method name, i.e. "chat.postMessage"
+        :param channel: (Optional) String; the channel the request targets
+        :return: Number of seconds waited
+        """
+        delay = self.reserve(method, channel)
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    async def acquire_async(self, method: str, channel: str = None) -> float:
+        """
+        Awaitable version of acquire() that yields to the event loop while waiting.
+        :param method: String; Web API method name, i.e. "chat.postMessage"
+        :param channel: (Optional) String; the channel the request targets
+        :return: Number of seconds waited
+        """
+        delay = self.reserve(method, channel)
+        if delay > 0:
+            if self._async_sleep is None:
+                import asyncio
+                self._async_sleep = asyncio.sleep
+            await self._async_sleep(delay)
+        return delay
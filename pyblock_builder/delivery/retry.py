@@ -0,0 +1,201 @@
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing_extensions import Self
+import random
+import threading
+import time
+
+# HTTP status codes treated as transient server errors
+RETRYABLE_STATUS_CODES = (500, 502, 503, 504)
+
+# Slack API error strings treated as transient
+RETRYABLE_ERRORS = ("internal_error", "fatal_error", "service_unavailable", "request_timeout")
+
+
+class RetryPolicy:
+    """
+    A retry policy for Web API calls made by the surfaces. Calls that fail with a "ratelimited" error wait for the
+    Retry-After interval given by Slack; transient server and connection errors back off exponentially with jitter.
+    Pass it to a surface with set_retry_policy(). One policy may be shared by any number of surfaces, in which case
+    its counters cover all of them.
+    """
+    def __init__(self, sleep=time.sleep, async_sleep=None, rng=random.random):
+        """
+        :param sleep: (Optional) Callable used to wait between attempts; defaults to time.sleep
+        :param async_sleep: (Optional) Awaitable callable used to wait between async attempts; defaults to asyncio.sleep
+        :param rng: (Optional) Callable returning a float in [0, 1) used for jitter; defaults to random.random
+        """
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+        self._rng = rng
+        self._max_attempts = 5
+        self._base_delay = 1.0
+        self._max_delay = 30.0
+        self._max_total_delay = 60.0
+        self._lock = threading.Lock()
+        self._counters = {
+            "calls": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "server_errors": 0,
+            "connection_errors": 0,
+            "gave_up": 0,
+            "retry_delay": 0.0,
+        }
+
+    def set_max_attempts(self, attempts: int) -> Self:
+        """
+        (Optional) Sets the maximum number of attempts per call, including the first. Defaults to 5.
+        :param attempts: Integer; minimum 1
+        :return: self
+        """
+        self._max_attempts = max(1, attempts)
+        return self
+
+    def set_backoff(self, base_delay: float, max_delay: float) -> Self:
+        """
+        (Optional) Sets the exponential backoff used when Slack does not send a Retry-After interval. The n-th retry
+        waits between half and all of base_delay * 2^n seconds, capped at max_delay. Defaults to 1 and 30 seconds.
+        :param base_delay: Float; seconds
+        :param max_delay: Float; seconds
+        :return: self
+        """
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        return self
+
+    def set_max_total_delay(self, seconds: float) -> Self:
+        """
+        (Optional) Caps the total time spent waiting between attempts of a single call. A retry that would go over
+        the cap is not made and the last error is raised instead. Defaults to 60 seconds.
+        :param seconds: Float
+        :return: self
+        """
+        self._max_total_delay = seconds
+        return self
+
+    @property
+    def counters(self) -> dict:
+        """
+        A snapshot of the retry counters: calls, retries, rate_limited, server_errors, connection_errors, gave_up and
+        retry_delay (total seconds waited).
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def reset_counters(self) -> Self:
+        """
+        Resets all retry counters to zero.
+        :return: self
+        """
+        with self._lock:
+            for key in self._counters:
+                self._counters[key] = 0
+        return self
+
+    def _count(self, key: str, amount=1):
+        with self._lock:
+            self._counters[key] += amount
+
+    @staticmethod
+    def classify(error: Exception) -> tuple[str, float | None] | None:
+        """
+        Decides whether a failed call may be retried.
+        :param error: The exception raised by the Slack client
+        :return: None if the error is not retryable, otherwise a tuple of the counter to increment and the Retry-After
+        interval in seconds, if Slack sent one
+        """
+        if isinstance(error, (ConnectionError, TimeoutError)):
+            return "connection_errors", None
+
+        response = getattr(error, "response", None)
+        if response is None:
+            return None
+        status_code = getattr(response, "status_code", None)
+        headers = getattr(response, "headers", None) or {}
+        slack_error = response.get("error") if hasattr(response, "get") else None
+
+        if status_code == 429 or slack_error == "ratelimited":
+            retry_after = headers.get("Retry-After", headers.get("retry-after"))
+            try:
+                retry_after = float(retry_after) if retry_after is not None else None
+            except (TypeError, ValueError):
+                retry_after = None
+            return "rate_limited", retry_after
+        if status_code in RETRYABLE_STATUS_CODES or slack_error in RETRYABLE_ERRORS:
+            return "server_errors", None
+        return None
+
+    def _next_delay(self, error: Exception, retry: int, waited: float) -> float | None:
+        """
+        Works out how long to wait before the next attempt and updates the counters.
+        :param error: The exception raised by the last attempt
+        :param retry: Integer; number of retries already made
+        :param waited: Float; seconds already spent waiting during this call
+        :return: Seconds to wait, or None to give up
+        """
+        kind = self.classify(error)
+        if kind is None:
+            return None
+        counter, retry_after = kind
+        self._count(counter)
+
+        if retry + 1 >= self._max_attempts:
+            self._count("gave_up")
+            return None
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            backoff = min(self._max_delay, self._base_delay * 2 ** retry)
+            delay = backoff / 2 + self._rng() * backoff / 2
+        if waited + delay > self._max_total_delay:
+            self._count("gave_up")
+            return None
+
+        self._count("retries")
+        self._count("retry_delay", delay)
+        return delay
+
+    def run(self, attempt):
+        """
+        Calls attempt() until it succeeds or the policy gives up, in which case the last error is raised.
+        :param attempt: Callable with no arguments that performs the Web API call
+        :return: The return value of attempt()
+        """
+        self._count("calls")
+        waited = 0.0
+        retry = 0
+        while True:
+            try:
+                return attempt()
+            except Exception as e:
+                delay = self._next_delay(e, retry, waited)
+                if delay is None:
+                    raise
+            self._sleep(delay)
+            waited += delay
+            retry += 1
+
+    async def run_async(self, attempt):
+        """
+        Awaitable version of run().
+        :param attempt: Callable with no arguments returning an awaitable that performs the Web API call
+        :return: The result of awaiting attempt()
+        """
+        self._count("calls")
+        waited = 0.0
+        retry = 0
+        while True:
+            try:
+                return await attempt()
+            except Exception as e:
+                delay = self._next_delay(e, retry, waited)
+                if delay is None:
+                    raise
+            if self._async_sleep is None:
+                import asyncio
+                self._async_sleep = asyncio.sleep
+            await self._async_sleep(delay)
+            waited += delay
+            retry += 1
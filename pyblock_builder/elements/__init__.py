@@ -1,14 +1,45 @@
-from .plain_text_input import PlainTextInput
-from .date_picker import DatePicker
-from .datetime_picker import DatetimePicker
-from .select_menu import StaticSelectMenu, ConversationsSelectMenu, ChannelsSelectMenu, UsersSelectMenu
-from .multiselect_menu import MultiStaticSelect, MultiConversationsSelect, MultiChannelsSelect, MultiUsersSelect
-from .button import Button
-from .image import ImageElement
-from .checkboxes import Checkboxes
-from .email_input import EmailInput
-from .number_input import NumberInput
-from .overflow_menu import OverflowMenu
-from .radio_buttons import RadioButtons
-from .time_picker import TimePicker
-from .url_input import UrlInput
\ No newline at end of file
+from pyblock_builder import _lazy
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .plain_text_input import PlainTextInput
+    from .date_picker import DatePicker
+    from .datetime_picker import DatetimePicker
+    from .select_menu import StaticSelectMenu, ConversationsSelectMenu, ChannelsSelectMenu, UsersSelectMenu
+    from .multiselect_menu import MultiStaticSelect, MultiConversationsSelect, MultiChannelsSelect, MultiUsersSelect
+    from .button import Button
+    from .image import ImageElement
+    from .checkboxes import Checkboxes
+    from .email_input import EmailInput
+    from .number_input import NumberInput
+    from .overflow_menu import OverflowMenu
+    from .radio_buttons import RadioButtons
+    from .time_picker import TimePicker
+    from .url_input import UrlInput
+
+_EXPORTS = {
+    "PlainTextInput": ".plain_text_input",
+    "DatePicker": ".date_picker",
+    "DatetimePicker": ".datetime_picker",
+    "StaticSelectMenu": ".select_menu",
+    "ConversationsSelectMenu": ".select_menu",
+    "ChannelsSelectMenu": ".select_menu",
+    "UsersSelectMenu": ".select_menu",
+    "MultiStaticSelect": ".multiselect_menu",
+    "MultiConversationsSelect": ".multiselect_menu",
+    "MultiChannelsSelect": ".multiselect_menu",
+    "MultiUsersSelect": ".multiselect_menu",
+    "Button": ".button",
+    "ImageElement": ".image",
+    "Checkboxes": ".checkboxes",
+    "EmailInput": ".email_input",
+    "NumberInput": ".number_input",
+    "OverflowMenu": ".overflow_menu",
+    "RadioButtons": ".radio_buttons",
+    "TimePicker": ".time_picker",
+    "UrlInput": ".url_input",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = _lazy.lazy_module(__name__, _EXPORTS)
@@ -1,9 +1,10 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
-from pyblock_builder.objects.text import Text
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
+from pyblock_builder.objects.text import label
 
 
 class Button:
@@ -12,21 +13,38 @@ class Button:
     Can be added to: Section, Actions
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_type", "_action_id", "_text", "_url", "_value", "_style", "_confirm", "_accessibility_label")
+
     def __init__(self):
         self._type = "button"
         self._action_id = ""
-        self._text = {}
+        self._text = None
         self._url = None
         self._value = ""
         self._style = None
         self._confirm = None
         self._accessibility_label = None
-        self.json = {
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = {
             "type": self._type,
-            "text": self._text,
+            "text": self._text.json if self._text is not None else {},
             "value": self._value,
             "action_id": self._action_id
         }
+        if self._url is not None:
+            json["url"] = self._url
+        if self._style is not None:
+            json["style"] = self._style
+        if self._confirm is not None:
+            json["confirm"] = self._confirm.json
+        if self._accessibility_label is not None:
+            json["accessibility_label"] = self._accessibility_label
+        return json
 
     def set_action_id(self, action_id: str) -> Self:
         """
@@ -35,7 +53,6 @@ class Button:
         :return: self
         """
         self._action_id = action_id
-        self.json["action_id"] = self._action_id
         return self
 
     def set_label(self, label_text: str) -> Self:
@@ -44,8 +61,7 @@ class Button:
         :param label_text: String; max 75 chars, may truncate from 30 chars
         :return: self
         """
-        self._text = Text().set_text(label_text)
-        self.json["text"] = self._text.json
+        self._text = label(label_text)
         return self
 
     def set_value(self, value: str) -> Self:
@@ -55,7 +71,6 @@ class Button:
         :return: self
         """
         self._value = value
-        self.json["value"] = self._value
         return self
 
     def set_url(self, target_url: str) -> Self:
@@ -65,7 +80,6 @@ class Button:
         :return: self
         """
         self._url = target_url
-        self.json["url"] = self._url
         return self
 
     def set_style(self, style: str) -> Self:
@@ -76,7 +90,6 @@ class Button:
         :return: self
         """
         self._style = style
-        self.json["style"] = self._style
         return self
 
     def primary(self) -> Self:
@@ -85,7 +98,6 @@ class Button:
         :return: self
         """
         self._style = "primary"
-        self.json["style"] = self._style
         return self
 
     def danger(self) -> Self:
@@ -94,7 +106,6 @@ class Button:
         :return: self
         """
         self._style = "danger"
-        self.json["style"] = self._style
         return self
 
     def set_confirm_dialog(self, confirm_dialog) -> Self:
@@ -104,7 +115,6 @@ class Button:
         :return: self
         """
         self._confirm = confirm_dialog
-        self.json["confirm"] = self._confirm.json
         return self
 
     def set_accessibility_label(self, label_text: str) -> Self:
@@ -115,5 +125,20 @@ class Button:
         :return: self
         """
         self._accessibility_label = label_text
-        self.json["accessibility_label"] = self._accessibility_label
         return self
+
+    def freeze(self) -> Frozen:
+        """
+        Encodes the element to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.json)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the element to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.json)
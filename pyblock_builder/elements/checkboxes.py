@@ -1,8 +1,10 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
+from pyblock_builder.objects.option import options_json
 
 class Checkboxes:
     """
@@ -10,6 +12,8 @@ class Checkboxes:
     Can be added to: Section, Actions, Input
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_type", "_action_id", "_options", "_initial_options", "_confirm", "_focus_on_load")
+
     def __init__(self):
         self._type = "checkboxes"
         self._action_id = ""
@@ -17,11 +21,24 @@ class Checkboxes:
         self._initial_options = []
         self._confirm = None
         self._focus_on_load = False
-        self.json = {
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = {
             "type": self._type,
             "action_id": self._action_id,
-            "options": self._options
+            "options": options_json(self._options)
         }
+        if self._initial_options:
+            json["initial_options"] = options_json(self._initial_options)
+        if self._confirm is not None:
+            json["confirm"] = self._confirm.json
+        if self._focus_on_load:
+            json["focus_on_load"] = self._focus_on_load
+        return json
 
     def set_action_id(self, action_id: str) -> Self:
         """
@@ -30,18 +47,16 @@ class Checkboxes:
         :return: self
         """
         self._action_id = action_id
-        self.json["action_id"] = self._action_id
         return self
 
     def set_options(self, *options) -> Self:
         """
         (Required) Sets the options belonging to this specific group
-        :param options: One or more Option objects; maximum of 10 options; preface with * if passing in a list.
+        :param options: One or more Option objects or OptionLists; maximum of 10 options; preface with * if passing in a list.
         :return: self
         """
         for option in options:
-            self._options.append(option.json)
-        self.json["options"] = self._options
+            self._options.append(option)
         return self
 
     def set_confirm_dialog(self, confirm_dialog) -> Self:
@@ -51,19 +66,17 @@ class Checkboxes:
         :return: self
         """
         self._confirm = confirm_dialog
-        self.json["confirm"] = self._confirm.json
         return self
 
     def set_initial_options(self, *options) -> Self:
         """
         (Optional) Sets the options that will be initially selected when the Checkbox group loads. Must contain at
         least one option that exactly matches one of the options in self.options.
-        :param options: One or more Option objects; maximum of 10 options; preface with * if passing in a list.
+        :param options: One or more Option objects or OptionLists; maximum of 10 options; preface with * if passing in a list.
         :return: self
         """
         for option in options:
-            self._initial_options.append(option.json)
-        self.json["initial_options"] = self._initial_options
+            self._initial_options.append(option)
         return self
 
     def focus_on_load(self) -> Self:
@@ -73,5 +86,20 @@ class Checkboxes:
         :return: self
         """
         self._focus_on_load = True
-        self.json["focus_on_load"] = self._focus_on_load
         return self
+
+    def freeze(self) -> Frozen:
+        """
+        Encodes the element to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.json)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the element to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.json)
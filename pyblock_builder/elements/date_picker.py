@@ -1,10 +1,11 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
 from datetime import date, datetime
-from pyblock_builder.objects.text import Text
+from pyblock_builder.objects.text import label
 
 
 class DatePicker:
@@ -13,6 +14,8 @@ class DatePicker:
     Can be added to: Section, Actions, Input
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_type", "_action_id", "_initial_date", "_confirm", "_focus_on_load", "_placeholder")
+
     def __init__(self):
         self._type = "datepicker"
         self._action_id = ""
@@ -20,10 +23,25 @@ class DatePicker:
         self._confirm = None
         self._focus_on_load = False
         self._placeholder = None
-        self.json = {
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = {
             "type": self._type,
             "action_id": self._action_id
         }
+        if self._initial_date is not None:
+            json["initial_date"] = self._initial_date
+        if self._placeholder is not None:
+            json["placeholder"] = self._placeholder.json
+        if self._confirm is not None:
+            json["confirm"] = self._confirm.json
+        if self._focus_on_load:
+            json["focus_on_load"] = self._focus_on_load
+        return json
 
     def set_action_id(self, action_id: str) -> Self:
         """
@@ -32,7 +50,6 @@ class DatePicker:
         :return: self
         """
         self._action_id = action_id
-        self.json["action_id"] = self._action_id
         return self
 
     def set_initial_date(self, initial_date: str | date | datetime) -> Self:
@@ -45,7 +62,6 @@ class DatePicker:
             self._initial_date = initial_date.strftime("%Y-%m-%d")
         else:
             self._initial_date = initial_date
-        self.json["initial_date"] = self._initial_date
         return self
 
     def set_placeholder_text(self, placeholder_text: str) -> Self:
@@ -54,8 +70,7 @@ class DatePicker:
         :param placeholder_text: String; max 150 chars
         :return: self
         """
-        self._placeholder = Text().set_text(placeholder_text)
-        self.json["placeholder"] = self._placeholder.json
+        self._placeholder = label(placeholder_text)
         return self
 
     def set_confirm_dialog(self, confirm_dialog) -> Self:
@@ -65,7 +80,6 @@ class DatePicker:
         :return: self
         """
         self._confirm = confirm_dialog
-        self.json["confirm"] = self._confirm.json
         return self
 
     def focus_on_load(self) -> Self:
@@ -75,5 +89,20 @@ class DatePicker:
         :return: self
         """
         self._focus_on_load = True
-        self.json["focus_on_load"] = self._focus_on_load
         return self
+
+    def freeze(self) -> Frozen:
+        """
+        Encodes the element to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.json)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the element to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.json)
@@ -1,8 +1,9 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
 from datetime import datetime
 
 class DatetimePicker:
@@ -11,16 +12,31 @@ class DatetimePicker:
     Can be added to: Section, Actions, Input
     Works on: Modal, Message
     """
+    __slots__ = ("_type", "_action_id", "_initial_date_time", "_confirm", "_focus_on_load")
+
     def __init__(self):
         self._type = "datetimepicker"
         self._action_id = ""
         self._initial_date_time = None
         self._confirm = None
-        self._focus_on_load = None
-        self.json = {
+        self._focus_on_load = False
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = {
             "type": self._type,
             "action_id": self._action_id
         }
+        if self._initial_date_time is not None:
+            json["initial_date_time"] = self._initial_date_time
+        if self._confirm is not None:
+            json["confirm"] = self._confirm.json
+        if self._focus_on_load:
+            json["focus_on_load"] = self._focus_on_load
+        return json
 
     def set_action_id(self, action_id: str) -> Self:
         """
@@ -29,7 +45,6 @@ class DatetimePicker:
         :return: self
         """
         self._action_id = action_id
-        self.json["action_id"] = self._action_id
         return self
 
     def set_initial_date_time(self, date_time: str | datetime) -> Self:
@@ -42,7 +57,6 @@ class DatetimePicker:
             self._initial_date_time = date_time.timestamp()
         else:
             self._initial_date_time = date_time
-        self.json["initial_date_time"] = self._initial_date_time
         return self
 
     def set_confirm_dialog(self, confirm_dialog) -> Self:
@@ -52,7 +66,6 @@ class DatetimePicker:
         :return: self
         """
         self._confirm = confirm_dialog
-        self.json["confirm"] = self._confirm.json
         return self
 
     def focus_on_load(self) -> Self:
@@ -62,5 +75,20 @@ class DatetimePicker:
         :return: self
         """
         self._focus_on_load = True
-        self.json["focus_on_load"] = self._focus_on_load
-        return self
\ No newline at end of file
+        return self
+
+    def freeze(self) -> Frozen:
+        """
+        Encodes the element to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.json)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the element to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.json)
@@ -1,9 +1,10 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
-from pyblock_builder.objects.text import Text
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
+from pyblock_builder.objects.text import label
 
 
 class EmailInput:
@@ -12,18 +13,33 @@ class EmailInput:
     Can be added to: Input
     Works on: Modals
     """
+    __slots__ = ("_type", "_action_id", "_initial_value", "_dispatch_action_config", "_focus_on_load", "_placeholder")
+
     def __init__(self):
         self._type = "email_text_input"
         self._action_id = ""
-        self._initial_value = ""
+        self._initial_value = None
         self._dispatch_action_config = None
         self._focus_on_load = False
         self._placeholder = None
-        self.json = {
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = {
             "type": self._type,
             "action_id": self._action_id,
             "focus_on_load": self._focus_on_load
         }
+        if self._initial_value is not None:
+            json["initial_value"] = self._initial_value
+        if self._placeholder is not None:
+            json["placeholder"] = self._placeholder.json
+        if self._dispatch_action_config is not None:
+            json["dispatch_action_config"] = self._dispatch_action_config.json
+        return json
 
     def set_action_id(self, action_id: str) -> Self:
         """
@@ -32,7 +48,6 @@ class EmailInput:
         :return: self
         """
         self._action_id = action_id
-        self.json["action_id"] = self._action_id
         return self
 
     def set_initial_value(self, value: str) -> Self:
@@ -42,7 +57,6 @@ class EmailInput:
         :return: self
         """
         self._initial_value = value
-        self.json["initial_value"] = self._initial_value
         return self
 
     def set_placeholder_text(self, placeholder_text: str) -> Self:
@@ -51,8 +65,7 @@ class EmailInput:
         :param placeholder_text: String; max 150 chars
         :return: self
         """
-        self._placeholder = Text().set_text(placeholder_text)
-        self.json["placeholder"] = self._placeholder.json
+        self._placeholder = label(placeholder_text)
         return self
 
     def set_dispatch_action_config(self, config) -> Self:
@@ -62,7 +75,6 @@ class EmailInput:
         :return: self
         """
         self._dispatch_action_config = config
-        self.json["dispatch_action_config"] = self._dispatch_action_config.json
         return self
 
     def focus_on_load(self) -> Self:
@@ -72,5 +84,20 @@ class EmailInput:
         :return: self
         """
         self._focus_on_load = True
-        self.json["focus_on_load"] = self._focus_on_load
         return self
+
+    def freeze(self) -> Frozen:
+        """
+        Encodes the element to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.json)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the element to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.json)
@@ -1,8 +1,9 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
 
 class ImageElement:
     """
@@ -10,11 +11,19 @@ class ImageElement:
     Can be added to: Section, Context
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_type", "_image_url", "_alt_text")
+
     def __init__(self):
         self._type = "image"
         self._image_url = ""
         self._alt_text = ""
-        self.json = {
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        return {
             "type": self._type,
             "image_url": self._image_url,
             "alt_text": self._alt_text
@@ -27,7 +36,6 @@ class ImageElement:
         :return: self
         """
         self._image_url = url
-        self.json["image_url"] = self._image_url
         return self
 
     def set_alt_text(self, alt_text: str) -> Self:
@@ -37,5 +45,20 @@ class ImageElement:
         :return: self
         """
         self._alt_text = alt_text
-        self.json["alt_text"] = self._alt_text
         return self
+
+    def freeze(self) -> Frozen:
+        """
+        Encodes the element to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.json)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the element to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.json)
@@ -1,9 +1,11 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
-from pyblock_builder.objects.text import Text
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
+from pyblock_builder.objects.option import Option, options_json
+from pyblock_builder.objects.text import label
 
 
 class MultiSelectMenu:
@@ -12,6 +14,8 @@ class MultiSelectMenu:
     Can be added to: Section, Actions, Input
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_type", "_action_id", "_confirm", "_max_selected_items", "_focus_on_load", "_placeholder")
+
     def __init__(self):
         self._type = None
         self._action_id = ""
@@ -19,12 +23,29 @@ class MultiSelectMenu:
         self._max_selected_items = None
         self._focus_on_load = False
         self._placeholder = None
-        self.json = {
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = self._always_json()
+        if self._confirm is not None:
+            json["confirm"] = self._confirm.json
+        if self._placeholder is not None:
+            json["placeholder"] = self._placeholder.json
+        if self._max_selected_items is not None:
+            json["max_selected_items"] = self._max_selected_items
+        return json
+
+    def _always_json(self) -> dict:
+        """
+        The keys every menu of this type has whatever was set, which come first in its dict
+        """
+        return {
             "type": self._type,
             "action_id": self._action_id,
-            "focus_on_load": self._focus_on_load,
-            "confirm": None,
-            "placeholder": None
+            "focus_on_load": self._focus_on_load
         }
 
     def set_action_id(self, action_id: str) -> Self:
@@ -34,7 +55,6 @@ class MultiSelectMenu:
         :return: self
         """
         self._action_id = action_id
-        self.json["action_id"] = self._action_id
         return self
 
     def set_max_selected_items(self, num_items: int) -> Self:
@@ -44,7 +64,6 @@ class MultiSelectMenu:
         :return: self
         """
         self._max_selected_items = num_items
-        self.json["max_selected_items"] = self._max_selected_items
         return self
 
     def set_placeholder_text(self, placeholder_text):
@@ -53,8 +72,7 @@ class MultiSelectMenu:
         :param placeholder_text: String; max 150 chars
         :return: Nothing
         """
-        self._placeholder = Text().set_text(placeholder_text)
-        self.json["placeholder"] = self._placeholder.json
+        self._placeholder = label(placeholder_text)
         return self
 
     def set_confirm_dialog(self, confirm_dialog) -> Self:
@@ -64,7 +82,6 @@ class MultiSelectMenu:
         :return: self
         """
         self._confirm = confirm_dialog
-        self.json["confirm"] = self._confirm.json
         return self
 
     def focus_on_load(self) -> Self:
@@ -74,9 +91,24 @@ class MultiSelectMenu:
         :return: self
         """
         self._focus_on_load = True
-        self.json["focus_on_load"] = self._focus_on_load
         return self
 
+    def freeze(self) -> Frozen:
+        """
+        Encodes the element to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.json)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the element to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.json)
+
 
 class MultiStaticSelect(MultiSelectMenu):
     """
@@ -84,27 +116,37 @@ class MultiStaticSelect(MultiSelectMenu):
     Can be added to: Section, Actions, Input
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_options", "_option_groups", "_initial_options")
+
     def __init__(self):
         super().__init__()
         self._type = "multi_static_select"
         self._options = []
         self._option_groups = []
         self._initial_options = []
-        self.json = {
-            "type": self._type,
-            "action_id": self._action_id,
-            "focus_on_load": self._focus_on_load
-        }
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = super().json
+        if self._options:
+            json["options"] = options_json(self._options)
+        if self._option_groups:
+            json["option_groups"] = [option_group.json for option_group in self._option_groups]
+        if self._initial_options:
+            json["initial_options"] = options_json(self._initial_options)
+        return json
 
     def set_options(self, *options) -> Self:
         """
         (Required) Sets the options for selection in this menu
-        :param options: One or more Option objects; maximum of 100 options. Do not set if setting self.option_groups!
+        :param options: One or more Option objects or OptionLists; maximum of 100 options. Do not set if setting self.option_groups!
         :return: self
         """
         for option in options:
-            self._options.append(option.json)
-        self.json["options"] = self._options
+            self._options.append(option)
         return self
 
     def set_option_groups(self, *option_groups) -> Self:
@@ -115,22 +157,31 @@ class MultiStaticSelect(MultiSelectMenu):
         :return: self
         """
         for option_group in option_groups:
-            self._option_groups.append(option_group.json)
-        self.json["option_groups"] = self._option_groups
+            self._option_groups.append(option_group)
         return self
 
     def set_initial_options(self, *options) -> Self:
         """
         (Optional) Sets the options that will be initially selected when the menu loads. Must contain at
         least one option that exactly matches one of the options in self.options or self.option_groups.
-        :param options: One or more Option objects; preface with * if passing in a list
+        :param options: One or more Option objects or OptionLists; preface with * if passing in a list
         :return: self
         """
         for option in options:
-            self._initial_options.append(option.json)
-        self.json["initial_options"] = self._initial_options
+            self._initial_options.append(option)
         return self
 
+    @classmethod
+    def from_columns(cls, texts, values, descriptions=None) -> Self:
+        """
+        Builds the menu with one option per row of parallel columns. See Option.from_columns().
+        :param texts: Sequence or NumPy-style array of Strings; max 75 chars each
+        :param values: Sequence or NumPy-style array of values; max 75 chars each
+        :param descriptions: (Optional) Sequence or NumPy-style array of Strings or None; max 75 chars each
+        :return: a new MultiStaticSelect
+        """
+        return cls().set_options(Option.from_columns(texts, values, descriptions))
+
 
 class MultiUsersSelect(MultiSelectMenu):
     """
@@ -138,15 +189,22 @@ class MultiUsersSelect(MultiSelectMenu):
     Can be added to: Section, Actions, Input
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_initial_users",)
+
     def __init__(self):
         super().__init__()
         self._type = "multi_users_select"
         self._initial_users = []
-        self.json = {
-            "type": self._type,
-            "action_id": self._action_id,
-            "focus_on_load": self._focus_on_load,
-        }
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = super().json
+        if self._initial_users:
+            json["initial_users"] = list(self._initial_users)
+        return json
 
     def set_initial_users(self, user_ids: list) -> Self:
         """
@@ -155,7 +213,6 @@ class MultiUsersSelect(MultiSelectMenu):
         :return: self
         """
         self._initial_users = user_ids
-        self.json["initial_users"] = self._initial_users
         return self
 
 
@@ -165,18 +222,34 @@ class MultiConversationsSelect(MultiSelectMenu):
     Can be added to: Section, Actions, Input
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_initial_conversations", "_default_to_current_conversation", "_filter")
+
     def __init__(self):
         super().__init__()
         self._type = "multi_conversations_select"
         self._initial_conversations = []
         self._default_to_current_conversation = False
         self._filter = None
-        self.json = {
-            "type": self._type,
-            "action_id": self._action_id,
-            "focus_on_load": self._focus_on_load,
-            "default_to_current_conversation": False,
-        }
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = super().json
+        if self._initial_conversations:
+            json["initial_conversations"] = list(self._initial_conversations)
+        if self._filter is not None:
+            json["filter"] = self._filter.json
+        return json
+
+    def _always_json(self) -> dict:
+        """
+        The keys every menu of this type has whatever was set, which come first in its dict
+        """
+        json = super()._always_json()
+        json["default_to_current_conversation"] = self._default_to_current_conversation
+        return json
 
     def set_initial_conversations(self, conversation_ids: list) -> Self:
         """
@@ -185,7 +258,6 @@ class MultiConversationsSelect(MultiSelectMenu):
         :return: self
         """
         self._initial_conversations = conversation_ids
-        self.json["initial_conversations"] = self._initial_conversations
         return self
 
     def default_to_current_conversation(self) -> Self:
@@ -195,7 +267,6 @@ class MultiConversationsSelect(MultiSelectMenu):
         :return: self
         """
         self._default_to_current_conversation = True
-        self.json["default_to_current_conversation"] = self._default_to_current_conversation
         return self
 
     def set_filter(self, filter_obj) -> Self:
@@ -205,7 +276,6 @@ class MultiConversationsSelect(MultiSelectMenu):
         :return: self
         """
         self._filter = filter_obj
-        self.json["filter"] = self._filter
         return self
 
 
@@ -215,15 +285,22 @@ class MultiChannelsSelect(MultiSelectMenu):
     Can be added to: Section, Actions, Input
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_initial_channels",)
+
     def __init__(self):
         super().__init__()
         self._type = "multi_channels_select"
         self._initial_channels = []
-        self.json = {
-            "type": self._type,
-            "action_id": self._action_id,
-            "focus_on_load": self._focus_on_load,
-        }
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = super().json
+        if self._initial_channels:
+            json["initial_channels"] = list(self._initial_channels)
+        return json
 
     def set_initial_channels(self, channel_ids: list) -> Self:
         """
@@ -232,6 +309,4 @@ class MultiChannelsSelect(MultiSelectMenu):
         :return: self
         """
         self._initial_channels = channel_ids
-        self.json["initial_channels"] = self._initial_channels
         return self
-
@@ -1,8 +1,10 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
+from pyblock_builder.objects.option import options_json
 
 class OverflowMenu:
     """
@@ -10,16 +12,27 @@ class OverflowMenu:
     Can be added to: Section, Actions\n
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_type", "_action_id", "_options", "_confirm")
+
     def __init__(self):
         self._type = "overflow"
         self._action_id = ""
         self._options = []
         self._confirm = None
-        self.json = {
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = {
             "type": self._type,
             "action_id": self._action_id,
-            "options": self._options
+            "options": options_json(self._options)
         }
+        if self._confirm is not None:
+            json["confirm"] = self._confirm.json
+        return json
 
     def set_action_id(self, action_id: str) -> Self:
         """
@@ -28,7 +41,6 @@ class OverflowMenu:
         :return: self
         """
         self._action_id = action_id
-        self.json["action_id"] = self._action_id
         return self
 
     def set_confirm_dialog(self, confirm_dialog) -> Self:
@@ -38,16 +50,30 @@ class OverflowMenu:
         :return: self
         """
         self._confirm = confirm_dialog
-        self.json["confirm"] = self._confirm.json
         return self
 
     def set_options(self, *options) -> Self:
         """
         (Required) Sets the options for selection in this menu
-        :param options: One or more Option objects; maximum of 100 options. Preface with * if passing in a list. Do not set if setting self.option_groups!
+        :param options: One or more Option objects or OptionLists; maximum of 100 options. Preface with * if passing in a list. Do not set if setting self.option_groups!
         :return: self
         """
         for option in options:
-            self._options.append(option.json)
-        self.json["options"] = self._options
+            self._options.append(option)
         return self
+
+    def freeze(self) -> Frozen:
+        """
+        Encodes the element to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.json)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the element to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.json)
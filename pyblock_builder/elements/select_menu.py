@@ -1,9 +1,11 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
-from pyblock_builder.objects.text import Text
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
+from pyblock_builder.objects.option import Option, options_json
+from pyblock_builder.objects.text import label
 
 
 class SelectMenu:
@@ -12,18 +14,35 @@ class SelectMenu:
     Can be added to: Section, Actions, Input
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_type", "_action_id", "_confirm", "_focus_on_load", "_placeholder")
+
     def __init__(self):
         self._type = None
         self._action_id = ""
         self._confirm = None
         self._focus_on_load = False
         self._placeholder = None
-        self.json = {
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = self._always_json()
+        if self._confirm is not None:
+            json["confirm"] = self._confirm.json
+        if self._placeholder is not None:
+            json["placeholder"] = self._placeholder.json
+        return json
+
+    def _always_json(self) -> dict:
+        """
+        The keys every menu of this type has whatever was set, which come first in its dict
+        """
+        return {
             "type": self._type,
             "action_id": self._action_id,
-            "focus_on_load": self._focus_on_load,
-            "confirm": None,
-            "placeholder": None
+            "focus_on_load": self._focus_on_load
         }
 
     def set_action_id(self, action_id: str) -> Self:
@@ -33,7 +52,6 @@ class SelectMenu:
         :return: self
         """
         self._action_id = action_id
-        self.json["action_id"] = self._action_id
         return self
 
     def set_placeholder_text(self, placeholder_text: str) -> Self:
@@ -42,8 +60,7 @@ class SelectMenu:
         :param placeholder_text: String; max 150 chars
         :return: self
         """
-        self._placeholder = Text().set_text(placeholder_text)
-        self.json["placeholder"] = self._placeholder.json
+        self._placeholder = label(placeholder_text)
         return self
 
     def set_confirm_dialog(self, confirm_dialog) -> Self:
@@ -53,7 +70,6 @@ class SelectMenu:
         :return: self
         """
         self._confirm = confirm_dialog
-        self.json["confirm"] = self._confirm.json
         return self
 
     def focus_on_load(self) -> Self:
@@ -63,9 +79,24 @@ class SelectMenu:
         :return: self
         """
         self._focus_on_load = True
-        self.json["focus_on_load"] = self._focus_on_load
         return self
 
+    def freeze(self) -> Frozen:
+        """
+        Encodes the element to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.json)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the element to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.json)
+
 
 class StaticSelectMenu(SelectMenu):
     """
@@ -73,27 +104,37 @@ class StaticSelectMenu(SelectMenu):
     Can be added to: Section, Actions, Input
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_options", "_option_groups", "_initial_option")
+
     def __init__(self):
         super().__init__()
         self._type = "static_select"
         self._options = []
         self._option_groups = []
         self._initial_option = None
-        self.json = {
-            "type": self._type,
-            "action_id": self._action_id,
-            "focus_on_load": self._focus_on_load
-        }
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = super().json
+        if self._options:
+            json["options"] = options_json(self._options)
+        if self._option_groups:
+            json["option_groups"] = [option_group.json for option_group in self._option_groups]
+        if self._initial_option is not None:
+            json["initial_option"] = self._initial_option.json
+        return json
 
     def set_options(self, *options) -> Self:
         """
         (Required) Sets the options for selection in this menu
-        :param options: One or more Option objects; maximum of 100 options. Preface with * if passing in a list. Do not set if setting self.option_groups!
+        :param options: One or more Option objects or OptionLists; maximum of 100 options. Preface with * if passing in a list. Do not set if setting self.option_groups!
         :return: self
         """
         for option in options:
-            self._options.append(option.json)
-        self.json["options"] = self._options
+            self._options.append(option)
         return self
 
     def set_option_groups(self, *option_groups) -> Self:
@@ -103,8 +144,7 @@ class StaticSelectMenu(SelectMenu):
         :return: self
         """
         for option_group in option_groups:
-            self._option_groups.append(option_group.json)
-        self.json["option_groups"] = self._option_groups
+            self._option_groups.append(option_group)
         return self
 
     def set_initial_option(self, option) -> Self:
@@ -115,9 +155,19 @@ class StaticSelectMenu(SelectMenu):
         :return: self
         """
         self._initial_option = option
-        self.json["initial_option"] = self._initial_option.json
         return self
 
+    @classmethod
+    def from_columns(cls, texts, values, descriptions=None) -> Self:
+        """
+        Builds the menu with one option per row of parallel columns. See Option.from_columns().
+        :param texts: Sequence or NumPy-style array of Strings; max 75 chars each
+        :param values: Sequence or NumPy-style array of values; max 75 chars each
+        :param descriptions: (Optional) Sequence or NumPy-style array of Strings or None; max 75 chars each
+        :return: a new StaticSelectMenu
+        """
+        return cls().set_options(Option.from_columns(texts, values, descriptions))
+
 
 class UsersSelectMenu(SelectMenu):
     """
@@ -125,15 +175,22 @@ class UsersSelectMenu(SelectMenu):
     Can be added to: Section, Actions, Input
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_initial_user",)
+
     def __init__(self):
         super().__init__()
         self._type = "users_select"
-        self._initial_user = ""
-        self.json = {
-            "type": self._type,
-            "action_id": self._action_id,
-            "focus_on_load": self._focus_on_load
-        }
+        self._initial_user = None
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = super().json
+        if self._initial_user is not None:
+            json["initial_user"] = self._initial_user
+        return json
 
     def set_initial_user(self, user_id: str) -> Self:
         """
@@ -142,7 +199,6 @@ class UsersSelectMenu(SelectMenu):
         :return: self
         """
         self._initial_user = user_id
-        self.json["initial_user"] = self._initial_user
         return self
 
 
@@ -152,20 +208,36 @@ class ConversationsSelectMenu(SelectMenu):
     Can be added to: Section, Actions, Input
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_initial_conversation", "_default_to_current_conversation", "_filter", "_response_url_enabled")
+
     def __init__(self):
         super().__init__()
         self._type = "conversations_select"
-        self._initial_conversation = ""
+        self._initial_conversation = None
         self._default_to_current_conversation = False
         self._filter = None
         self._response_url_enabled = False
-        self.json = {
-            "type": self._type,
-            "action_id": self._action_id,
-            "focus_on_load": self._focus_on_load,
-            "default_to_current_conversation": self._default_to_current_conversation,
-            "response_url_enabled": False,
-        }
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = super().json
+        if self._initial_conversation is not None:
+            json["initial_conversation"] = self._initial_conversation
+        if self._filter is not None:
+            json["filter"] = self._filter.json
+        return json
+
+    def _always_json(self) -> dict:
+        """
+        The keys every menu of this type has whatever was set, which come first in its dict
+        """
+        json = super()._always_json()
+        json["default_to_current_conversation"] = self._default_to_current_conversation
+        json["response_url_enabled"] = self._response_url_enabled
+        return json
 
     def enable_response_url(self) -> Self:
         """
@@ -175,7 +247,6 @@ class ConversationsSelectMenu(SelectMenu):
         :return: self
         """
         self._response_url_enabled = True
-        self.json["response_url_enabled"] = self._response_url_enabled
         return self
 
     def set_initial_conversation(self, conversation_id: str) -> Self:
@@ -186,7 +257,6 @@ class ConversationsSelectMenu(SelectMenu):
         :return: self
         """
         self._initial_conversation = conversation_id
-        self.json["initial_conversation"] = self._initial_conversation
         return self
 
     def default_to_current_conversation(self) -> Self:
@@ -196,7 +266,6 @@ class ConversationsSelectMenu(SelectMenu):
         :return: self
         """
         self._default_to_current_conversation = True
-        self.json["default_to_current_conversation"] = self._default_to_current_conversation
         return self
 
     def set_filter(self, filter_obj) -> Self:
@@ -206,7 +275,6 @@ class ConversationsSelectMenu(SelectMenu):
         :return: self
         """
         self._filter = filter_obj
-        self.json["filter"] = self._filter
         return self
 
 
@@ -216,17 +284,31 @@ class ChannelsSelectMenu(SelectMenu):
     Can be added to: Section, Actions, Input
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_initial_channel", "_response_url_enabled")
+
     def __init__(self):
         super().__init__()
         self._type = "channels_select"
-        self._initial_channel = ""
+        self._initial_channel = None
         self._response_url_enabled = False
-        self.json = {
-            "type": self._type,
-            "action_id": self._action_id,
-            "focus_on_load": self._focus_on_load,
-            "response_url_enabled": False,
-        }
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = super().json
+        if self._initial_channel is not None:
+            json["initial_channel"] = self._initial_channel
+        return json
+
+    def _always_json(self) -> dict:
+        """
+        The keys every menu of this type has whatever was set, which come first in its dict
+        """
+        json = super()._always_json()
+        json["response_url_enabled"] = self._response_url_enabled
+        return json
 
     def set_initial_channel(self, channel_id: str) -> Self:
         """
@@ -235,7 +317,6 @@ class ChannelsSelectMenu(SelectMenu):
         :return: self
         """
         self._initial_channel = channel_id
-        self.json["initial_channel"] = self._initial_channel
         return self
 
     def enable_response_url(self) -> Self:
@@ -246,5 +327,4 @@ class ChannelsSelectMenu(SelectMenu):
         :return: self
         """
         self._response_url_enabled = True
-        self.json["response_url_enabled"] = self._response_url_enabled
         return self
@@ -1,10 +1,11 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
+from pyblock_builder.serialization.encoder import dumps
+from pyblock_builder.serialization.frozen import Frozen
 from datetime import datetime
-from pyblock_builder.objects.text import Text
+from pyblock_builder.objects.text import label
 
 
 class TimePicker:
@@ -13,18 +14,37 @@ class TimePicker:
     Can be added to: Section, Actions
     Works on: Modal, Message, AppHome
     """
+    __slots__ = ("_type", "_action_id", "_initial_time", "_confirm", "_focus_on_load", "_placeholder", "_timezone")
+
     def __init__(self):
         self._type = "timepicker"
         self._action_id = ""
-        self._initial_time = ""
+        self._initial_time = None
         self._confirm = None
         self._focus_on_load = False
         self._placeholder = None
-        self._timezone = ""
-        self.json = {
+        self._timezone = None
+
+    @property
+    def json(self) -> dict:
+        """
+        The element as a Slack API dict, built from the current attributes
+        """
+        json = {
             "type": self._type,
             "action_id": self._action_id
         }
+        if self._initial_time is not None:
+            json["initial_time"] = self._initial_time
+        if self._placeholder is not None:
+            json["placeholder"] = self._placeholder.json
+        if self._confirm is not None:
+            json["confirm"] = self._confirm.json
+        if self._focus_on_load:
+            json["focus_on_load"] = self._focus_on_load
+        if self._timezone is not None:
+            json["timezone"] = self._timezone
+        return json
 
     def set_action_id(self, action_id: str) -> Self:
         """
@@ -33,7 +53,6 @@ class TimePicker:
         :return: self
         """
         self._action_id = action_id
-        self.json["action_id"] = self._action_id
         return self
 
     def set_initial_time(self, time: str | datetime) -> Self:
@@ -45,8 +64,8 @@ class TimePicker:
         """
         if isinstance(time, datetime):
             self._initial_time = time.strftime("%H:%M")
-        self._initial_time = time
-        self.json["initial_time"] = self._initial_time
+        else:
+            self._initial_time = time
         return self
 
     def set_placeholder_text(self, placeholder_text: str) -> Self:
@@ -55,8 +74,7 @@ class TimePicker:
         :param placeholder_text: String; max 150 chars
         :return: self
         """
-        self._placeholder = Text().set_text(placeholder_text)
-        self.json["placeholder"] = self._placeholder.json
+        self._placeholder = label(placeholder_text)
         return self
 
     def set_confirm_dialog(self, confirm_dialog) -> Self:
@@ -66,7 +84,6 @@ class TimePicker:
         :return: self
         """
         self._confirm = confirm_dialog
-        self.json["confirm"] = self._confirm.json
         return self
 
     def focus_on_load(self) -> Self:
@@ -76,7 +93,6 @@ class TimePicker:
         :return: self
         """
         self._focus_on_load = True
-        self.json["focus_on_load"] = self._focus_on_load
         return self
 
     def set_timezone(self, timezone: str) -> Self:
@@ -88,5 +104,20 @@ class TimePicker:
         :return: self
         """
         self._timezone = timezone
-        self.json["timezone"] = self._timezone
         return self
+
+    def freeze(self) -> Frozen:
+        """
+        Encodes the element to JSON once so it can be added to any number of surfaces without being encoded again.
+        Later changes to this object do not affect the frozen copy.
+        :return: Frozen
+        """
+        return Frozen(self.json)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the element to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.json)
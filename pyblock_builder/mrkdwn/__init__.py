@@ -1 +1,20 @@
-from .md import *
\ No newline at end of file
+from pyblock_builder import _lazy
+from .md import *
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .markdown import markdown_to_blocks, markdown_to_mrkdwn
+    from .splitter import split_sections, split_text
+    from .writer import MrkdwnWriter
+
+# The md helpers are imported with the package, the other submodules lazily, so that formatting with md does not load
+# them. There is no __all__, so `import *` only brings in the helpers.
+_EXPORTS = {
+    "markdown_to_blocks": ".markdown",
+    "markdown_to_mrkdwn": ".markdown",
+    "split_sections": ".splitter",
+    "split_text": ".splitter",
+    "MrkdwnWriter": ".writer",
+}
+
+__getattr__, __dir__ = _lazy.lazy_module(__name__, _EXPORTS)
@@ -0,0 +1,414 @@
+from __future__ import annotations
+from pyblock_builder.mrkdwn import md
+from pyblock_builder.mrkdwn.splitter import split_sections
+
+# Longest text of a Header block; a longer heading is written as a bold line in a Section instead
+MAX_HEADER = 150
+# Bullets for each level of a nested list, as Slack's own lists use them
+BULLETS = ("•", "◦", "▪")
+RULE = "---"
+# First characters of a line that may start a heading, rule, code fence, quote or list item; other lines are not
+# matched against the block patterns at all
+BLOCK_START = "#`~>-+*_=0123456789"
+# Characters the inline scan stops at; the text between them is copied as it is
+INLINE_SPECIAL = r"[`!\[<>*_~\\&\n]"
+
+# Compiled on first use, so that importing the package does not import re
+_patterns = None
+
+
+def markdown_to_mrkdwn(text: str) -> str:
+    """
+    Converts CommonMark, e.g. a runbook or an alert description, to Slack mrkdwn in one pass over the text.
+    Headings become bold lines, **bold** and __bold__ become *bold*, *italic* and _italic_ become _italic_,
+    ~~strike~~ becomes ~strike~, [text](url) and <url> become links, nested lists become indented bullets and
+    code blocks and block quotes are written as the md helpers write them. &, < and > in the text are escaped.
+    :param text: String; Markdown
+    :return: String; mrkdwn
+    """
+    parts = []
+    for kind, content in _parse(text.split("\n")):
+        if kind == "heading":
+            parts.append(f"*{md._escape(_inline(content, True))}*")
+        elif kind == "rule":
+            parts.append(RULE)
+        else:
+            parts.append(content)
+    return md._markup("\n\n".join(parts))
+
+
+def markdown_to_blocks(text: str) -> list:
+    """
+    Converts CommonMark to blocks: a Header for each heading, a Divider for each rule, and Sections with the
+    paragraphs, lists, quotes and code blocks between them, converted as markdown_to_mrkdwn() converts them. Text
+    longer than a Section takes is split with split_sections().
+    :param text: String; Markdown
+    :return: List of blocks, to pass to add_blocks() with *
+    """
+    from pyblock_builder.blocks.divider import Divider
+    from pyblock_builder.blocks.header import Header
+
+    blocks = []
+    parts = []
+    for kind, content in _parse(text.split("\n")):
+        if kind == "heading":
+            heading = _inline(content, True)
+            if len(heading) > MAX_HEADER:
+                parts.append(f"*{md._escape(heading)}*")
+                continue
+            if parts:
+                blocks.extend(split_sections("\n\n".join(parts)))
+                parts = []
+            blocks.append(Header().set_text(heading))
+        elif kind == "rule":
+            if parts:
+                blocks.extend(split_sections("\n\n".join(parts)))
+                parts = []
+            blocks.append(Divider())
+        else:
+            parts.append(content)
+    if parts:
+        blocks.extend(split_sections("\n\n".join(parts)))
+    return blocks
+
+
+def _compile() -> dict:
+    global _patterns
+    import re
+
+    _patterns = {
+        "heading": re.compile(r" {0,3}(#{1,6})(?:[ \t]+(.*?))??(?:[ \t]+#+)?[ \t]*$"),
+        "setext": re.compile(r" {0,3}(=+|-+)[ \t]*$"),
+        "rule": re.compile(r" {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$"),
+        "fence": re.compile(r"( {0,3})(`{3,}(?=[^`]*$)|~{3,})"),
+        # Slack does not nest quotes, so a line's quote markers are read as one
+        "quote": re.compile(r"(?: {0,3}> ?)+"),
+        "item": re.compile(r"( *)([-+*]|(\d{1,9})[.)])(?:[ \t]+|$)"),
+        "special": re.compile(INLINE_SPECIAL),
+        "run": re.compile(r"`+|\*+|_+"),
+        "link": re.compile(r"""
+            \[([^\[\]]*)\]\([ \t\n]*<?([^\s()<>]*)>?(?:[ \t\n]+(?:"[^"]*"|'[^']*'))?[ \t\n]*\)
+        """, re.X),
+        "autolink": re.compile(r"<([A-Za-z][A-Za-z0-9+.-]{1,31}:[^\s<>]*|[^\s<>@]+@[^\s<>@]+)>"),
+        "entity": re.compile(r"&(?:#[0-9]{1,7}|#[xX][0-9a-fA-F]{1,6}|[A-Za-z][A-Za-z0-9]{1,31});"),
+    }
+    return _patterns
+
+
+def _parse(lines: list) -> list:
+    """
+    Reads the block structure of Markdown line by line
+    :return: List of (kind, content) tuples: ("heading", raw text), ("rule", None), or ("text", mrkdwn)
+    """
+    patterns = _patterns or _compile()
+    heading = patterns["heading"].match
+    setext = patterns["setext"].match
+    rule = patterns["rule"].match
+    fence_open = patterns["fence"].match
+    quote_marker = patterns["quote"].match
+    list_item = patterns["item"].match
+
+    blocks = []
+    paragraph = []
+    # Items of the open list as [prefix, lines, code blocks], and the content indent of each open item, innermost last
+    items = []
+    indents = []
+    list_gap = False
+    quote = []
+    code = []
+    # The char, length and indent of the open code fence and whether it is in a list item, or None; indented code
+    # when code is open without one
+    fence = None
+
+    def codeblock():
+        while code and not code[-1].strip():
+            code.pop()
+        block = "```" + md._escape("\n".join(code)) + "```"
+        code.clear()
+        return block
+
+    def close(keep_list=False):
+        nonlocal list_gap
+        if paragraph:
+            blocks.append(("text", _inline(_join(paragraph))))
+            paragraph.clear()
+        if items and not keep_list:
+            rendered = []
+            for prefix, text, codeblocks in items:
+                rendered.append(prefix + _inline(_join(text)))
+                rendered.extend(codeblocks)
+            blocks.append(("text", "\n".join(rendered)))
+            items.clear()
+            indents.clear()
+            list_gap = False
+        if quote:
+            inner = markdown_to_mrkdwn("\n".join(quote))
+            blocks.append(("text", "\n".join(f">{line}" for line in inner.split("\n"))))
+            quote.clear()
+        if code:
+            blocks.append(("text", codeblock()))
+
+    for line in lines:
+        if fence is not None:
+            char, length, indent, in_item = fence
+            stripped = line.strip()
+            if stripped.startswith(char * length) and not stripped.strip(char) and \
+                    len(line) - len(line.lstrip()) < indent + 4:
+                fence = None
+                if in_item:
+                    items[-1][2].append(codeblock())
+                else:
+                    close()
+            else:
+                code.append(line[min(indent, len(line) - len(line.lstrip(" "))):])
+            continue
+        if "\t" in line:
+            line = line.expandtabs(4)
+        stripped = line.lstrip(" ")
+        if not stripped.strip():
+            if code:
+                code.append("")
+            elif items:
+                list_gap = True
+            else:
+                close()
+            continue
+        indent = len(line) - len(stripped)
+        if code:
+            if indent >= 4:
+                code.append(line[4:])
+                continue
+            close()
+        block_start = indent < 4 and stripped[0] in BLOCK_START
+        if quote:
+            marker = block_start and quote_marker(line)
+            if marker:
+                quote.append(line[marker.end():])
+                continue
+            if not block_start or not (heading(line) or rule(line) or fence_open(line) or list_item(line)):
+                quote.append(line)
+                continue
+            close()
+        if items and indent >= indents[0] and stripped[0] in "`~":
+            match = fence_open(stripped)
+            if match:
+                fence = (match.group(2)[0], len(match.group(2)), indent, True)
+                list_gap = False
+                continue
+        if block_start:
+            match = fence_open(line)
+            if match:
+                close()
+                fence = (match.group(2)[0], len(match.group(2)), len(match.group(1)), False)
+                continue
+            match = heading(line)
+            if match:
+                close()
+                if match.group(2):
+                    blocks.append(("heading", match.group(2)))
+                continue
+            if paragraph and setext(line):
+                text = _join(paragraph)
+                paragraph.clear()
+                close()
+                blocks.append(("heading", text))
+                continue
+            if rule(line):
+                close()
+                blocks.append(("rule", None))
+                continue
+            marker = quote_marker(line)
+            if marker:
+                close()
+                quote.append(line[marker.end():])
+                continue
+        match = (block_start or indent >= 4 and items) and list_item(line)
+        if match:
+            indent = len(match.group(1))
+            while indents and indent < indents[-1]:
+                indents.pop()
+            number = match.group(3)
+            # Changing between bullets and numbers at the outer level starts a new list
+            close(keep_list=bool(indents) or not items or (items[0][0][-2] in BULLETS) == (number is None))
+            bullet = f"{number}{match.group(2)[-1]}" if number else BULLETS[len(indents) % len(BULLETS)]
+            items.append(["    " * len(indents) + bullet + " ", [line[match.end():]], []])
+            indents.append(match.end() if match.end() < len(line) else indent + len(match.group(2)) + 1)
+            list_gap = False
+            continue
+        if items:
+            if indent >= indents[0] or not list_gap:
+                items[-1][1].append(stripped)
+                list_gap = False
+                continue
+            close()
+        if not paragraph and indent >= 4:
+            close()
+            code.append(line[4:])
+            continue
+        paragraph.append(stripped)
+    close()
+    return blocks
+
+
+def _join(lines: list) -> str:
+    """
+    Joins the lines of a paragraph, ending a line that ends in two spaces with a backslash, the other way to write a
+    hard line break, so that the inline scan only has to look for the one
+    """
+    last = len(lines) - 1
+    return "\n".join(line.rstrip() + "\\" if index < last and line.endswith("  ") else line.rstrip()
+                     for index, line in enumerate(lines))
+
+
+def _inline(text: str, plain: bool = False) -> str:
+    """
+    Converts the inline Markdown of one paragraph to mrkdwn with a single scan of the text. Emphasis is matched with a
+    stack of the delimiter runs that may open a span, as CommonMark does; an opener that is closed pops the openers
+    left open inside it, so that every delimiter run is pushed and popped at most once.
+    :param plain: Boolean; leave out all markup, for plain_text
+    :return: String
+    """
+    patterns = _patterns or _compile()
+    search = patterns["special"].search
+    run_at = patterns["run"].match
+    link_at = patterns["link"].match
+    autolink_at = patterns["autolink"].match
+    entity_at = patterns["entity"].match
+    escape = (lambda string: string) if plain else md._escape
+    out = []
+    # Openers as [index into out, char, count left, markers written], oldest first. The entry of an opener in out is
+    # rewritten as it is matched; one never matched stays as the delimiter run it was.
+    openers = []
+    # How many openers of each char there are, so that a closer looks through the openers only when one will match
+    waiting = {"*": 0, "_": 0, "~": 0}
+    # Lengths of code span closers known not to occur again, so that the text is searched for each once
+    missing = set()
+    position = 0
+    end = len(text)
+    while True:
+        match = search(text, position)
+        if match is None:
+            out.append(text[position:])
+            break
+        start = match.start()
+        if start > position:
+            out.append(text[position:start])
+        char = text[start]
+        position = start + 1
+        if char in "*_~":
+            if char == "~":
+                if not text.startswith("~", position):
+                    out.append("~")
+                    continue
+                count = 2
+            else:
+                count = run_at(text, start).end() - start
+            position = start + count
+            before = text[start - 1] if start else " "
+            after = text[position] if position < end else " "
+            left = not after.isspace() and (after.isalnum() or not before.isalnum())
+            right = not before.isspace() and (before.isalnum() or not after.isalnum())
+            if char == "_":
+                can_open = left and (not right or not before.isalnum())
+                can_close = right and (not left or not after.isalnum())
+            else:
+                can_open = left
+                can_close = right
+            markers = ""
+            if can_close:
+                index = len(openers) - 1
+                while count and waiting[char]:
+                    opener = openers[index]
+                    if opener[1] != char:
+                        index -= 1
+                        continue
+                    used = 2 if count >= 2 and opener[2] >= 2 else 1
+                    marker = "" if plain else "~" if char == "~" else "*" if used == 2 else "_"
+                    opener[2] -= used
+                    opener[3] = marker + opener[3]
+                    out[opener[0]] = char * opener[2] + opener[3]
+                    markers += marker
+                    count -= used
+                    # Openers left inside the closed span can no longer be matched
+                    for dropped in openers[index + 1:]:
+                        waiting[dropped[1]] -= 1
+                    del openers[index + 1:]
+                    if not opener[2]:
+                        openers.pop()
+                        waiting[char] -= 1
+                        index -= 1
+            if markers:
+                out.append(markers)
+            if count:
+                if can_open:
+                    openers.append([len(out), char, count, ""])
+                    waiting[char] += 1
+                out.append(char * count)
+        elif char == "\n":
+            out.append(" ")
+        elif char == "`":
+            run = run_at(text, start).group()
+            length = len(run)
+            position = start + length
+            close = -1
+            if length not in missing:
+                close = text.find(run, position)
+                while close != -1 and (text.startswith("`", close + length) or text[close - 1] == "`"):
+                    close = text.find(run, close + length + 1)
+                if close == -1:
+                    missing.add(length)
+            if close == -1:
+                out.append(run)
+                continue
+            code = text[position:close].replace("\n", " ")
+            if len(code) > 2 and code[0] == code[-1] == " " and code.strip():
+                code = code[1:-1]
+            out.append(escape(code) if plain else f"`{escape(code)}`")
+            position = close + length
+        elif char == "[" or char == "!" and text.startswith("[", position):
+            match = link_at(text, position if char == "!" else start)
+            if match is None:
+                out.append(char)
+                continue
+            label = _inline(match.group(1), plain)
+            url = match.group(2)
+            if plain:
+                out.append(label or url)
+            else:
+                url = escape(url)
+                out.append(f"<{url}|{label}>" if label else f"<{url}>")
+            position = match.end()
+        elif char == "<":
+            match = autolink_at(text, start)
+            if match is None:
+                out.append(escape(char))
+                continue
+            target = match.group(1)
+            if plain:
+                out.append(target)
+            elif ":" in target:
+                out.append(f"<{escape(target)}>")
+            else:
+                target = escape(target)
+                out.append(f"<mailto:{target}|{target}>")
+            position = match.end()
+        elif char == "&":
+            match = entity_at(text, start)
+            if match is None:
+                out.append(escape(char))
+                continue
+            out.append(match.group())
+            position = match.end()
+        elif char == "\\":
+            following = text[position] if position < end else ""
+            if following == "\n":
+                out.append("\n")
+                position += 1
+            elif following and following in "!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~":
+                out.append(escape(following))
+                position += 1
+            else:
+                out.append(char)
+        else:
+            out.append(escape(char))
+    return "".join(out)
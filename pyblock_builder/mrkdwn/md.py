@@ -1,13 +1,91 @@
+# Set by enable_auto_escape(); while True, the helpers escape their arguments and mark what they return as Escaped
+_auto_escape = False
+
+
+class Escaped(str):
+    """
+    A string that is already mrkdwn, as returned by escape() and the helpers while auto-escape is enabled. It is
+    not escaped again by the helpers or by Text.set_text(), and adding a plain string to it escapes the plain string.
+    """
+    __slots__ = ()
+
+    def __add__(self, other):
+        return Escaped(str.__add__(self, _escape(other)))
+
+    def __radd__(self, other):
+        return Escaped(str.__add__(_escape(other), self))
+
+
+def escape(text: str) -> str:
+    """
+    Escapes the characters Slack reads as mrkdwn control characters (&, < and >) so that user-supplied text is shown
+    as typed instead of as links, mentions or broken formatting
+    :param text: String
+    :return: str; an Escaped string while auto-escape is enabled
+    """
+    text = _escape(text)
+    return Escaped(text) if _auto_escape and type(text) is not Escaped else text
+
+
+def escape_all(texts) -> list:
+    """
+    Escapes many strings at once, i.e. a column of user names, without a function call per string
+    :param texts: Iterable of Strings
+    :return: list of str; of Escaped strings while auto-escape is enabled
+    """
+    if _auto_escape:
+        return [text if type(text) is Escaped else Escaped(text) for text in _escape_all(texts)]
+    return _escape_all(texts)
+
+
+def _escape(text: str) -> str:
+    # Checking for the characters first skips the three copies made by replace() for the usual text that has none
+    if type(text) is Escaped or ("&" not in text and "<" not in text and ">" not in text):
+        return text
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _escape_all(texts) -> list:
+    return [text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            if type(text) is not Escaped and ("&" in text or "<" in text or ">" in text) else text for text in texts]
+
+
+def enable_auto_escape():
+    """
+    Makes the helpers in this module escape the text they are given, and Text.set_text() escape the text of mrkdwn
+    objects, i.e. those made with as_mrkdwn(), Section.set_text() or Fields.add_field(). What the helpers and
+    escape() return is marked as Escaped and not escaped again, so helpers can be nested and their results passed to
+    Text; other strings, including f-strings built from helper results, are escaped in full. Best enabled once at
+    startup, before any interned labels are created.
+    """
+    global _auto_escape
+    _auto_escape = True
+
+
+def disable_auto_escape():
+    """
+    Stops escaping text automatically. Text already set stays as it is.
+    """
+    global _auto_escape
+    _auto_escape = False
+
+
+def _markup(markup: str) -> str:
+    return Escaped(markup) if _auto_escape else markup
+
+
 def blockquote(text: str) -> str:
     """
     Converts a string into a blockquote.
     :param text: String
     :return: str
     """
+    if _auto_escape:
+        text = _escape(text)
     bq = []
     for line in text.split("\n"):
         bq.append(f">{line}")
-    return ("\n").join(bq)
+    return _markup(("\n").join(bq))
 
 def bold(text: str) -> str:
     """
@@ -15,7 +93,7 @@ def bold(text: str) -> str:
     :param text: String
     :return: str
     """
-    return f"*{text}*"
+    return _markup(f"*{_escape(text) if _auto_escape else text}*")
 
 def italic(text: str) -> str:
     """
@@ -23,7 +101,7 @@ def italic(text: str) -> str:
     :param text: String
     :return: str
     """
-    return f"_{text}_"
+    return _markup(f"_{_escape(text) if _auto_escape else text}_")
 
 def strike(text: str) -> str:
     """
@@ -31,7 +109,7 @@ def strike(text: str) -> str:
     :param text: String
     :return: str
     """
-    return f"~{text}~"
+    return _markup(f"~{_escape(text) if _auto_escape else text}~")
 
 def inline_code(text: str) -> str:
     """
@@ -39,7 +117,7 @@ def inline_code(text: str) -> str:
     :param text: String
     :return: str
     """
-    return f"`{text}`"
+    return _markup(f"`{_escape(text) if _auto_escape else text}`")
 
 def codeblock(text: str) -> str:
     """
@@ -47,7 +125,7 @@ def codeblock(text: str) -> str:
     :param text: String
     :return: str
     """
-    return f"```{text}```"
+    return _markup(f"```{_escape(text) if _auto_escape else text}```")
 
 def dashed_list(items: str | list) -> str:
     """
@@ -55,13 +133,15 @@ def dashed_list(items: str | list) -> str:
     :param items: String or List of Strings
     :return: str
     """
+    if _auto_escape:
+        items = _escape_all(items) if isinstance(items, list) else _escape(items)
     if isinstance(items, list):
         dl = []
         for item in items:
             dl.append(f"- {item}")
-        return "\n".join(dl)
+        return _markup("\n".join(dl))
     elif isinstance(items, str):
-        return f"- {items}"
+        return _markup(f"- {items}")
     else:
         return "Invalid type. Must be string or list."
 
@@ -72,13 +152,15 @@ def bullet_list(items: str | list) -> str:
     :param items: String or List of Strings
     :return: str
     """
+    if _auto_escape:
+        items = _escape_all(items) if isinstance(items, list) else _escape(items)
     if isinstance(items, list):
         bl = []
         for item in items:
             bl.append(f"• {item}")
-        return "\n".join(bl)
+        return _markup("\n".join(bl))
     elif isinstance(items, str):
-        return f"- {items}"
+        return _markup(f"- {items}")
     else:
         return "Invalid type. Must be string or list."
 
@@ -90,9 +172,12 @@ def link(url: str, link_text=None) -> str:
     be shown.
     :return: str
     """
+    if _auto_escape:
+        url = _escape(url)
+        link_text = _escape(link_text) if link_text else link_text
     if link_text:
-        return f"<{url}|{link_text}>"
-    return f"<{url}>"
+        return _markup(f"<{url}|{link_text}>")
+    return _markup(f"<{url}>")
 
 def mailto(email: str, link_text=None) -> str:
     """
@@ -102,9 +187,12 @@ def mailto(email: str, link_text=None) -> str:
     will be displayed.
     :return: str
     """
+    if _auto_escape:
+        email = _escape(email)
+        link_text = _escape(link_text) if link_text else link_text
     if link_text:
-        return f"<mailto:{email}|{link_text}>"
-    return f"<mailto:{email}|{email}>"
+        return _markup(f"<mailto:{email}|{link_text}>")
+    return _markup(f"<mailto:{email}|{email}>")
 
 def emoji(name: str) -> str:
     """
@@ -112,7 +200,7 @@ def emoji(name: str) -> str:
     :param name: String; the name of the emoji to be created
     :return: str
     """
-    return f":{name}:"
+    return _markup(f":{_escape(name) if _auto_escape else name}:")
 
 def user(user_id: str) -> str:
     """
@@ -120,7 +208,7 @@ def user(user_id: str) -> str:
     :param user_id: String; Slack ID of the user to be mentioned
     :return: str
     """
-    return f"<@{user_id}>"
+    return _markup(f"<@{_escape(user_id) if _auto_escape else user_id}>")
 
 def channel(channel_id: str) -> str:
     """
@@ -128,7 +216,7 @@ def channel(channel_id: str) -> str:
     :param channel_id: String; ID of the Slack channel to which a link should be created
     :return: str
     """
-    return f"<#{channel_id}>"
+    return _markup(f"<#{_escape(channel_id) if _auto_escape else channel_id}>")
 
 def group(group_id: str) -> str:
     """
@@ -136,8 +224,108 @@ def group(group_id: str) -> str:
     :param group_id: String; Group ID of the Slack group to be mentioned. Can also be "here", "channel", or "everyone".
     :return: str
     """
+    if _auto_escape:
+        group_id = _escape(group_id)
     special = ["here", "channel", "everyone"]
     if group_id in special:
-        return f"<!{group_id}>"
-    return f"<!subteam^{group_id}>"
+        return _markup(f"<!{group_id}>")
+    return _markup(f"<!subteam^{group_id}>")
+
+
+# Alignment names accepted by table(), as the str methods that pad a cell
+_ALIGN = {"left": str.ljust, "<": str.ljust, "right": str.rjust, ">": str.rjust, "center": str.center, "^": str.center}
+
+
+def table(columns, headers=None, align=None, limit: int = 3000, max_pages: int = None) -> list:
+    """
+    Renders columns of values as a monospaced table in code blocks, one per page of rows that fits in a Text object.
+    Widths are measured once per column rather than per row: NumPy arrays are converted to strings with one astype()
+    call, whose dtype gives the width of the column.
+    :param columns: Sequence of columns, each a list, tuple or NumPy-style array of values; all of the same length
+    :param headers: (Optional) Sequence of Strings, one per column; repeated at the top of every page
+    :param align: (Optional) "left", "right" or "center" (or "<", ">", "^") for every column, or a sequence of one
+    per column; defaults to right for numeric columns and left for the others
+    :param limit: (Optional) Integer; maximum length of each code block, defaults to 3000
+    :param max_pages: (Optional) Integer; number of pages to return at most, the last one ending with a line saying
+    how many rows were left out; defaults to all pages
+    :return: list of str; one code block per page
+    """
+    from bisect import bisect_right
+    from itertools import accumulate
+    from pyblock_builder.objects.option import as_list
+
+    cells = []
+    widths = []
+    numeric = []
+    for column in columns:
+        astype = getattr(column, "astype", None)
+        strings = astype(str) if astype is not None else None
+        if strings is not None and strings.dtype.kind == "U":
+            # A NumPy unicode dtype stores 4 bytes per character of its longest string
+            numeric.append(column.dtype.kind in "iuf")
+            column = strings.tolist()
+            width = strings.dtype.itemsize // 4
+        else:
+            column = as_list(column)
+            numeric.append(bool(column) and type(column[0]) in (int, float))
+            column = [value if type(value) is str else str(value) for value in column]
+            width = None
+        cells.append(column)
+        widths.append(width if width is not None else max(map(len, column), default=0))
+
+    count = len(cells[0]) if cells else 0
+    if any(len(column) != count for column in cells):
+        raise ValueError("All table columns must have the same length")
+    if headers is not None and len(headers) != len(cells):
+        raise ValueError("Table headers must have one entry per column")
+    if headers is not None:
+        widths = [max(width, len(header)) for width, header in zip(widths, headers)]
+    if align is None:
+        aligns = ["right" if is_numeric else "left" for is_numeric in numeric]
+    else:
+        aligns = [align] * len(cells) if isinstance(align, str) else list(align)
+    if len(aligns) != len(cells):
+        raise ValueError("Table alignments must have one entry per column")
+    pads = []
+    for name in aligns:
+        pad = _ALIGN.get(name)
+        if pad is None:
+            raise ValueError(f"Unknown alignment: {name}. Must be one of {', '.join(_ALIGN)}")
+        pads.append(pad)
+
+    # Pad column by column, leaving the last one unpadded when it is left-aligned, then join the rows
+    last = len(cells) - 1
+    padded = [column if index == last and pad is str.ljust else [pad(cell, width) for cell in column]
+              for index, (column, width, pad) in enumerate(zip(cells, widths, pads))]
+    rows = list(map("  ".join, zip(*padded)))
+    head = ""
+    if headers is not None:
+        head = "  ".join(pad(header, width) for header, width, pad in zip(headers, widths, pads)).rstrip()
+        head = f"{head}\n{'  '.join('-' * width for width in widths)}\n"
+    if _auto_escape:
+        # Escaped after padding, so that the columns line up as displayed while the pages are sized as sent
+        rows = _escape_all(rows)
+        head = _escape(head)
 
+    # Page breaks are found by bisecting the running total of the row lengths, each counted with its line break
+    totals = list(accumulate(map((1).__add__, map(len, rows))))
+    room = limit - 6 - len(head) + 1
+    widest = max(map(len, rows), default=0)
+    if widest >= room:
+        raise ValueError(f"Table rows of {widest} characters do not fit in a code block of {limit}")
+    pages = []
+    start = 0
+    while start < count and (max_pages is None or len(pages) < max_pages):
+        end = bisect_right(totals, (totals[start - 1] if start else 0) + room)
+        pages.append(rows[start:end])
+        start = end
+    if start < count:
+        # Make room on the last page for a line saying how many rows were left out
+        page = pages[-1]
+        before = totals[start - len(page) - 1] if start > len(page) else 0
+        while page and totals[start - 1] - before + len(f"… {count - start} more rows") + 1 > room:
+            page.pop()
+            start -= 1
+        page.append(f"… {count - start} more rows")
+    pages = pages or [[]]
+    return [_markup("```" + head + "\n".join(page) + "```") for page in pages]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, Iterator
+from bisect import bisect_left
+from pyblock_builder.mrkdwn import md
+from pyblock_builder.surfaces.budget import DEFAULT_MAX_TEXT
+
+FENCE = "```"
+
+# Spans a line is not cut inside: code fences, links and mentions, and bold, italic, strike and code spans. Compiled
+# on first use, so that importing the package does not import re.
+_spans = None
+
+
+def split_text(text: str | Iterable[str], limit: int = DEFAULT_MAX_TEXT) -> Iterator[str]:
+    """
+    Splits long mrkdwn into chunks that each fit in one Text object. Chunks end at line breaks where possible; a
+    line longer than the limit is cut after a space, and never inside a <...|...> link or mention, a *bold*,
+    _italic_, ~strike~ or `code` span, or a ``` fence. A code block split across chunks is closed at the end of each
+    chunk and opened again at the start of the next. Runs in linear time, yielding chunks as the text is read.
+    :param text: String, or iterable of lines such as an open file
+    :param limit: (Optional) Integer; maximum length of a chunk, defaults to 3000 for the text of a Section; use 2000
+    for Fields
+    :return: Iterator of mrkdwn strings
+    """
+    lines = text.split("\n") if isinstance(text, str) else (line.rstrip("\n") for line in text)
+    parts = []
+    # The fence that opens the chunk again when it starts inside a code block, the length of the chunk with it, and
+    # whether the text so far ends inside a code block
+    prefix = ""
+    length = 0
+    in_code = False
+    for line in lines:
+        ends_in_code = in_code ^ bool(line.count(FENCE) & 1)
+        closing = 3 if ends_in_code else 0
+        if parts and length + 1 + len(line) + closing > limit:
+            yield from _chunk(prefix, parts, in_code)
+            prefix = FENCE if in_code else ""
+            parts = []
+            length = len(prefix)
+        if not parts and length + len(line) + closing > limit:
+            # Too long for a chunk of its own: cut pieces off it until the rest fits
+            starts, ends = _span_bounds(line)
+            has_fence = FENCE in line
+            position = 0
+            while len(prefix) + len(line) - position + closing > limit:
+                room = limit - len(prefix) - (3 if in_code or has_fence else 0)
+                cut = _cut(line, position, position + room, starts, ends)
+                in_code ^= bool(line.count(FENCE, position, cut) & 1)
+                yield from _chunk(prefix, (line[position:cut],), in_code)
+                prefix = FENCE if in_code else ""
+                position = cut
+            line = line[position:]
+            length = len(prefix)
+        length += len(line) + 1 if parts else len(line)
+        parts.append(line)
+        in_code = ends_in_code
+    yield from _chunk(prefix, parts, in_code)
+
+
+def split_sections(text: str | Iterable[str], limit: int = DEFAULT_MAX_TEXT) -> Iterator:
+    """
+    Splits long mrkdwn with split_text() into Section blocks
+    :param text: String, or iterable of lines such as an open file
+    :param limit: (Optional) Integer; maximum length of the text of each Section, defaults to 3000
+    :return: Iterator of Section blocks, to pass to add_blocks() with *
+    """
+    from pyblock_builder.blocks.section import Section
+
+    for chunk in split_text(text, limit):
+        yield Section().set_text(chunk)
+
+
+def _chunk(prefix: str, parts, in_code: bool) -> Iterator[str]:
+    text = "\n".join(parts)
+    if text.strip():
+        yield md._markup(f"{prefix}{text}{FENCE}" if in_code else prefix + text)
+
+
+def _span_bounds(line: str) -> tuple:
+    """
+    Finds the spans of a line that must not be cut
+    :return: Tuple of the sorted lists of their start and end positions
+    """
+    global _spans
+    if _spans is None:
+        import re
+
+        _spans = re.compile(r"```|<[^<>\n]*>|\*[^*\n]+\*|_[^_\n]+_|~[^~\n]+~|`[^`\n]+`")
+    starts = []
+    ends = []
+    for match in _spans.finditer(line):
+        starts.append(match.start())
+        ends.append(match.end())
+    return starts, ends
+
+
+def _cut(line: str, low: int, high: int, starts: list, ends: list) -> int:
+    """
+    Picks where to cut a line between low and high: after the last space in the second half of the range that is
+    outside every span, else at high, else before the span high falls in, else at high through the span
+    :return: Integer; position of the cut, after low
+    """
+    def span_at(position: int) -> int:
+        index = bisect_left(starts, position) - 1
+        return index if index >= 0 and ends[index] > position else -1
+
+    half = low + (high - low) // 2
+    space = line.rfind(" ", half, high)
+    while space != -1:
+        index = span_at(space + 1)
+        if index == -1:
+            return space + 1
+        space = line.rfind(" ", half, starts[index])
+    index = span_at(high)
+    if index == -1:
+        return high
+    return starts[index] if starts[index] > low else high
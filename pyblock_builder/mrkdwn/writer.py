@@ -0,0 +1,308 @@
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterator
+    from typing_extensions import Self
+from pyblock_builder.mrkdwn import md
+from pyblock_builder.mrkdwn.splitter import split_text
+from pyblock_builder.surfaces.budget import DEFAULT_MAX_TEXT
+
+
+class MrkdwnWriter:
+    """
+    Builds a long mrkdwn document by appending fragments to one buffer instead of nesting md helper calls, which build
+    a new string or list at every level. Its methods are named after the md helpers and write the same markup.
+
+    The writer keeps a running count of the text in the buffer. When a fragment would take it over the limit, the
+    complete lines written so far are cut off as a chunk that fits in one Text object, and the line being written is
+    carried over to the next chunk. Fragments are never split, except one that is longer than the limit on its own,
+    which is split with split_text().
+    """
+    __slots__ = ("_limit", "_escape", "_parts", "_length", "_line_start", "_line_offset", "_chunks")
+
+    def __init__(self, limit: int = DEFAULT_MAX_TEXT):
+        """
+        :param limit: (Optional) Integer; maximum length of a chunk, defaults to 3000 for the text of a Section; use
+        2000 for Fields
+        """
+        self._limit = limit
+        # Read once, so that auto-escape mode costs one test per fragment rather than a module lookup
+        self._escape = md._auto_escape
+        self._parts = []
+        self._length = 0
+        # Where the line being written starts, as an index into _parts and as a character offset
+        self._line_start = 0
+        self._line_offset = 0
+        self._chunks = []
+
+    def __len__(self) -> int:
+        """
+        :return: Length of the text in the buffer, not counting chunks already cut off
+        """
+        return self._length
+
+    def _write(self, fragment: str):
+        length = len(fragment)
+        if self._length + length > self._limit:
+            self._cut(length)
+            if length > self._limit:
+                pieces = list(split_text(fragment, self._limit)) or [""]
+                self._chunks.extend(pieces[:-1])
+                fragment = pieces[-1]
+                length = len(fragment)
+        self._parts.append(fragment)
+        self._length += length
+
+    def _cut(self, incoming: int):
+        """
+        Cuts the buffer into a chunk to make room for a fragment, at the start of the current line if what has been
+        written of the line fits in the next chunk together with the fragment, or if nothing has been written of it
+        """
+        line_length = self._length - self._line_offset
+        if self._line_start and (not line_length or line_length + incoming <= self._limit):
+            self._chunks.append("".join(self._parts[:self._line_start - 1]))
+            del self._parts[:self._line_start]
+            self._length = line_length
+        else:
+            self._flush()
+        self._line_start = 0
+        self._line_offset = 0
+
+    def _flush(self):
+        if self._length:
+            self._chunks.append("".join(self._parts))
+        self._parts = []
+        self._length = 0
+
+    def _new_line(self):
+        if self._length:
+            if self._length >= self._limit:
+                self._flush()
+            else:
+                self._parts.append("\n")
+                self._length += 1
+            self._line_start = len(self._parts)
+            self._line_offset = self._length
+
+    def drain(self) -> list:
+        """
+        Takes the chunks cut off so far, i.e. to post them while the rest of a report is still being written
+        :return: List of mrkdwn strings, each within the limit
+        """
+        chunks = [md._markup(chunk) for chunk in self._chunks]
+        self._chunks = []
+        return chunks
+
+    def chunks(self) -> Iterator[str]:
+        """
+        Yields the chunks cut off so far, then the text left in the buffer, leaving the writer empty
+        :return: Iterator of mrkdwn strings, each within the limit
+        """
+        while self._chunks:
+            yield from self.drain()
+        self._flush()
+        self._line_start = 0
+        self._line_offset = 0
+        yield from self.drain()
+
+    def sections(self) -> Iterator:
+        """
+        Yields a Section block for each chunk, leaving the writer empty
+        :return: Iterator of Section blocks, to pass to add_blocks() with *
+        """
+        from pyblock_builder.blocks.section import Section
+
+        for chunk in self.chunks():
+            yield Section().set_text(chunk)
+
+    def text(self, text: str) -> Self:
+        """
+        Writes plain text on the current line; escaped while md.enable_auto_escape() is in effect
+        :param text: String
+        :return: self
+        """
+        self._write(md._escape(text) if self._escape else text)
+        return self
+
+    def markup(self, markup: str) -> Self:
+        """
+        Writes mrkdwn as it is, on the current line
+        :param markup: String
+        :return: self
+        """
+        self._write(markup)
+        return self
+
+    def line(self, text: str = "") -> Self:
+        """
+        Starts a new line, with an optional plain text
+        :param text: (Optional) String; leave out to write an empty line
+        :return: self
+        """
+        self._new_line()
+        if text:
+            self._write(md._escape(text) if self._escape else text)
+        return self
+
+    def bold(self, text: str) -> Self:
+        """
+        Writes bold text on the current line
+        :param text: String
+        :return: self
+        """
+        self._write(f"*{md._escape(text) if self._escape else text}*")
+        return self
+
+    def italic(self, text: str) -> Self:
+        """
+        Writes italic text on the current line
+        :param text: String
+        :return: self
+        """
+        self._write(f"_{md._escape(text) if self._escape else text}_")
+        return self
+
+    def strike(self, text: str) -> Self:
+        """
+        Writes strikethrough text on the current line
+        :param text: String
+        :return: self
+        """
+        self._write(f"~{md._escape(text) if self._escape else text}~")
+        return self
+
+    def inline_code(self, text: str) -> Self:
+        """
+        Writes inline code on the current line
+        :param text: String
+        :return: self
+        """
+        self._write(f"`{md._escape(text) if self._escape else text}`")
+        return self
+
+    def codeblock(self, text: str) -> Self:
+        """
+        Writes a multi-line block of code on a new line
+        :param text: String
+        :return: self
+        """
+        self._new_line()
+        self._write(f"```{md._escape(text) if self._escape else text}```")
+        return self
+
+    def blockquote(self, text: str) -> Self:
+        """
+        Writes each line of the text as a quoted line
+        :param text: String
+        :return: self
+        """
+        if self._escape:
+            text = md._escape(text)
+        for line in text.split("\n"):
+            self._new_line()
+            self._write(f">{line}")
+        return self
+
+    def bullet(self, item: str = "") -> Self:
+        """
+        Starts a bulleted list item on a new line. Leave out the item to write its content with the inline methods.
+        :param item: (Optional) String
+        :return: self
+        """
+        self._new_line()
+        self._write(f"• {md._escape(item) if self._escape else item}")
+        return self
+
+    def dash(self, item: str = "") -> Self:
+        """
+        Starts a dashed list item on a new line. Leave out the item to write its content with the inline methods.
+        :param item: (Optional) String
+        :return: self
+        """
+        self._new_line()
+        self._write(f"- {md._escape(item) if self._escape else item}")
+        return self
+
+    def bullet_list(self, items: list) -> Self:
+        """
+        Writes a bulleted list, one item per line
+        :param items: List of Strings
+        :return: self
+        """
+        for item in (md._escape_all(items) if self._escape else items):
+            self._new_line()
+            self._write(f"• {item}")
+        return self
+
+    def dashed_list(self, items: list) -> Self:
+        """
+        Writes a dashed list, one item per line
+        :param items: List of Strings
+        :return: self
+        """
+        for item in (md._escape_all(items) if self._escape else items):
+            self._new_line()
+            self._write(f"- {item}")
+        return self
+
+    def link(self, url: str, link_text=None) -> Self:
+        """
+        Writes a clickable link on the current line
+        :param url: String
+        :param link_text: String; Optional text to display instead of the url itself
+        :return: self
+        """
+        if self._escape:
+            url = md._escape(url)
+            link_text = md._escape(link_text) if link_text else link_text
+        self._write(f"<{url}|{link_text}>" if link_text else f"<{url}>")
+        return self
+
+    def mailto(self, email: str, link_text=None) -> Self:
+        """
+        Writes a clickable email address on the current line
+        :param email: String; email address
+        :param link_text: String; Optional text to display instead of the email address
+        :return: self
+        """
+        if self._escape:
+            email = md._escape(email)
+            link_text = md._escape(link_text) if link_text else link_text
+        self._write(f"<mailto:{email}|{link_text or email}>")
+        return self
+
+    def emoji(self, name: str) -> Self:
+        """
+        Writes an emoji on the current line
+        :param name: String; the name of the emoji
+        :return: self
+        """
+        self._write(md.emoji(name))
+        return self
+
+    def user(self, user_id: str) -> Self:
+        """
+        Mentions a user on the current line
+        :param user_id: String; Slack ID of the user
+        :return: self
+        """
+        self._write(md.user(user_id))
+        return self
+
+    def channel(self, channel_id: str) -> Self:
+        """
+        Links a channel on the current line
+        :param channel_id: String; ID of the Slack channel
+        :return: self
+        """
+        self._write(md.channel(channel_id))
+        return self
+
+    def group(self, group_id: str) -> Self:
+        """
+        Mentions a user group on the current line
+        :param group_id: String; Group ID, or "here", "channel" or "everyone"
+        :return: self
+        """
+        self._write(md.group(group_id))
+        return self
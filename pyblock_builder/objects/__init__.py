@@ -1,7 +1,32 @@
-from .option import Option
-from .option_group import OptionGroup
-from .text import Text
-from .fields import Fields
-from .confirmation_dialog import ConfirmationDialog
-from .conversations_filter import ConversationsFilter
-from .dispatch_action_configuration import DispatchActionConfig
\ No newline at end of file
+from pyblock_builder import _lazy
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .option import Option, OptionList
+    from .option_group import OptionGroup
+    from .text import Text
+    from .fields import Fields
+    from .confirmation_dialog import ConfirmationDialog
+    from .conversations_filter import ConversationsFilter
+    from .dispatch_action_configuration import DispatchActionConfig
+    from .interning import InternPool, SharedOption, SharedText, enable_interning, disable_interning
+
+_EXPORTS = {
+    "Option": ".option",
+    "OptionList": ".option",
+    "OptionGroup": ".option_group",
+    "Text": ".text",
+    "Fields": ".fields",
+    "ConfirmationDialog": ".confirmation_dialog",
+    "ConversationsFilter": ".conversations_filter",
+    "DispatchActionConfig": ".dispatch_action_configuration",
+    "InternPool": ".interning",
+    "SharedOption": ".interning",
+    "SharedText": ".interning",
+    "enable_interning": ".interning",
+    "disable_interning": ".interning",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = _lazy.lazy_module(__name__, _EXPORTS)
@@ -1,28 +1,37 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
-from pyblock_builder.objects.text import Text
+from pyblock_builder.objects.text import label
 
 
 class ConfirmationDialog:
     """
     A Python class representing a Confirmation dialog object from the Slack BlockKit UI framework\n
     """
+    __slots__ = ("_title", "_text", "_confirm_text", "_deny_text", "_style")
 
     def __init__(self):
-        self._title = {}
-        self._text = {}
-        self._confirm_text = {}
-        self._deny_text = {}
+        self._title = None
+        self._text = None
+        self._confirm_text = None
+        self._deny_text = None
         self._style = None
-        self.json = {
-            "title": self._title,
-            "text": self._text,
-            "confirm": self._confirm_text,
-            "deny": self._deny_text
+
+    @property
+    def json(self) -> dict:
+        """
+        The object as a Slack API dict, built from the current attributes
+        """
+        json = {
+            "title": self._title.json if self._title is not None else {},
+            "text": self._text.json if self._text is not None else {},
+            "confirm": self._confirm_text.json if self._confirm_text is not None else {},
+            "deny": self._deny_text.json if self._deny_text is not None else {}
         }
+        if self._style is not None:
+            json["style"] = self._style
+        return json
 
     def set_title(self, title_text: str) -> Self:
         """
@@ -30,8 +39,7 @@ class ConfirmationDialog:
         :param title_text: String; max 100 chars
         :return: self
         """
-        self._title = Text().set_text(title_text)
-        self.json["title"] = self._title.json
+        self._title = label(title_text)
         return self
 
     def set_text(self, text: str) -> Self:
@@ -40,8 +48,7 @@ class ConfirmationDialog:
         :param text: String; max 300 chars
         :return: self
         """
-        self._text = Text().set_text(text)
-        self.json["text"]= self._text.json
+        self._text = label(text)
         return self
 
     def set_confirm_label(self, label_text: str) -> Self:
@@ -50,8 +57,7 @@ class ConfirmationDialog:
         :param label_text: String; max 30 chars
         :return: self
         """
-        self._confirm_text = Text().set_text(label_text)
-        self.json["confirm"]= self._confirm_text.json
+        self._confirm_text = label(label_text)
         return self
 
     def set_deny_label(self, label_text: str) -> Self:
@@ -60,8 +66,7 @@ class ConfirmationDialog:
         :param label_text: String; max 30 chars
         :return: self
         """
-        self._deny_text = Text().set_text(label_text)
-        self.json["deny"] = self._deny_text.json
+        self._deny_text = label(label_text)
         return self
 
     def set_style(self, style: str) -> Self:
@@ -72,7 +77,6 @@ class ConfirmationDialog:
         :return: self
         """
         self._style = style
-        self.json["style"] = self._style
         return self
 
     def primary(self) -> Self:
@@ -81,7 +85,6 @@ class ConfirmationDialog:
         :return: self
         """
         self._style = "primary"
-        self.json["style"] = self._style
         return self
 
     def danger(self) -> Self:
@@ -90,5 +93,4 @@ class ConfirmationDialog:
         :return: self
         """
         self._style = "danger"
-        self.json["style"] = self._style
         return self
@@ -1,19 +1,26 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
 
 class ConversationsFilter:
     """
     A Python class representing a Conversations filter object for conversation lists Slack BlockKit UI framework
     """
+    __slots__ = ("_included_conversations", "_exclude_external_shared_channels", "_exclude_bot_users")
+
     def __init__(self):
         self._included_conversations = []
         self._exclude_external_shared_channels = False
         self._exclude_bot_users = False
-        self.json = {
-            "include": self._included_conversations,
+
+    @property
+    def json(self) -> dict:
+        """
+        The object as a Slack API dict, built from the current attributes
+        """
+        return {
+            "include": list(self._included_conversations),
             "exclude_external_shared_channels": self._exclude_external_shared_channels,
             "exclude_bot_users": self._exclude_bot_users
         }
@@ -27,7 +34,6 @@ class ConversationsFilter:
         """
         for conversation_type in conversation_types:
             self._included_conversations.append(conversation_type)
-        self.json["include"] = self._included_conversations
         return self
 
     def exclude_external_shared_channels(self) -> Self:
@@ -36,7 +42,6 @@ class ConversationsFilter:
         :return: self
         """
         self._exclude_external_shared_channels = True
-        self.json["exclude_external_shared_channels"] = self._exclude_external_shared_channels
         return self
 
     def exclude_bot_users(self) -> Self:
@@ -45,6 +50,5 @@ class ConversationsFilter:
         :return: self
         """
         self._exclude_bot_users = True
-        self.json["exclude_bot_users"] = self._exclude_bot_users
         return self
 
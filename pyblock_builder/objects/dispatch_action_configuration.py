@@ -1,17 +1,24 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
 
 class DispatchActionConfig:
     """
     A Python class representing a Dispatch action configuration from the Slack BlockKit UI framework
     """
+    __slots__ = ("_trigger_actions_on",)
+
     def __init__(self):
         self._trigger_actions_on = []
-        self.json = {
-            "trigger_actions_on": self._trigger_actions_on
+
+    @property
+    def json(self) -> dict:
+        """
+        The object as a Slack API dict, built from the current attributes
+        """
+        return {
+            "trigger_actions_on": list(self._trigger_actions_on)
         }
 
     def set_triggers(self, *triggers) -> Self:
@@ -22,5 +29,4 @@ class DispatchActionConfig:
         """
         for trigger in triggers:
             self._trigger_actions_on.append(trigger)
-        self.json["trigger_actions_on"] = self._trigger_actions_on
         return self
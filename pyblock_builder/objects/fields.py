@@ -1,7 +1,6 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
 from pyblock_builder.objects.text import Text
 
@@ -11,8 +10,17 @@ class Fields:
     A Python class representing a Fields object from the Slack BlockKit UI framework\n
     Can be added to: Section
     """
+    __slots__ = ("_fields",)
+
     def __init__(self):
-        self.fields = []
+        self._fields = []
+
+    @property
+    def fields(self) -> list:
+        """
+        The fields as a list of Slack API Text dicts, built from the current attributes
+        """
+        return [field.json for field in self._fields]
 
     def add_field(self, text: str, mrkdwn=True) -> Self:
         """
@@ -25,6 +33,6 @@ class Fields:
             text = Text().set_text(text)
         else:
             text = Text().set_text(text).as_mrkdwn()
-        self.fields.append(text.json)
+        self._fields.append(text)
         return self
 
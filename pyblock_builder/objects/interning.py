@@ -0,0 +1,163 @@
+import threading
+from pyblock_builder.objects import text as _text_module
+from pyblock_builder.objects.option import Option
+from pyblock_builder.objects.text import Text
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} objects are shared between surfaces and cannot be modified; "
+                    f"get a different one from the InternPool instead")
+
+
+class SharedText(Text):
+    """
+    A read-only Text returned by an InternPool. The same instance is handed out for every identical label, so its
+    setters raise TypeError.
+    """
+    __slots__ = ()
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    as_mrkdwn = _read_only
+    set_text = _read_only
+    escape_emojis = _read_only
+    is_verbatim = _read_only
+
+
+class SharedOption(Option):
+    """
+    A read-only Option returned by an InternPool. The same instance is handed out for every identical option, so
+    its setters raise TypeError.
+    """
+    __slots__ = ()
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    set_text = _read_only
+    set_value = _read_only
+    set_url = _read_only
+    set_description = _read_only
+
+
+class InternPool:
+    """
+    A bounded LRU of shared, read-only Text and Option objects keyed by their content. Building the same option
+    lists and labels through a pool returns one object per distinct value instead of a new one on every call, and
+    their JSON is identical to that of the objects they stand in for. One pool may be shared by many threads.
+    """
+    def __init__(self, max_entries: int = 4096):
+        """
+        :param max_entries: (Optional) Integer; number of distinct objects to keep before evicting the least recently
+        used; defaults to 4096
+        """
+        self._max_entries = max_entries
+        self._objects = {}
+        self._lock = threading.Lock()
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "evicted": 0,
+        }
+
+    @property
+    def counters(self) -> dict:
+        """
+        A snapshot of the counters: hits, misses and evicted.
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def text(self, text: str, mrkdwn=False) -> SharedText:
+        """
+        Returns the shared Text object for the given text
+        :param text: String; must be between 1 and 3,000 characters.
+        :param mrkdwn: Boolean; defaults to False
+        :return: SharedText
+        """
+        key = ("text", text, mrkdwn)
+        shared = self._get(key)
+        if shared is None:
+            shared = SharedText()
+            Text.set_text(shared, text)
+            if mrkdwn:
+                Text.as_mrkdwn(shared)
+            shared = self._put(key, shared)
+        return shared
+
+    def option(self, text: str, value: str, description: str = None, url: str = None, mrkdwn=False) -> SharedOption:
+        """
+        Returns the shared Option object for the given text and value
+        :param text: String, max 75 chars
+        :param value: String; max 75 chars
+        :param description: (Optional) String; max 75 chars
+        :param url: (Optional) String; max 3,000 chars, only available in overflow menus
+        :param mrkdwn: Boolean; defaults to False -- must be False for Overflow, Select, and Multi-Select Menus
+        :return: SharedOption
+        """
+        key = ("option", text, value, description, url, mrkdwn)
+        shared = self._get(key)
+        if shared is None:
+            shared = SharedOption()
+            shared._text = self.text(text, mrkdwn)
+            shared._value = value
+            if description is not None:
+                shared._description = self.text(description)
+            shared._url = url
+            shared = self._put(key, shared)
+        return shared
+
+    def clear(self):
+        """
+        Drops every pooled object. Objects already handed out stay valid.
+        """
+        with self._lock:
+            self._objects.clear()
+
+    def _get(self, key: tuple):
+        with self._lock:
+            shared = self._objects.pop(key, None)
+            if shared is None:
+                self._counters["misses"] += 1
+                return None
+            self._objects[key] = shared
+            self._counters["hits"] += 1
+            return shared
+
+    def _put(self, key: tuple, shared):
+        with self._lock:
+            # Another thread may have built the same object in the meantime; keep the one already handed out
+            shared = self._objects.setdefault(key, shared)
+            while len(self._objects) > self._max_entries:
+                del self._objects[next(iter(self._objects))]
+                self._counters["evicted"] += 1
+            return shared
+
+
+def enable_interning(pool: InternPool = None) -> InternPool:
+    """
+    Makes the labels, placeholders and option texts that builder setters create come from a shared InternPool, i.e.
+    Button.set_label(), set_placeholder_text(), Option.set_text() and Modal.set_title(). Section text, fields and
+    other free-form content are never interned.
+    :param pool: (Optional) InternPool to install; defaults to a new one
+    :return: the installed InternPool
+    """
+    _text_module._pool = pool if pool is not None else InternPool()
+    return _text_module._pool
+
+
+def disable_interning():
+    """
+    Stops interning labels created by builder setters. Objects already handed out stay valid.
+    """
+    _text_module._pool = None
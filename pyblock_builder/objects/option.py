@@ -1,24 +1,49 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
-from pyblock_builder.objects.text import Text
+from pyblock_builder.objects.text import _auto_escape_md, label
+
+
+def as_list(column) -> list:
+    """
+    Converts a column of values to a list of plain Python objects. NumPy arrays and pandas Series are converted in a
+    single call to their tolist() method, which also turns NumPy scalars into Python ones.
+    :param column: List, tuple, other iterable, or NumPy-style array
+    :return: list
+    """
+    tolist = getattr(column, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    return column if type(column) is list else list(column)
 
 
 class Option:
     """
     A Python class representing an Option object from the Slack BlockKit UI framework
     """
+    __slots__ = ("_text", "_value", "_description", "_url")
+
     def __init__(self):
-        self._text = {}
+        self._text = None
         self._value = ""
         self._description = None
         self._url = None
-        self.json = {
-            "text": self._text,
+
+    @property
+    def json(self) -> dict:
+        """
+        The object as a Slack API dict, built from the current attributes
+        """
+        json = {
+            "text": self._text.json if self._text is not None else {},
             "value": self._value
         }
+        if self._description is not None:
+            json["description"] = self._description.json
+        if self._url is not None:
+            json["url"] = self._url
+        return json
 
     def set_text(self, text: str, mrkdwn=False) -> Self:
         """
@@ -27,11 +52,7 @@ class Option:
         :param mrkdwn: Boolean; defaults to False -- must be False for Overflow, Select, and Multi-Select Menus, can be True for Radio Buttons and Checkboxes
         :return: self
         """
-        if not mrkdwn:
-            self._text = Text().set_text(text)
-        else:
-            self._text = Text().set_text(text).as_mrkdwn()
-        self.json["text"] = self._text.json
+        self._text = label(text, mrkdwn)
         return self
 
     def set_value(self, value: str) -> Self:
@@ -41,7 +62,6 @@ class Option:
         :return: self
         """
         self._value = value
-        self.json["value"] = self._value
         return self
 
     def set_url(self, target_url: str) -> Self:
@@ -51,15 +71,159 @@ class Option:
         :return: self
         """
         self._url = target_url
-        self.json["url"] = self._url
         return self
 
-    def set_description(self, descriptive_text: str) -> Self:
+    def set_description(self, descriptive_text: str, mrkdwn=False) -> Self:
         """
         (Optional) Sets the text to be shown below the Option's text beside a radio button
         :param descriptive_text: String; max 75 chars
+        :param mrkdwn: Boolean; defaults to False -- can be True for Radio Buttons and Checkboxes
         :return: self
         """
-        self._description = Text().set_text(descriptive_text)
-        self.json["description"] = self._description.json
+        self._description = label(descriptive_text, mrkdwn)
         return self
+
+
+    @classmethod
+    def from_columns(cls, texts, values, descriptions=None, urls=None, mrkdwn=False) -> OptionList:
+        """
+        Builds many options at once from parallel columns, without creating an Option and Text object per row.
+        Values that are not strings, i.e. the integers of a NumPy ID column, are converted with str().
+        :param texts: Sequence or NumPy-style array of Strings; max 75 chars each
+        :param values: Sequence or NumPy-style array of values; max 75 chars each
+        :param descriptions: (Optional) Sequence or NumPy-style array of Strings or None; max 75 chars each
+        :param urls: (Optional) Sequence or NumPy-style array of Strings or None; only available in overflow menus
+        :param mrkdwn: Boolean; defaults to False -- must be False for Overflow, Select, and Multi-Select Menus
+        :return: OptionList
+        """
+        return OptionList(texts, values, descriptions, urls, mrkdwn)
+
+    @classmethod
+    def from_records(cls, records, mrkdwn=False) -> OptionList:
+        """
+        Builds many options at once from records. Each record is either a tuple of (text, value), (text, value,
+        description) or (text, value, description, url), or a dict with "text" and "value" keys and optional
+        "description" and "url" keys. NumPy structured arrays are accepted as well.
+        :param records: Sequence or NumPy-style array of records
+        :param mrkdwn: Boolean; defaults to False -- must be False for Overflow, Select, and Multi-Select Menus
+        :return: OptionList
+        """
+        texts, values, descriptions, urls = [], [], [], []
+        for record in as_list(records):
+            if isinstance(record, dict):
+                texts.append(record["text"])
+                values.append(record["value"])
+                descriptions.append(record.get("description"))
+                urls.append(record.get("url"))
+            else:
+                texts.append(record[0])
+                values.append(record[1])
+                descriptions.append(record[2] if len(record) > 2 else None)
+                urls.append(record[3] if len(record) > 3 else None)
+        if not any(description is not None for description in descriptions):
+            descriptions = None
+        if not any(url is not None for url in urls):
+            urls = None
+        return OptionList(texts, values, descriptions, urls, mrkdwn)
+
+
+class OptionList:
+    """
+    Many options stored as parallel columns instead of one Option object each, as returned by Option.from_columns()
+    and Option.from_records(). Pass it as a single argument to set_options() of a menu, option group, checkboxes or
+    radio buttons, and all of its options are rendered to JSON in one pass. It also behaves as a read-only sequence
+    of Option objects, which are built when accessed.
+    """
+    __slots__ = ("_texts", "_values", "_descriptions", "_urls", "_mrkdwn")
+
+    def __init__(self, texts, values, descriptions=None, urls=None, mrkdwn=False):
+        """
+        :param texts: Sequence or NumPy-style array of Strings; max 75 chars each
+        :param values: Sequence or NumPy-style array of values; converted with str() if not strings
+        :param descriptions: (Optional) Sequence or NumPy-style array of Strings or None; converted with str() if not
+        strings
+        :param urls: (Optional) Sequence or NumPy-style array of Strings or None
+        :param mrkdwn: Boolean; defaults to False; mrkdwn texts and descriptions are escaped while
+        md.enable_auto_escape() is in effect
+        """
+        self._texts = [text if isinstance(text, str) else str(text) for text in as_list(texts)]
+        md = _auto_escape_md() if mrkdwn else None
+        if md is not None:
+            # Marked as Escaped, so that the Option built when one is accessed does not escape its text again
+            self._texts = md.escape_all(self._texts)
+        self._values = [value if type(value) is str else str(value) for value in as_list(values)]
+        if descriptions is not None:
+            descriptions = [description if description is None or isinstance(description, str) else str(description)
+                            for description in as_list(descriptions)]
+            if md is not None:
+                escaped = iter(md.escape_all([description for description in descriptions if description is not None]))
+                descriptions = [description if description is None else next(escaped) for description in descriptions]
+        self._descriptions = descriptions
+        self._urls = as_list(urls) if urls is not None else None
+        self._mrkdwn = mrkdwn
+        count = len(self._texts)
+        if len(self._values) != count or any(
+                column is not None and len(column) != count for column in (self._descriptions, self._urls)):
+            raise ValueError("All option columns must have the same length")
+
+    @property
+    def json(self) -> list:
+        """
+        The options as a list of Slack API dicts, built from the columns in one pass
+        """
+        text_type = "mrkdwn" if self._mrkdwn else "plain_text"
+        if self._descriptions is None and self._urls is None:
+            return [{"text": {"type": text_type, "text": text}, "value": value}
+                    for text, value in zip(self._texts, self._values)]
+
+        json = []
+        count = len(self._texts)
+        descriptions = self._descriptions if self._descriptions is not None else [None] * count
+        urls = self._urls if self._urls is not None else [None] * count
+        for text, value, description, url in zip(self._texts, self._values, descriptions, urls):
+            option = {"text": {"type": text_type, "text": text}, "value": value}
+            if description is not None:
+                option["description"] = {"type": text_type, "text": description}
+            if url is not None:
+                option["url"] = url
+            json.append(option)
+        return json
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __getitem__(self, index) -> Option | OptionList:
+        if isinstance(index, slice):
+            # Sliced columns are copied as they are, as __init__ would convert and escape the texts a second time
+            options = object.__new__(OptionList)
+            options._texts = self._texts[index]
+            options._values = self._values[index]
+            options._descriptions = self._descriptions[index] if self._descriptions is not None else None
+            options._urls = self._urls[index] if self._urls is not None else None
+            options._mrkdwn = self._mrkdwn
+            return options
+        option = Option().set_text(self._texts[index], self._mrkdwn).set_value(self._values[index])
+        if self._descriptions is not None and self._descriptions[index] is not None:
+            option.set_description(self._descriptions[index], self._mrkdwn)
+        if self._urls is not None and self._urls[index] is not None:
+            option.set_url(self._urls[index])
+        return option
+
+    def __iter__(self):
+        for index in range(len(self._texts)):
+            yield self[index]
+
+
+def options_json(options: list) -> list:
+    """
+    Renders a list of Option objects and OptionLists to a flat list of option dicts
+    :param options: List of Option objects and OptionLists
+    :return: list
+    """
+    json = []
+    for option in options:
+        if type(option) is OptionList:
+            json.extend(option.json)
+        else:
+            json.append(option.json)
+    return json
@@ -1,21 +1,29 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
-from pyblock_builder.objects.text import Text
+from pyblock_builder.objects.option import Option, OptionList, as_list, options_json
+from pyblock_builder.objects.text import label
 
 
 class OptionGroup:
     """
     A Python class representing an Option Group object from the Slack BlockKit UI framework
     """
+    __slots__ = ("_label", "_options")
+
     def __init__(self):
-        self._label = {}
+        self._label = None
         self._options = []
-        self.json = {
-            "label": self._label,
-            "options": self._options
+
+    @property
+    def json(self) -> dict:
+        """
+        The object as a Slack API dict, built from the current attributes
+        """
+        return {
+            "label": self._label.json if self._label is not None else {},
+            "options": options_json(self._options)
         }
 
     def set_label(self, label_text: str) -> Self:
@@ -24,17 +32,35 @@ class OptionGroup:
         :param label_text: String; max 75 chars
         :return: self
         """
-        self._label = Text().set_text(label_text)
-        self.json["label"] = self._label.json
+        self._label = label(label_text)
         return self
 
     def set_options(self, *options) -> Self:
         """
         Sets the options belonging to this specific group
-        :param options: One or more Option objects; maximum of 100 items; preface with * if passing in a list
+        :param options: One or more Option objects or OptionLists; maximum of 100 items; preface with * if passing in a list
         :return: self
         """
         for option in options:
-            self._options.append(option.json)
-        self.json["options"] = self._options
+            self._options.append(option)
         return self
+
+    @classmethod
+    def from_mapping(cls, mapping: dict) -> list[OptionGroup]:
+        """
+        Builds one OptionGroup per entry of a mapping of group labels to the options in that group. The options of a
+        group may be given as a dict of option texts to values, as records accepted by Option.from_records(), or as
+        Option objects.
+        :param mapping: Dict of label String to the options of that group; maximum of 100 groups and 100 options each
+        :return: List of OptionGroup objects
+        """
+        groups = []
+        for label_text, options in mapping.items():
+            if isinstance(options, dict):
+                options = [Option.from_columns(list(options), list(options.values()))]
+            else:
+                options = as_list(options)
+                if not options or not isinstance(options[0], (Option, OptionList)):
+                    options = [Option.from_records(options)]
+            groups.append(cls().set_label(label_text).set_options(*options))
+        return groups
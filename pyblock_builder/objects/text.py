@@ -1,40 +1,70 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
+import sys
+
+# md can only have enabled auto-escape once it has been imported, so it is looked up in sys.modules instead of
+# imported, keeping the mrkdwn package out of imports that only build elements
+_MD = "pyblock_builder.mrkdwn.md"
+
+
+def _auto_escape_md():
+    """
+    Returns the md module while md.enable_auto_escape() is in effect, else None
+    """
+    md = sys.modules.get(_MD)
+    return md if md is not None and md._auto_escape else None
+
 
 class Text:
     """
     A Python class representing a Text object from the Slack BlockKit UI framework
     """
+    __slots__ = ("_type", "_text", "_emoji", "_verbatim")
+
     def __init__(self):
         self._type = "plain_text"
         self._text = ""
         self._emoji = True
         self._verbatim = False
-        self.json = {
+
+    @property
+    def json(self) -> dict:
+        """
+        The object as a Slack API dict, built from the current attributes
+        """
+        json = {
             "type": self._type,
             "text": self._text
         }
+        if not self._emoji:
+            json["emoji"] = self._emoji
+        if self._verbatim:
+            json["verbatim"] = self._verbatim
+        return json
 
     def as_mrkdwn(self) -> Self:
         """
         (Optional) Sets the formatting of the object to "mrkdwn". The object will be of type plain_text if unused.
+        While md.enable_auto_escape() is in effect, text already set is escaped unless it is md.Escaped.
         :return: self
         """
+        md = _auto_escape_md()
+        if md is not None and self._type != "mrkdwn":
+            self._text = md._escape(self._text)
         self._type = "mrkdwn"
-        self.json['type'] = self._type
         return self
 
     def set_text(self, text: str) -> Self:
         """
         (Required) Sets the text for the object. May include Slack standard text formatting markup when using as_mrkdwn().
-        :param text: String; must be between 1 and 3,000 characters.
+        :param text: String; must be between 1 and 3,000 characters. Escaped with md.escape() if the object is mrkdwn
+        and md.enable_auto_escape() is in effect.
         :return: self
         """
-        self._text = text
-        self.json['text'] = self._text
+        md = sys.modules.get(_MD)
+        self._text = md._escape(text) if md is not None and md._auto_escape and self._type == "mrkdwn" else text
         return self
 
     def escape_emojis(self) -> Self:
@@ -44,7 +74,6 @@ class Text:
         :return: self
         """
         self._emoji = False
-        self.json["emoji"] = self._emoji
         return self
 
     def is_verbatim(self) -> Self:
@@ -54,5 +83,23 @@ class Text:
         :return: self
         """
         self._verbatim = True
-        self.json["verbatim"] = self._verbatim
         return self
+
+
+# The InternPool installed by enable_interning(), if any
+_pool = None
+
+
+def label(text: str, mrkdwn=False) -> Text:
+    """
+    Builds the Text object for a short label, placeholder or option text. While interning is enabled, an identical
+    shared Text is returned from the installed InternPool instead of a new object.
+    :param text: String
+    :param mrkdwn: Boolean; defaults to False
+    :return: Text
+    """
+    if _pool is not None:
+        return _pool.text(text, mrkdwn)
+    if mrkdwn:
+        return Text().set_text(text).as_mrkdwn()
+    return Text().set_text(text)
@@ -0,0 +1,22 @@
+from pyblock_builder import _lazy
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .encoder import dumps, get_backend, loads, set_backend
+    from .frozen import Frozen
+    from .parser import LazyNode, from_dict, from_json
+
+_EXPORTS = {
+    "Frozen": ".frozen",
+    "dumps": ".encoder",
+    "get_backend": ".encoder",
+    "loads": ".encoder",
+    "set_backend": ".encoder",
+    "LazyNode": ".parser",
+    "from_dict": ".parser",
+    "from_json": ".parser",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = _lazy.lazy_module(__name__, _EXPORTS)
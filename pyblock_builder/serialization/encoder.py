@@ -0,0 +1,83 @@
+# The encoder is picked on first use rather than at import, so that importing the builder classes stays cheap
+_backend = "auto"
+_name = None
+_dumps = None
+_loads = None
+
+
+def _stdlib_dumps(value) -> bytes:
+    import json
+
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _load(backend):
+    """
+    Resolves a backend setting to its name and encoding function
+    :param backend: "auto", "orjson", "json" or a callable
+    :return: Tuple of the backend name and a callable returning bytes
+    """
+    if callable(backend):
+        return getattr(backend, "__name__", repr(backend)), backend
+    if backend == "json":
+        return "json", _stdlib_dumps
+    if backend in ("auto", "orjson"):
+        try:
+            import orjson
+        except ImportError:
+            if backend == "orjson":
+                raise
+            return "json", _stdlib_dumps
+        return "orjson", orjson.dumps
+    raise ValueError(f"Unknown JSON backend: {backend}. Must be one of auto, orjson, json or a callable")
+
+
+def set_backend(backend="auto"):
+    """
+    Sets the encoder used by dumps(), to_json_bytes() and pre-encoded surfaces.
+    :param backend: "auto" to use orjson when it is installed and the standard library json module otherwise;
+    "orjson" to require orjson; "json" for the standard library; or a callable that takes a value and returns compact
+    JSON bytes. Defaults to "auto".
+    """
+    global _backend, _name, _dumps
+    _name, _dumps = _load(backend)
+    _backend = backend
+
+
+def get_backend() -> str:
+    """
+    Returns the name of the encoder dumps() currently uses: "orjson", "json", or the name of a custom callable
+    :return: str
+    """
+    if _dumps is None:
+        set_backend(_backend)
+    return _name
+
+
+def dumps(value) -> bytes:
+    """
+    Encodes a value to compact UTF-8 JSON bytes with the configured backend
+    :param value: A JSON-serializable value, i.e. a block, element or view dict
+    :return: bytes
+    """
+    if _dumps is None:
+        set_backend(_backend)
+    return _dumps(value)
+
+
+def loads(data: str | bytes):
+    """
+    Decodes JSON with orjson when it is installed, or the standard library json module otherwise
+    :param data: String or bytes of JSON, i.e. a stored view or a request body
+    :return: The decoded value
+    """
+    global _loads
+    if _loads is None:
+        try:
+            import orjson
+        except ImportError:
+            import json
+            _loads = json.loads
+        else:
+            _loads = orjson.loads
+    return _loads(data)
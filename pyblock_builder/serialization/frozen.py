@@ -0,0 +1,91 @@
+# json is imported where it is used so that importing the builder classes, which all reference Frozen, stays cheap
+from pyblock_builder.serialization.encoder import dumps
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError("Frozen fragments cannot be modified")
+
+
+class Frozen(dict):
+    """
+    A block or element encoded to JSON once, as returned by the freeze() method of blocks and elements. It behaves
+    as a read-only dict and can be passed anywhere the original object could, i.e. to add_blocks() on a surface or
+    add_elements() on an Actions block. Surfaces splice its pre-encoded bytes into the request body instead of
+    encoding it again.
+    """
+    __slots__ = ("encoded",)
+
+    def __init__(self, value: dict):
+        """
+        :param value: The JSON dict of a block or element; later changes to it do not affect the frozen copy
+        """
+        import json
+
+        encoded = dumps(value)
+        super().__init__(json.loads(encoded))
+        self.encoded = encoded
+
+    @property
+    def block(self) -> "Frozen":
+        return self
+
+    @property
+    def json(self) -> "Frozen":
+        return self
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return Frozen, (dict(self),)
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+
+def has_frozen(blocks: list) -> bool:
+    """
+    Checks whether a list of blocks contains any Frozen fragments
+    :param blocks: List of block dicts
+    :return: bool
+    """
+    for block in blocks:
+        if type(block) is Frozen:
+            return True
+    return False
+
+
+def encode_blocks(blocks: list) -> str:
+    """
+    Encodes a list of blocks to a JSON array, splicing in the pre-encoded bytes of Frozen fragments as they are
+    :param blocks: List of block dicts and Frozen fragments
+    :return: str
+    """
+    parts = []
+    for block in blocks:
+        if type(block) is Frozen:
+            parts.append(block.encoded)
+        else:
+            parts.append(dumps(block))
+    return (b"[" + b",".join(parts) + b"]").decode()
+
+
+def encode_view(view: dict) -> str:
+    """
+    Encodes a view to a JSON object, splicing in the pre-encoded bytes of any Frozen blocks
+    :param view: View dict with a "blocks" list
+    :return: str
+    """
+    fields = {key: value for key, value in view.items() if key != "blocks"}
+    encoded = dumps(fields).decode()
+    separator = "," if fields else ""
+    return f'{encoded[:-1]}{separator}"blocks":{encode_blocks(view.get("blocks", []))}}}'
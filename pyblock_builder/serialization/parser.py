@@ -0,0 +1,225 @@
+from pyblock_builder.serialization.encoder import loads
+
+# Builder classes by the "type" of the JSON they load, as (module, class name). Modules are imported on first use.
+SURFACES = {
+    "modal": ("pyblock_builder.surfaces.modal", "Modal"),
+    "home": ("pyblock_builder.surfaces.app_home", "AppHome"),
+    "message": ("pyblock_builder.surfaces.message", "Message"),
+}
+BLOCKS = {
+    "actions": ("pyblock_builder.blocks.actions", "Actions"),
+    "context": ("pyblock_builder.blocks.context", "Context"),
+    "divider": ("pyblock_builder.blocks.divider", "Divider"),
+    "file": ("pyblock_builder.blocks.file", "File"),
+    "header": ("pyblock_builder.blocks.header", "Header"),
+    "image": ("pyblock_builder.blocks.image", "Image"),
+    "input": ("pyblock_builder.blocks.input", "Input"),
+    "section": ("pyblock_builder.blocks.section", "Section"),
+    "video": ("pyblock_builder.blocks.video", "Video"),
+}
+ELEMENTS = {
+    "button": ("pyblock_builder.elements.button", "Button"),
+    "checkboxes": ("pyblock_builder.elements.checkboxes", "Checkboxes"),
+    "datepicker": ("pyblock_builder.elements.date_picker", "DatePicker"),
+    "datetimepicker": ("pyblock_builder.elements.datetime_picker", "DatetimePicker"),
+    "email_text_input": ("pyblock_builder.elements.email_input", "EmailInput"),
+    "image": ("pyblock_builder.elements.image", "ImageElement"),
+    "multi_static_select": ("pyblock_builder.elements.multiselect_menu", "MultiStaticSelect"),
+    "multi_users_select": ("pyblock_builder.elements.multiselect_menu", "MultiUsersSelect"),
+    "multi_conversations_select": ("pyblock_builder.elements.multiselect_menu", "MultiConversationsSelect"),
+    "multi_channels_select": ("pyblock_builder.elements.multiselect_menu", "MultiChannelsSelect"),
+    "number_input": ("pyblock_builder.elements.number_input", "NumberInput"),
+    "overflow": ("pyblock_builder.elements.overflow_menu", "OverflowMenu"),
+    "plain_text_input": ("pyblock_builder.elements.plain_text_input", "PlainTextInput"),
+    "radio_buttons": ("pyblock_builder.elements.radio_buttons", "RadioButtons"),
+    "static_select": ("pyblock_builder.elements.select_menu", "StaticSelectMenu"),
+    "users_select": ("pyblock_builder.elements.select_menu", "UsersSelectMenu"),
+    "conversations_select": ("pyblock_builder.elements.select_menu", "ConversationsSelectMenu"),
+    "channels_select": ("pyblock_builder.elements.select_menu", "ChannelsSelectMenu"),
+    "timepicker": ("pyblock_builder.elements.time_picker", "TimePicker"),
+    "url_text_input": ("pyblock_builder.elements.url_input", "UrlInput"),
+    "plain_text": ("pyblock_builder.objects.text", "Text"),
+    "mrkdwn": ("pyblock_builder.objects.text", "Text"),
+}
+# Composition objects have no "type" of their own, so they are named by the field that holds them
+OBJECTS = {
+    "text": ("pyblock_builder.objects.text", "Text"),
+    "option": ("pyblock_builder.objects.option", "Option"),
+    "option_group": ("pyblock_builder.objects.option_group", "OptionGroup"),
+    "confirm": ("pyblock_builder.objects.confirmation_dialog", "ConfirmationDialog"),
+    "filter": ("pyblock_builder.objects.conversations_filter", "ConversationsFilter"),
+    "dispatch_action_config": ("pyblock_builder.objects.dispatch_action_configuration", "DispatchActionConfig"),
+}
+
+# What each JSON key holds, as the kind of the node(s) in it: "block", "element", "fields" or one of OBJECTS. Keys
+# not listed hold plain values. A key is stored in the "_" + key attribute of the builder unless RENAMED says
+# otherwise, and keys the builder has no attribute for, i.e. the id and state of a view from the API, are skipped.
+CHILDREN = {
+    "blocks": "block",
+    "elements": "element",
+    "element": "element",
+    "accessory": "element",
+    "text": "text",
+    "title": "text",
+    "label": "text",
+    "hint": "text",
+    "description": "text",
+    "placeholder": "text",
+    "submit": "text",
+    "close": "text",
+    "fields": "fields",
+    "options": "option",
+    "initial_options": "option",
+    "initial_option": "option",
+    "option_groups": "option_group",
+    "confirm": "confirm",
+    "filter": "filter",
+    "dispatch_action_config": "dispatch_action_config",
+}
+# Keys that hold something else, or go to another attribute, in one builder class
+RENAMED = {
+    ("ConfirmationDialog", "confirm"): ("_confirm_text", "text"),
+    ("ConfirmationDialog", "deny"): ("_deny_text", "text"),
+    ("ConversationsFilter", "include"): ("_included_conversations", None),
+    ("Message", "attachments"): ("attachments", None),
+}
+
+_classes = {}
+
+
+def _class(entry: tuple):
+    cls = _classes.get(entry)
+    if cls is None:
+        from importlib import import_module
+
+        cls = _classes[entry] = getattr(import_module(entry[0]), entry[1])
+    return cls
+
+
+class LazyNode:
+    """
+    A block, element or composition object parsed from JSON that is only turned into its builder object when it is
+    first used as one, i.e. when one of its setters is called. Until then it renders as the dict it was parsed from,
+    so the parts of a parsed surface that are not changed cost nothing to load or to render again. The dict is not
+    copied, so it must not be changed after parsing.
+    """
+    __slots__ = ("_value", "_kind", "_object")
+
+    def __init__(self, value: dict, kind: str):
+        """
+        :param value: JSON dict of the node
+        :param kind: "block", "element" or one of the composition object kinds in OBJECTS
+        """
+        self._value = value
+        self._kind = kind
+        self._object = None
+
+    @property
+    def block(self) -> dict:
+        return self._value if self._object is None else self._object.block
+
+    @property
+    def json(self) -> dict:
+        return self._value if self._object is None else self._object.json
+
+    @property
+    def materialized(self) -> bool:
+        return self._object is not None
+
+    def materialize(self):
+        """
+        Builds the builder object for this node, once
+        :return: The builder object, i.e. a Section
+        """
+        if self._object is None:
+            self._object = _build(self._value, self._kind)
+        return self._object
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+    def __repr__(self):
+        return f"LazyNode({self._value!r})" if self._object is None else f"LazyNode({self._object!r})"
+
+
+def _load(value, kind: str):
+    """
+    Wraps the value of a JSON key in lazy nodes of the given kind
+    """
+    if kind == "fields":
+        fields = _class(("pyblock_builder.objects.fields", "Fields"))()
+        fields._fields = [LazyNode(item, "text") for item in value]
+        return fields
+    if type(value) is list:
+        return [LazyNode(item, kind) for item in value]
+    return LazyNode(value, kind)
+
+
+def _build(value: dict, kind: str):
+    """
+    Builds the builder object of a JSON dict, leaving its children as lazy nodes
+    :param value: JSON dict
+    :param kind: "surface", "block", "element" or one of the composition object kinds in OBJECTS
+    """
+    if kind in OBJECTS:
+        entry = OBJECTS[kind]
+    else:
+        table = SURFACES if kind == "surface" else BLOCKS if kind == "block" else ELEMENTS
+        entry = table.get(value.get("type"))
+        if entry is None:
+            raise ValueError(f"Unknown {kind} type: {value.get('type')}. Must be one of {', '.join(table)}")
+    built = _class(entry)()
+    class_name = entry[1]
+    for key, item in value.items():
+        renamed = RENAMED.get((class_name, key))
+        if renamed is not None:
+            attribute, kind = renamed
+        else:
+            attribute, kind = "_" + key, CHILDREN.get(key)
+        if kind is not None:
+            if type(item) is list:
+                item = _load(item, kind)
+            elif type(item) is dict:
+                # Builders render their unset composition objects as {}
+                item = _load(item, kind) if item else None
+        try:
+            setattr(built, attribute, item)
+        except AttributeError:
+            pass
+    return built
+
+
+def from_dict(value: dict, kind: str = None):
+    """
+    Loads a Slack API dict into builder objects, i.e. body["view"] into a Modal or a stored block into a Section.
+    Only the top-level object is built; its blocks, elements and composition objects are loaded as LazyNodes, which
+    build their own builder object the first time one of its setters or attributes is used.
+    :param value: Dict of a view, block, element or composition object; chat.* payloads and messages need kind
+    :param kind: (Optional) What the dict is: "surface", "block" or "element" to pick a class by its "type", or one of
+    "message", "option", "option_group", "confirm", "filter", "dispatch_action_config" or "text". Defaults to looking
+    the "type" up in views, then blocks, then elements, so an "image" is loaded as an Image block.
+    :return: The builder object, i.e. Modal, Section or StaticSelectMenu
+    """
+    if kind == "message":
+        return _build({**value, "type": "message"}, "surface")
+    if kind is None:
+        value_type = value.get("type")
+        if value_type in SURFACES:
+            kind = "surface"
+        elif value_type in BLOCKS:
+            kind = "block"
+        else:
+            kind = "element"
+    return _build(value, kind)
+
+
+def from_json(data, kind: str = None):
+    """
+    Decodes JSON and loads it into builder objects. See from_dict().
+    :param data: String or bytes of JSON, i.e. a view exported from Block Kit Builder
+    :param kind: (Optional) See from_dict()
+    :return: The builder object
+    """
+    return from_dict(loads(data), kind)
@@ -1,3 +1,26 @@
-from .app_home import AppHome
-from .message import Message
-from .modal import Modal
\ No newline at end of file
+from pyblock_builder import _lazy
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .app_home import AppHome
+    from .budget import BlockKitLimitError
+    from .message import Message, PostResult
+    from .modal import Modal
+    from .validation import BlockKitValidationError, validate
+    from .view_state import StateSchema, ViewState
+
+_EXPORTS = {
+    "AppHome": ".app_home",
+    "BlockKitLimitError": ".budget",
+    "Message": ".message",
+    "PostResult": ".message",
+    "Modal": ".modal",
+    "BlockKitValidationError": ".validation",
+    "validate": ".validation",
+    "StateSchema": ".view_state",
+    "ViewState": ".view_state",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = _lazy.lazy_module(__name__, _EXPORTS)
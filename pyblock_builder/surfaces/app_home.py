@@ -1,25 +1,49 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
+from pyblock_builder.delivery.dispatch import send, send_async
+from pyblock_builder.serialization import parser
+from pyblock_builder.serialization.encoder import dumps, loads
+from pyblock_builder.serialization.frozen import encode_view, has_frozen
+from pyblock_builder.surfaces.budget import MAX_BLOCKS
+from pyblock_builder.surfaces.surface import Surface
+from pyblock_builder.surfaces.validation import BlockKitValidationError, validate
 
 
-class AppHome:
+class AppHome(Surface):
     """
     A Python class representing an App Home surface from the Slack BlockKit UI framework
     """
+    __slots__ = ("_type", "_callback_id", "_private_metadata", "_external_id", "_rate_limiter", "_retry_policy",
+                 "_pre_encoded", "_validate_before_send")
+
     def __init__(self):
+        super().__init__(MAX_BLOCKS["home"])
         self._type = "home"
         self._callback_id = ""
-        self.blocks = []
         self._private_metadata = ""
         self._external_id = ""
-        self.view = {
+        self._rate_limiter = None
+        self._retry_policy = None
+        self._pre_encoded = False
+        self._validate_before_send = False
+
+    @property
+    def view(self) -> dict:
+        """
+        The view as a Slack API dict, built from the current attributes
+        """
+        view = {
             "type": self._type,
             "callback_id": self._callback_id,
             "blocks": self.blocks
         }
+        if self._private_metadata:
+            view["private_metadata"] = self._private_metadata
+        if self._external_id:
+            view["external_id"] = self._external_id
+        return view
 
     def set_callback_id(self, callback_id: str) -> Self:
         """
@@ -29,7 +53,6 @@ class AppHome:
         :return: self
         """
         self._callback_id = callback_id
-        self.view["callback_id"] = self._callback_id
         return self
 
     def set_external_id(self, external_id: str) -> Self:
@@ -39,7 +62,6 @@ class AppHome:
         :return: self
         """
         self._external_id = external_id
-        self.view["external_id"] = self._external_id
         return self
 
     def set_private_metadata(self, metadata: str) -> Self:
@@ -50,38 +72,165 @@ class AppHome:
         :return: self
         """
         self._private_metadata = metadata
-        self.view["private_metadata"] = self._private_metadata
         return self
 
-    def add_blocks(self, *blocks) -> Self:
+    def set_rate_limiter(self, rate_limiter) -> Self:
         """
-        (Required) Adds the blocks that define the content of the View.
-        :param blocks: One or more blocks; max 100; preface with * if passing in a list.
+        (Optional) Paces all Web API calls made by this view through a client-side rate limiter.
+        :param rate_limiter: RateLimiter object, or None to disable
         :return: self
         """
-        for block in blocks:
-            self.blocks.append(block.block)
-        self.view["blocks"] = self.blocks
+        self._rate_limiter = rate_limiter
         return self
 
-    def publish_view(self, slack_client, payload, logger):
+    def set_retry_policy(self, retry_policy) -> Self:
         """
-        Uses the attributes set on the class to generate a view payload and passes it to the views.publish Web API
-        methods of the Slack Bolt for Python client.
+        (Optional) Retries Web API calls made by this view that fail with rate limit or transient server errors.
+        :param retry_policy: RetryPolicy object, or None to disable
+        :return: self
+        """
+        self._retry_policy = retry_policy
+        return self
+
+    def validate(self) -> list:
+        """
+        Checks the view against Slack's Block Kit rules in a single pass over it: required keys, maximum lengths and
+        item counts, which elements each block accepts, which blocks the surface accepts, and unique block_ids.
+        :return: List of (JSON pointer, message) tuples, i.e. ("/blocks/3/element", "missing required key"); empty
+        when the view is valid
+        """
+        return validate(self.view)
+
+    def validate_before_send(self) -> Self:
+        """
+        (Optional) Validates the view before every Web API call and raises BlockKitValidationError instead of sending
+        a view Slack would reject. See validate().
+        :return: self
+        """
+        self._validate_before_send = True
+        return self
+
+    def send_pre_encoded(self) -> Self:
+        """
+        (Optional) Sends the view to the Web API as a JSON string encoded with orjson when it is installed, rather than
+        as a dict for the Slack client to encode with the standard library json module.
+        :return: self
+        """
+        self._pre_encoded = True
+        return self
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the view to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.view)
+
+    @classmethod
+    def from_dict(cls, view: dict) -> AppHome:
+        """
+        Loads a view dict, i.e. body["view"] from an interaction payload or a view exported from Block Kit Builder.
+        Keys only the Web API sets, such as the view id, hash and state, are skipped. The blocks are loaded lazily and
+        render as the dicts they were loaded from until they are changed. See pyblock_builder.serialization.from_dict().
+        :param view: View dict of type "home"
+        :return: AppHome
+        """
+        if view.get("type") != "home":
+            raise ValueError(f"Cannot load a view of type {view.get('type')} into an AppHome")
+        return parser.from_dict(view, "surface")
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> AppHome:
+        """
+        Decodes a JSON view and loads it. See from_dict().
+        :param data: String or bytes of JSON
+        :return: AppHome
+        """
+        return cls.from_dict(loads(data))
+
+    def _view_body(self) -> dict | str:
+        """
+        Returns the view to send to the Web API: the view dict itself, or a JSON string when sending pre-encoded
+        views or when the view has frozen blocks, whose pre-encoded bytes are spliced in
+        :return: dict or str
+        """
+        if self._pre_encoded or has_frozen(self._blocks):
+            return encode_view(self.view)
+        return self.view
+
+    def _send(self, slack_client, client_method: str, kwargs: dict):
+        """
+        Calls a Web API method through the rate limiter and retry policy set on this instance
         :param slack_client: an instance of the Slack Bolt for Python's app.client
-        :param payload: the event or other API response payload passed to the app from the Slack API
-        :param logger: instance of logger to correctly log API errors
+        :param client_method: String; name of the client method, i.e. "chat_postMessage"
+        :param kwargs: Arguments for the Web API method
+        :return: Slack API response
+        """
+        if self._validate_before_send:
+            violations = self.validate()
+            if violations:
+                raise BlockKitValidationError(violations)
+        return send(slack_client, client_method, kwargs, self._rate_limiter, self._retry_policy)
+
+    async def _send_async(self, slack_client, client_method: str, kwargs: dict):
+        """
+        Awaitable version of _send()
+        :param slack_client: an instance of the Slack Bolt for Python's AsyncApp.client (or any AsyncWebClient)
+        :param client_method: String; name of the client method, i.e. "chat_postMessage"
+        :param kwargs: Arguments for the Web API method
         :return: Slack API response
         """
+        if self._validate_before_send:
+            violations = self.validate()
+            if violations:
+                raise BlockKitValidationError(violations)
+        return await send_async(slack_client, client_method, kwargs, self._rate_limiter, self._retry_policy)
+
+    def _publish_view_args(self, payload) -> dict:
+        """
+        Builds the arguments for the views.publish Web API method
+        :param payload: the event or other API response payload passed to the app from the Slack API
+        :return: dict
+        """
         if payload["type"] == "app_home_opened":
             user_id = payload["user"]
         else:
             user_id = payload["user"]["id"]
+        return {
+            "user_id": user_id,
+            "view": self._view_body()
+        }
+
+    def publish_view(self, slack_client, payload, logger):
+        """
+        Uses the attributes set on the class to generate a view payload and passes it to the views.publish Web API
+        methods of the Slack Bolt for Python client. Errors, including BlockKitValidationError and the last error once
+        the retry policy gives up, are logged with logger and then raised.
+        :param slack_client: an instance of the Slack Bolt for Python's app.client
+        :param payload: the event or other API response payload passed to the app from the Slack API
+        :param logger: instance of logger to correctly log API errors
+        :return: Slack API response
+        """
+        try:
+            result = self._send(slack_client, "views_publish", self._publish_view_args(payload))
+            return result
+        except Exception as e:
+            logger.error(f"Error publishing home tab: {e}")
+            raise
+
+    async def publish_view_async(self, slack_client, payload, logger):
+        """
+        Awaitable version of publish_view() for use with the Slack Bolt for Python's AsyncApp.
+        :param slack_client: an instance of the Slack Bolt for Python's AsyncApp.client (or any AsyncWebClient)
+        :param payload: the event or other API response payload passed to the app from the Slack API
+        :param logger: instance of logger to correctly log API errors
+        :return: Slack API response
+        """
         try:
-            result = slack_client.views_publish(
-                user_id=user_id,
-                view=self.view
-            )
+            args = self._publish_view_args(payload)
+            result = await self._send_async(slack_client, "views_publish", args)
             return result
         except Exception as e:
-            logger.error(f"Error publishing home tab: {e}")
\ No newline at end of file
+            logger.error(f"Error publishing home tab: {e}")
+            raise
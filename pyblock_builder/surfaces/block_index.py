@@ -0,0 +1,135 @@
+def block_keys(block) -> tuple:
+    """
+    Reads the keys a block can be looked up by
+    :param block: Block object or frozen block
+    :return: Tuple of the block_id of the block, or None, and a tuple of the action_ids of its elements
+    """
+    value = block.block
+    elements = list(value.get("elements") or ())
+    elements.extend(element for element in (value.get("element"), value.get("accessory")) if element)
+    return value.get("block_id"), tuple(element["action_id"] for element in elements if element.get("action_id"))
+
+
+class BlockIndex:
+    """
+    Positions of the blocks of a surface by block_id and by the action_ids of their elements. Blocks are indexed the
+    first time a lookup needs them, so adding blocks costs nothing until the index is used, and the keys of each block
+    are read only once. Replacing a block updates the keys of that block in place; inserting or removing blocks also
+    shifts the positions after them, without rendering the other blocks again. Keys changed on a block after it was
+    indexed are not seen; use replace_block() instead. When several blocks share a key, the first one is found.
+    """
+    __slots__ = ("_keys", "_block_ids", "_action_ids", "_duplicates", "_stale")
+
+    def __init__(self):
+        self._keys = []
+        self._block_ids = {}
+        self._action_ids = {}
+        # Keys shared by several blocks; removing the first block with one of them needs a rebuild to find the next
+        self._duplicates = set()
+        self._stale = False
+
+    def catch_up(self, blocks: list):
+        """
+        Indexes the blocks of a surface that have not been indexed yet, and rebuilds the positions if a key shared by
+        several blocks was removed since the last lookup
+        :param blocks: List of the block objects on the surface, in order
+        """
+        if self._stale:
+            self._block_ids.clear()
+            self._action_ids.clear()
+            self._duplicates.clear()
+            for position, keys in enumerate(self._keys):
+                self._add(position, keys)
+            self._stale = False
+        for position in range(len(self._keys), len(blocks)):
+            keys = block_keys(blocks[position])
+            self._keys.append(keys)
+            self._add(position, keys)
+
+    def _add(self, position: int, keys: tuple):
+        block_id, action_ids = keys
+        if block_id is not None:
+            self._map(self._block_ids, block_id, position)
+        for action_id in action_ids:
+            self._map(self._action_ids, action_id, position)
+
+    def _map(self, positions: dict, key: str, position: int):
+        current = positions.get(key)
+        if current is None or current > position:
+            positions[key] = position
+        if current is not None and current != position:
+            self._duplicates.add(key)
+
+    def _discard(self, position: int, keys: tuple, kept: tuple = (None, ())):
+        block_id, action_ids = keys
+        if block_id is not None and block_id != kept[0] and self._block_ids.get(block_id) == position:
+            del self._block_ids[block_id]
+            if block_id in self._duplicates:
+                self._stale = True
+        for key in action_ids:
+            if key not in kept[1] and self._action_ids.get(key) == position:
+                del self._action_ids[key]
+                if key in self._duplicates:
+                    self._stale = True
+
+    def _shift(self, position: int, offset: int):
+        for positions in (self._block_ids, self._action_ids):
+            for key, current in positions.items():
+                if current >= position:
+                    positions[key] = current + offset
+
+    def position(self, blocks: list, key: str) -> int:
+        """
+        Finds the position of a block
+        :param blocks: List of the block objects on the surface, in order
+        :param key: String; block_id of the block, or action_id of one of its elements
+        :return: Integer
+        """
+        self.catch_up(blocks)
+        position = self._block_ids.get(key)
+        if position is None:
+            position = self._action_ids.get(key)
+            if position is None:
+                raise KeyError(f"No block with block_id or action_id {key!r}")
+        return position
+
+    def copy(self) -> "BlockIndex":
+        """
+        :return: A BlockIndex with the same keys and positions, for a copy of the surface
+        """
+        index = BlockIndex()
+        index._keys = list(self._keys)
+        index._block_ids = dict(self._block_ids)
+        index._action_ids = dict(self._action_ids)
+        index._duplicates = set(self._duplicates)
+        index._stale = self._stale
+        return index
+
+    def replaced(self, position: int, block):
+        """
+        Records that the block at a position was replaced, updating only the keys of the two blocks
+        """
+        if position < len(self._keys):
+            keys = block_keys(block)
+            self._discard(position, self._keys[position], keys)
+            self._keys[position] = keys
+            self._add(position, keys)
+
+    def inserted(self, position: int, blocks: tuple):
+        """
+        Records that blocks were inserted at a position, shifting the positions after it
+        """
+        if position <= len(self._keys):
+            keys = [block_keys(block) for block in blocks]
+            self._shift(position, len(keys))
+            self._keys[position:position] = keys
+            for offset, added in enumerate(keys):
+                self._add(position + offset, added)
+
+    def removed(self, position: int):
+        """
+        Records that the block at a position was removed, shifting the positions after it
+        """
+        if position < len(self._keys):
+            self._discard(position, self._keys.pop(position))
+            self._shift(position + 1, -1)
@@ -0,0 +1,196 @@
+class BlockKitLimitError(ValueError):
+    """
+    Raised by surfaces in strict mode when a block added to them breaks one of Slack's Block Kit limits
+    """
+
+
+# Maximum number of blocks on each type of surface
+MAX_BLOCKS = {
+    "message": 50,
+    "modal": 100,
+    "home": 100,
+}
+
+# Maximum length of a text object, by (type of the block or element holding it, field); any other text is capped at
+# DEFAULT_MAX_TEXT
+MAX_TEXT = {
+    ("header", "text"): 150,
+    ("section", "fields"): 2000,
+    ("input", "label"): 2000,
+    ("input", "hint"): 2000,
+    ("button", "text"): 75,
+    ("static_select", "placeholder"): 150,
+    ("multi_static_select", "placeholder"): 150,
+}
+DEFAULT_MAX_TEXT = 3000
+
+# Maximum number of items in a list field, by (type of the block or element holding it, field)
+MAX_ITEMS = {
+    ("actions", "elements"): 25,
+    ("context", "elements"): 10,
+    ("section", "fields"): 10,
+    ("checkboxes", "options"): 10,
+    ("radio_buttons", "options"): 10,
+    ("overflow", "options"): 5,
+}
+DEFAULT_MAX_OPTIONS = 100
+
+
+class BlockBudget:
+    """
+    Running counters of the blocks added to a surface, measured against Slack's Block Kit limits. Each block is
+    measured only once, so keeping the counters up to date costs the same however many blocks the surface already
+    has. Blocks changed after being measured are not measured again, unless they are fetched with get_block(), which
+    resets the counters.
+    """
+    __slots__ = ("max_blocks", "blocks", "bytes", "longest_text", "most_options", "violations")
+
+    def __init__(self, max_blocks: int):
+        """
+        :param max_blocks: Integer; maximum number of blocks on the surface
+        """
+        self.max_blocks = max_blocks
+        self.blocks = 0
+        self.bytes = 2
+        self.longest_text = 0
+        self.most_options = 0
+        self.violations = []
+
+    def measure(self, block: dict, index: int = None) -> dict:
+        """
+        Measures a block without adding it to the counters
+        :param block: Block dict
+        :param index: (Optional) Integer; position the block will have on the surface, defaults to the next one
+        :return: Dict of the approximate encoded size in bytes, longest text, most options, and a list of the limits
+        the block breaks
+        """
+        index = self.blocks if index is None else index
+        measurement = {"bytes": 0, "longest_text": 0, "most_options": 0, "violations": []}
+        measurement["bytes"] = _walk(block, block.get("type"), None, (f"blocks[{index}]",), measurement)
+        if index >= self.max_blocks:
+            measurement["violations"].append(f"blocks: {index + 1} blocks, limit is {self.max_blocks}")
+        return measurement
+
+    def add(self, measurement: dict):
+        """
+        Adds a block measured with measure() to the counters
+        :param measurement: Dict; from measure()
+        """
+        self.blocks += 1
+        self.bytes += measurement["bytes"] + (1 if self.blocks > 1 else 0)
+        self.longest_text = max(self.longest_text, measurement["longest_text"])
+        self.most_options = max(self.most_options, measurement["most_options"])
+        self.violations.extend(measurement["violations"])
+
+    def catch_up(self, blocks: list):
+        """
+        Measures and adds the blocks of a surface that have not been counted yet
+        :param blocks: List of the block objects on the surface, in order
+        """
+        for index in range(self.blocks, len(blocks)):
+            self.add(self.measure(blocks[index].block, index))
+
+    def check(self, blocks: tuple, index: int, total: int):
+        """
+        Raises BlockKitLimitError if blocks about to be put on the surface break a limit
+        :param blocks: The block objects
+        :param index: Integer; position the first of them will have on the surface
+        :param total: Integer; number of blocks the surface will have
+        """
+        violations = []
+        for offset, block in enumerate(blocks):
+            violations.extend(self.measure(block.block, index + offset)["violations"])
+        if total > self.max_blocks and not any(violation.startswith("blocks:") for violation in violations):
+            violations.append(f"blocks: {total} blocks, limit is {self.max_blocks}")
+        if violations:
+            raise BlockKitLimitError("; ".join(violations))
+
+    def copy(self) -> "BlockBudget":
+        """
+        :return: A BlockBudget with the same counters, for a copy of the surface
+        """
+        budget = BlockBudget(self.max_blocks)
+        budget.blocks = self.blocks
+        budget.bytes = self.bytes
+        budget.longest_text = self.longest_text
+        budget.most_options = self.most_options
+        budget.violations = list(self.violations)
+        return budget
+
+    def reset(self):
+        """
+        Clears the counters, so that the next catch_up() measures every block of the surface again
+        """
+        self.blocks = 0
+        self.bytes = 2
+        self.longest_text = 0
+        self.most_options = 0
+        self.violations = []
+
+    def report(self) -> dict:
+        """
+        :return: Dict of the counters and limits
+        """
+        return {
+            "blocks": self.blocks,
+            "max_blocks": self.max_blocks,
+            "blocks_left": max(self.max_blocks - self.blocks, 0),
+            "bytes": self.bytes,
+            "longest_text": self.longest_text,
+            "most_options": self.most_options,
+            "violations": list(self.violations),
+        }
+
+
+def _format_path(path: tuple) -> str:
+    """
+    Formats the nested (parent, key) tuples built by _walk() as a dotted path, i.e. blocks[2].fields[0]
+    """
+    keys = []
+    while len(path) == 2:
+        path, key = path
+        keys.append(f"[{key}]" if type(key) is int else f".{key}")
+    return path[0] + "".join(reversed(keys))
+
+
+def _walk(value, parent_type, field, path, measurement) -> int:
+    """
+    Walks a JSON value, recording the longest text and list in it and any limits they break in the measurement
+    :return: Integer; approximate encoded size of the value in bytes
+    """
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, dict):
+        value_type = value.get("type")
+        if value_type == "plain_text" or value_type == "mrkdwn":
+            length = len(value.get("text", ""))
+            if length > measurement["longest_text"]:
+                measurement["longest_text"] = length
+            limit = MAX_TEXT.get((parent_type, field), DEFAULT_MAX_TEXT)
+            if length > limit:
+                measurement["violations"].append(f"{_format_path(path)}.text: {length} characters, limit is {limit}")
+        own_type = value_type or parent_type
+        size = 1 + len(value)
+        for key, item in value.items():
+            if type(item) is str:
+                size += len(key) + len(item) + 5
+            else:
+                size += len(key) + 3 + _walk(item, own_type, key, (path, key), measurement)
+        return size
+    if isinstance(value, list):
+        count = len(value)
+        if field == "options" or field == "option_groups" or field == "initial_options":
+            if count > measurement["most_options"]:
+                measurement["most_options"] = count
+            limit = MAX_ITEMS.get((parent_type, field), DEFAULT_MAX_OPTIONS)
+        else:
+            limit = MAX_ITEMS.get((parent_type, field))
+        if limit is not None and count > limit:
+            measurement["violations"].append(f"{_format_path(path)}: {count} items, limit is {limit}")
+        size = 1 + count
+        for index, item in enumerate(value):
+            size += _walk(item, parent_type, field, (path, index), measurement)
+        return size
+    if value is None:
+        return 4
+    return len(str(value))
@@ -1,19 +1,116 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import AsyncIterator, Iterable, Iterator
     from typing_extensions import Self
 from datetime import datetime
+from pyblock_builder.delivery.dedupe import UpdateDeduplicator
+from pyblock_builder.delivery.dispatch import send, send_async
+from pyblock_builder.serialization import parser
+from pyblock_builder.serialization.encoder import dumps, loads
+from pyblock_builder.serialization.frozen import Frozen, encode_blocks, has_frozen
+from pyblock_builder.surfaces.budget import MAX_BLOCKS
+from pyblock_builder.surfaces.surface import Surface
+from pyblock_builder.surfaces.validation import BlockKitValidationError, validate
 
-class Message:
+# The keyword arguments accepted by each chat.* Web API method that a Message can be delivered through, in the order
+# they are added to the payload
+_METHOD_FIELDS = {
+    "post": ("channel", "text", "blocks", "attachments", "thread_ts", "mrkdwn", "as_user", "icon_emoji", "icon_url",
+             "link_names", "metadata", "parse", "reply_broadcast", "service_team_id", "unfurl_links", "unfurl_media",
+             "username"),
+    "ephemeral": ("channel", "user", "text", "blocks", "attachments", "thread_ts", "as_user", "icon_emoji",
+                  "icon_url", "link_names", "parse", "username"),
+    "schedule": ("channel", "post_at", "text", "blocks", "attachments", "thread_ts", "as_user", "link_names",
+                 "metadata", "parse", "reply_broadcast", "unfurl_links", "unfurl_media"),
+    "update": ("channel", "ts", "text", "blocks", "attachments", "as_user", "link_names", "metadata", "parse",
+               "reply_broadcast"),
+    "delete": ("channel", "ts", "as_user"),
+}
+
+# Default value of the attribute backing each payload field; fields still at their default are left out of the payload
+_FIELD_DEFAULTS = {
+    "channel": "",
+    "user": "",
+    "text": "",
+    "blocks": [],
+    "attachments": [],
+    "ts": "",
+    "thread_ts": "",
+    "mrkdwn": True,
+    "as_user": None,
+    "post_at": "",
+    "icon_emoji": "",
+    "icon_url": "",
+    "link_names": None,
+    "metadata": "",
+    "parse": "",
+    "reply_broadcast": False,
+    "service_team_id": "",
+    "unfurl_links": None,
+    "unfurl_media": None,
+    "username": "",
+}
+
+# The Slack client method that each delivery method is sent through
+_API_METHODS = {
+    "post": "chat_postMessage",
+    "ephemeral": "chat_postEphemeral",
+    "schedule": "chat_scheduleMessage",
+    "update": "chat_update",
+    "delete": "chat_delete",
+}
+
+# Precomputed (payload key, attribute name, default value) triples for each delivery method. Blocks are left out: they
+# are rendered from the builders every time a payload is built, so that changes made to a block after it was added
+# are sent.
+_FIELD_TABLE = {
+    method: tuple(
+        (field, "attachments" if field == "attachments" else f"_{field}", _FIELD_DEFAULTS[field])
+        for field in fields if field != "blocks"
+    )
+    for method, fields in _METHOD_FIELDS.items()
+}
+
+# The delivery methods that send blocks
+_BLOCK_METHODS = frozenset(method for method, fields in _METHOD_FIELDS.items() if "blocks" in fields)
+
+
+class PostResult:
+    """
+    The outcome of delivering a Message to a single channel with Message.post_many()
+    """
+    __slots__ = ("channel", "response", "error")
+
+    def __init__(self, channel: str, response=None, error: Exception | None = None):
+        self.channel = channel
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        return f"PostResult(channel={self.channel!r}, response={self.response!r}, error={self.error!r})"
+
+
+class Message(Surface):
     """
     A Python class representing a Message surface from the Slack API
     """
+    __slots__ = ("_channel", "_user", "_text", "attachments", "_ts", "_thread_ts", "_mrkdwn", "_as_user", "_post_at",
+                 "_icon_emoji", "_icon_url", "_link_names", "_metadata", "_parse", "_reply_broadcast",
+                 "_service_team_id", "_unfurl_links", "_unfurl_media", "_username", "_is_ephemeral", "_rate_limiter",
+                 "_retry_policy", "_pre_encoded", "_validate_before_send", "_deduplicator", "_payloads",
+                 "_block_digests")
+    _UNSHARED = ("attachments", "_payloads", "_block_digests")
+
     def __init__(self):
+        super().__init__(MAX_BLOCKS["message"])
         self._channel = ""
         self._user = ""
         self._text = ""
-        self.blocks = []
         self.attachments = []
         self._ts = ""
         self._thread_ts = ""
@@ -31,6 +128,13 @@ class Message:
         self._unfurl_media = None
         self._username = ""
         self._is_ephemeral = False
+        self._rate_limiter = None
+        self._retry_policy = None
+        self._pre_encoded = False
+        self._validate_before_send = False
+        self._deduplicator = None
+        self._payloads = {}
+        self._block_digests = []
 
     def set_channel(self, channel_id: str) -> Self:
         """
@@ -39,6 +143,7 @@ class Message:
         :return: self
         """
         self._channel = channel_id
+        self._payloads.clear()
         return self
 
     def set_user(self, user_id: str) -> Self:
@@ -49,6 +154,7 @@ class Message:
         :return: self
         """
         self._user = user_id
+        self._payloads.clear()
         return self
 
     def set_text(self, message_text: str) -> Self:
@@ -60,16 +166,7 @@ class Message:
         :return: self
         """
         self._text = message_text
-        return self
-
-    def add_blocks(self, *blocks) -> Self:
-        """
-       (Optional) Adds one or more layout blocks to the message.
-       :param blocks: One or more Block objects, e.g. Actions, Sections, Inputs; preface with * if passing in a list.
-       :return: self
-       """
-        for block in blocks:
-            self.blocks.append(block.block)
+        self._payloads.clear()
         return self
 
     def add_attachments(self, *attachments) -> Self:
@@ -80,6 +177,7 @@ class Message:
        """
         for attachment in attachments:
             self.attachments.append(attachment)
+        self._payloads.clear()
         return self
 
     def set_thread_ts(self, thread_ts: str) -> Self:
@@ -90,6 +188,7 @@ class Message:
         :return: self
         """
         self._thread_ts = thread_ts
+        self._payloads.clear()
         return self
 
     def set_ts(self, ts: str) -> Self:
@@ -99,6 +198,7 @@ class Message:
         :return: self
         """
         self._ts = ts
+        self._payloads.clear()
         return self
 
     def disable_mrkdwn(self) -> Self:
@@ -107,6 +207,7 @@ class Message:
         :return: self
         """
         self._mrkdwn = False
+        self._payloads.clear()
         return self
 
     def deliver_ephemeral(self) -> Self:
@@ -115,6 +216,7 @@ class Message:
         :return: self
         """
         self._is_ephemeral = True
+        self._payloads.clear()
         return self
 
     def as_user(self) -> Self:
@@ -124,6 +226,7 @@ class Message:
         :return: self
         """
         self._as_user = True
+        self._payloads.clear()
         return self
 
     def post_at(self, post_at: str | datetime) -> Self:
@@ -136,6 +239,7 @@ class Message:
             self._post_at = post_at.timestamp()
         else:
             self._post_at = post_at
+        self._payloads.clear()
         return self
 
     def set_icon_emoji(self, emoji_string: str) -> Self:
@@ -145,6 +249,7 @@ class Message:
         :return: self
         """
         self._icon_emoji = emoji_string
+        self._payloads.clear()
         return self
 
     def set_icon_url(self, icon_img_url: str) -> Self:
@@ -154,6 +259,7 @@ class Message:
         :return: self
         """
         self._icon_url = icon_img_url
+        self._payloads.clear()
         return self
 
     def link_names(self) -> Self:
@@ -162,6 +268,7 @@ class Message:
         :return: self
         """
         self._link_names = True
+        self._payloads.clear()
         return self
 
     def add_metadata(self, metadata: str) -> Self:
@@ -173,6 +280,7 @@ class Message:
         :return: self
         """
         self._metadata = metadata
+        self._payloads.clear()
         return self
 
     def disable_auto_parsing(self) -> Self:
@@ -181,6 +289,7 @@ class Message:
         :return: self
         """
         self._parse = "none"
+        self._payloads.clear()
         return self
 
     def broadcast_reply_to_channel(self) -> Self:
@@ -190,6 +299,7 @@ class Message:
         :return: self
         """
         self._reply_broadcast = True
+        self._payloads.clear()
         return self
 
     def set_service_team_id(self, team_id: str) -> Self:
@@ -199,6 +309,7 @@ class Message:
         :return: self
         """
         self._service_team_id = team_id
+        self._payloads.clear()
         return self
 
     def unfurl_links(self) -> Self:
@@ -208,6 +319,7 @@ class Message:
         :return: self
         """
         self._unfurl_links = True
+        self._payloads.clear()
         return self
 
     def disable_unfurl_media(self) -> Self:
@@ -217,6 +329,7 @@ class Message:
         :return: self
         """
         self._unfurl_media = False
+        self._payloads.clear()
         return self
 
     def set_username(self, username: str) -> Self:
@@ -226,8 +339,256 @@ class Message:
         :return: self
         """
         self._username = username
+        self._payloads.clear()
+        return self
+
+    def set_rate_limiter(self, rate_limiter) -> Self:
+        """
+        (Optional) Paces all Web API calls made by this message through a client-side rate limiter.
+        :param rate_limiter: RateLimiter object, or None to disable
+        :return: self
+        """
+        self._rate_limiter = rate_limiter
+        return self
+
+    def set_retry_policy(self, retry_policy) -> Self:
+        """
+        (Optional) Retries Web API calls made by this message that fail with rate limit or transient server errors.
+        :param retry_policy: RetryPolicy object, or None to disable
+        :return: self
+        """
+        self._retry_policy = retry_policy
+        return self
+
+    def suppress_unchanged_updates(self, deduplicator: UpdateDeduplicator = None) -> Self:
+        """
+        (Optional) Skips update() calls whose payload is identical to the last one sent for the same channel and ts,
+        returning {"ok": True, "channel": ..., "ts": ..., "unchanged": True} without calling the Web API. Blocks are
+        rendered for every comparison, so changes made to them through their builders count as changes.
+        :param deduplicator: (Optional) UpdateDeduplicator; share one between messages that are rebuilt on every
+        refresh. Defaults to a new one owned by this message.
+        :return: self
+        """
+        self._deduplicator = deduplicator if deduplicator is not None else UpdateDeduplicator()
+        return self
+
+    def fingerprint(self, method: str = "update") -> bytes:
+        """
+        Computes a digest of the payload for the given delivery method, with the blocks as they are now. The digest of
+        each block is kept and reused for as long as the block renders to the same dict, so only blocks that changed
+        are encoded again. Frozen blocks are hashed from the bytes they were encoded to.
+        :param method: (Optional) One of "post", "ephemeral", "schedule", "update" or "delete"; defaults to "update"
+        :return: bytes
+        """
+        return self._fingerprint(self.to_payload(method))
+
+    def _fingerprint(self, payload: dict) -> bytes:
+        import hashlib
+        import json
+
+        fields = {key: value for key, value in payload.items() if key != "blocks"}
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(fields, sort_keys=True, separators=(",", ":"), default=str).encode())
+        blocks = payload.get("blocks", ())
+        digests = self._block_digests
+        del digests[len(blocks):]
+        digests.extend([None] * (len(blocks) - len(digests)))
+        for position, block in enumerate(blocks):
+            if type(block) is Frozen:
+                digest.update(block.encoded)
+                continue
+            cached = digests[position]
+            if cached is None or cached[0] != block:
+                encoded = json.dumps(block, sort_keys=True, separators=(",", ":"), default=str).encode()
+                cached = digests[position] = (block, hashlib.blake2b(encoded, digest_size=16).digest())
+            digest.update(cached[1])
+        return digest.digest()
+
+    def _block_fetched(self, position: int):
+        """
+        Forgets what was measured and hashed of a block returned by get_block(), which may be changed in place
+        :param position: Integer; position of the block
+        """
+        super()._block_fetched(position)
+        if position < len(self._block_digests):
+            self._block_digests[position] = None
+
+    def _blocks_changed(self, position: int):
+        """
+        Measures the blocks again and drops the digests kept from the first block that changed onwards
+        :param position: Integer; position of the first block that changed
+        """
+        super()._blocks_changed(position)
+        del self._block_digests[position:]
+
+    def _unchanged_update(self, payload: dict) -> tuple[dict | None, bytes | None]:
+        """
+        Checks the update payload against the deduplicator, if one is set.
+        :param payload: The update payload, from to_payload("update")
+        :return: Tuple of the synthetic result to return instead of calling the Web API (or None) and the fingerprint
+        to record once the update has been sent (or None)
+        """
+        if self._deduplicator is None:
+            return None, None
+        fingerprint = self._fingerprint(payload)
+        if self._deduplicator.is_unchanged((self._channel, self._ts), fingerprint):
+            return {"ok": True, "channel": self._channel, "ts": self._ts, "unchanged": True}, None
+        return None, fingerprint
+
+    def _check(self, method: str):
+        """
+        Raises BlockKitValidationError when validate_before_send() is set and the message is not valid for a method
+        :param method: String; one of "post", "ephemeral", "schedule" or "update"
+        """
+        if self._validate_before_send:
+            violations = self.validate(method)
+            if violations:
+                raise BlockKitValidationError(violations)
+
+    def _send(self, slack_client, client_method: str, kwargs: dict, method: str = None):
+        """
+        Calls a Web API method through the rate limiter and retry policy set on this instance
+        :param slack_client: an instance of the Slack Bolt for Python's app.client
+        :param client_method: String; name of the client method, i.e. "chat_postMessage"
+        :param kwargs: Arguments for the Web API method
+        :param method: (Optional) String; the method the message is validated for first, i.e. "post"; None when the
+        call sends no blocks or they were validated already
+        :return: Slack API response
+        """
+        if method is not None:
+            self._check(method)
+        return send(slack_client, client_method, kwargs, self._rate_limiter, self._retry_policy)
+
+    async def _send_async(self, slack_client, client_method: str, kwargs: dict, method: str = None):
+        """
+        Awaitable version of _send()
+        :param slack_client: an instance of the Slack Bolt for Python's AsyncApp.client (or any AsyncWebClient)
+        :param client_method: String; name of the client method, i.e. "chat_postMessage"
+        :param kwargs: Arguments for the Web API method
+        :param method: (Optional) String; the method the message is validated for first, i.e. "post"; None when the
+        call sends no blocks or they were validated already
+        :return: Slack API response
+        """
+        if method is not None:
+            self._check(method)
+        return await send_async(slack_client, client_method, kwargs, self._rate_limiter, self._retry_policy)
+
+    def validate(self, method: str = None) -> list:
+        """
+        Checks the message against Slack's Block Kit rules in a single pass over it: required keys, maximum lengths
+        and item counts, which elements each block accepts, which blocks messages accept, and unique block_ids.
+        :param method: (Optional) One of "post", "ephemeral", "schedule", "update" or "delete". Defaults to the method
+        post() would use.
+        :return: List of (JSON pointer, message) tuples, i.e. ("/blocks/3/text", "missing required key"); empty when
+        the message is valid
+        """
+        return validate(self.to_payload(method), "message")
+
+    def validate_before_send(self) -> Self:
+        """
+        (Optional) Validates the message before every Web API call and raises BlockKitValidationError instead of
+        sending blocks Slack would reject. See validate().
+        :return: self
+        """
+        self._validate_before_send = True
         return self
 
+    def send_pre_encoded(self) -> Self:
+        """
+        (Optional) Sends the blocks to the Web API as a JSON string encoded with orjson when it is installed, rather
+        than as a list of dicts for the Slack client to encode with the standard library json module.
+        :return: self
+        """
+        self._pre_encoded = True
+        self._payloads.clear()
+        return self
+
+    def to_json_bytes(self, method: str = None) -> bytes:
+        """
+        Encodes the payload for one of the chat.* Web API methods to compact JSON with orjson when it is installed, or
+        the standard library json module otherwise. See pyblock_builder.serialization.set_backend().
+        :param method: (Optional) One of "post", "ephemeral", "schedule", "update" or "delete". Defaults to the method
+        post() would use.
+        :return: bytes
+        """
+        return dumps(self.to_payload(method))
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> Message:
+        """
+        Loads a chat.* payload or a message from the Web API, i.e. one returned by conversations.history. Keys a Message
+        cannot send are skipped. The blocks are loaded lazily and render as the dicts they were loaded from until they
+        are changed. See pyblock_builder.serialization.from_dict().
+        :param payload: Payload or message dict
+        :return: Message
+        """
+        return parser.from_dict(payload, "message")
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> Message:
+        """
+        Decodes a JSON payload or message and loads it. See from_dict().
+        :param data: String or bytes of JSON
+        :return: Message
+        """
+        return cls.from_dict(loads(data))
+
+    def to_payload(self, method: str = None) -> dict:
+        """
+        Generates the payload for one of the chat.* Web API methods from the attributes set on the class. Only the
+        arguments accepted by that method and set to a non-default value are included. The fields other than the
+        blocks are cached until one of the setters is called again; the blocks are rendered on every call.
+        :param method: (Optional) One of "post", "ephemeral", "schedule", "update" or "delete". Defaults to the method
+        post() would use.
+        :return: dict
+        """
+        method = method or self._delivery_method()
+        payload = dict(self._fields(method))
+        if self._blocks and method in _BLOCK_METHODS:
+            payload["blocks"] = self.blocks
+        return payload
+
+    def _fields(self, method: str) -> dict:
+        """
+        Returns the cached fields of the payload for the given delivery method, other than the blocks, building them
+        from the field table on a cache miss. The returned dict is shared and must not be mutated.
+        :param method: One of the keys of _METHOD_FIELDS
+        :return: dict
+        """
+        fields = self._payloads.get(method)
+        if fields is None:
+            if method not in _FIELD_TABLE:
+                raise ValueError(f"Unknown delivery method: {method}. Must be one of {', '.join(_FIELD_TABLE)}")
+            fields = {}
+            for key, attr, default in _FIELD_TABLE[method]:
+                value = getattr(self, attr)
+                if value != default:
+                    fields[key] = value
+            self._payloads[method] = fields
+        return fields
+
+    def _encoded(self, payload: dict) -> dict:
+        """
+        Encodes the blocks of a payload to a JSON string just before it is sent, if the message is sent pre-encoded
+        or holds frozen blocks
+        :param payload: dict; from to_payload()
+        :return: The same dict
+        """
+        if "blocks" in payload and (self._pre_encoded or has_frozen(self._blocks)):
+            payload["blocks"] = encode_blocks(payload["blocks"])
+        return payload
+
+    def _delivery_method(self) -> str:
+        """
+        Determines which method post() delivers the message with.
+        :return: "ephemeral", "schedule" or "post"
+        """
+        if self._is_ephemeral:
+            return "ephemeral"
+        if self._post_at:
+            return "schedule"
+        return "post"
+
     def post(self, slack_client):
         """
         Uses the attributes set on the class to generate a message payload and passes it to either the chat.postMessage
@@ -236,17 +597,19 @@ class Message:
         :param slack_client: an instance of the Slack Bolt for Python's app.client
         :return: Slack API response
         """
-        payload = {}
-        for k, v in self.__dict__.items():
-            if v:
-                payload[k.strip("_")] = v
+        method = self._delivery_method()
+        result = self._send(slack_client, _API_METHODS[method], self._encoded(self.to_payload(method)), method)
+        return result
 
-        if self._is_ephemeral:
-            result = slack_client.chat_postEphemeral(**payload)
-        elif self._post_at:
-            result = slack_client.chat_scheduleMessage(**payload)
-        else:
-            result = slack_client.chat_postMessage(**payload)
+    async def post_async(self, slack_client):
+        """
+        Awaitable version of post() for use with the Slack Bolt for Python's AsyncApp.
+        :param slack_client: an instance of the Slack Bolt for Python's AsyncApp.client (or any AsyncWebClient)
+        :return: Slack API response
+        """
+        method = self._delivery_method()
+        result = await self._send_async(slack_client, _API_METHODS[method], self._encoded(self.to_payload(method)),
+                                         method)
         return result
 
     def delete(self, slack_client):
@@ -255,44 +618,261 @@ class Message:
         :param slack_client: an instance of the Slack Bolt for Python's app.client
         :return: Slack API response
         """
-        payload = {}
-        for k, v in self.__dict__.items():
-            if v:
-                payload[k.strip("_")] = v
+        result = self._send(slack_client, "chat_delete", self.to_payload("delete"))
+        return result
 
-        result = slack_client.chat_delete(**payload)
+    async def delete_async(self, slack_client):
+        """
+        Awaitable version of delete() for use with the Slack Bolt for Python's AsyncApp.
+        :param slack_client: an instance of the Slack Bolt for Python's AsyncApp.client (or any AsyncWebClient)
+        :return: Slack API response
+        """
+        result = await self._send_async(slack_client, "chat_delete", self.to_payload("delete"))
         return result
 
     def update(self, slack_client):
         """
-        Updates an existing message
+        Updates an existing message. See suppress_unchanged_updates() to skip updates that would not change it.
         :param slack_client: an instance of the Slack Bolt for Python's app.client
         :return: Slack API response
         """
-        payload = {}
-        for k, v in self.__dict__.items():
-            if v:
-                payload[k.strip("_")] = v
+        payload = self.to_payload("update")
+        unchanged, fingerprint = self._unchanged_update(payload)
+        if unchanged is not None:
+            return unchanged
+        result = self._send(slack_client, "chat_update", self._encoded(payload), "update")
+        if fingerprint is not None:
+            self._deduplicator.record((self._channel, self._ts), fingerprint)
+        return result
 
-        result = slack_client.chat_update(**payload)
+    async def update_async(self, slack_client):
+        """
+        Awaitable version of update() for use with the Slack Bolt for Python's AsyncApp.
+        :param slack_client: an instance of the Slack Bolt for Python's AsyncApp.client (or any AsyncWebClient)
+        :return: Slack API response
+        """
+        payload = self.to_payload("update")
+        unchanged, fingerprint = self._unchanged_update(payload)
+        if unchanged is not None:
+            return unchanged
+        result = await self._send_async(slack_client, "chat_update", self._encoded(payload), "update")
+        if fingerprint is not None:
+            self._deduplicator.record((self._channel, self._ts), fingerprint)
         return result
 
+    def _fan_out_payloads(self, channels: Iterable[str]) -> Iterator[tuple[str, dict]]:
+        """
+        Builds the shared payload once and yields a shallow copy of it per channel with only the channel swapped in.
+        :param channels: Iterable of channel IDs
+        :return: Iterator of (channel, payload) tuples
+        """
+        base = self._encoded(self.to_payload())
+        for channel in channels:
+            payload = dict(base)
+            payload["channel"] = channel
+            yield channel, payload
+
+    def post_many(self, slack_client, channels: Iterable[str], workers: int = 8) -> Iterator[PostResult]:
+        """
+        Posts this message to many channels at once over a bounded thread pool. The blocks and other shared fields are
+        built once; only the channel differs between requests. Results are yielded as soon as each request completes,
+        so they do not arrive in the order of channels. Failures are yielded rather than raised, except that with
+        validate_before_send() the message is validated once, before any request, and BlockKitValidationError raised.
+        :param slack_client: an instance of the Slack Bolt for Python's app.client
+        :param channels: Iterable of channel IDs; for DM/IMs, use the user's ID.
+        :param workers: Integer; maximum number of requests in flight; defaults to 8
+        :return: Iterator of PostResult
+        """
+        from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+        method = self._delivery_method()
+        self._check(method)
+        client_method = _API_METHODS[method]
+
+        def post_one(channel, payload):
+            try:
+                return PostResult(channel, response=self._send(slack_client, client_method, payload))
+            except Exception as e:
+                return PostResult(channel, error=e)
+
+        payloads = self._fan_out_payloads(channels)
+        pending = set()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for channel, payload in payloads:
+                    if len(pending) >= workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+                    pending.add(executor.submit(post_one, channel, payload))
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    async def post_many_async(self, slack_client, channels: Iterable[str],
+                              concurrency: int = 8) -> AsyncIterator[PostResult]:
+        """
+        Awaitable version of post_many() for use with the Slack Bolt for Python's AsyncApp. At most `concurrency`
+        requests are in flight at a time.
+        :param slack_client: an instance of the Slack Bolt for Python's AsyncApp.client (or any AsyncWebClient)
+        :param channels: Iterable of channel IDs; for DM/IMs, use the user's ID.
+        :param concurrency: Integer; maximum number of requests in flight; defaults to 8
+        :return: Async iterator of PostResult
+        """
+        import asyncio
+
+        method = self._delivery_method()
+        self._check(method)
+        client_method = _API_METHODS[method]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def post_one(channel, payload):
+            try:
+                response = await self._send_async(slack_client, client_method, payload)
+                return PostResult(channel, response=response)
+            except Exception as e:
+                return PostResult(channel, error=e)
+            finally:
+                semaphore.release()
+
+        pending = set()
+        try:
+            for channel, payload in self._fan_out_payloads(channels):
+                await semaphore.acquire()
+                pending.add(asyncio.ensure_future(post_one(channel, payload)))
+                done = {task for task in pending if task.done()}
+                pending -= done
+                for task in done:
+                    yield task.result()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _scheduled_messages_args(self, latest, oldest, page_size: int) -> dict:
+        """
+        Builds the arguments for the chat.scheduledMessages.list Web API method
+        :param latest: Ending date of range as Unix timestamp or Python datetime object, or None
+        :param oldest: Starting date of range as Unix timestamp or Python datetime object, or None
+        :param page_size: Integer; maximum number of scheduled messages per page
+        :return: dict
+        """
+        if isinstance(latest, datetime):
+            latest = latest.timestamp()
+        if isinstance(oldest, datetime):
+            oldest = oldest.timestamp()
+
+        args = {"limit": page_size}
+        if self._channel:
+            args["channel"] = self._channel
+        if latest:
+            args["latest"] = latest
+        if oldest:
+            args["oldest"] = oldest
+        return args
+
+    @staticmethod
+    def _next_cursor(response) -> str | None:
+        """
+        Reads the cursor of the next page from a paginated Web API response
+        :param response: Slack API response
+        :return: The next cursor, or None on the last page
+        """
+        metadata = response.get("response_metadata") or {}
+        return metadata.get("next_cursor") or None
+
+    def iter_scheduled_messages(self, slack_client, latest=None, oldest=None, page_size: int = 100,
+                                prefetch: bool = False) -> Iterator[dict]:
+        """
+        Lazily iterates over all messages scheduled to be posted by the app, following the pagination cursor one page
+        at a time so only a single page is held in memory. Limited to the channel set with set_channel(), if any.
+        :param slack_client: an instance of the Slack Bolt for Python's app.client
+        :param latest: (Optional) Ending date of range to look for scheduled messages as Unix timestamp or Python datetime object
+        :param oldest: (Optional) Starting date of range to look for scheduled messages as Unix timestamp or Python datetime object
+        :param page_size: (Optional) Integer; maximum number of scheduled messages fetched per request; defaults to 100
+        :param prefetch: (Optional) Boolean; fetch the next page in a background thread while the current one is consumed
+        :return: Iterator of scheduled messages
+        """
+        args = self._scheduled_messages_args(latest, oldest, page_size)
+
+        def fetch(cursor):
+            return self._send(slack_client, "chat_scheduledMessages_list",
+                              {**args, "cursor": cursor} if cursor else args)
+
+        if not prefetch:
+            cursor = None
+            while True:
+                response = fetch(cursor)
+                yield from response["scheduled_messages"]
+                cursor = self._next_cursor(response)
+                if not cursor:
+                    return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(fetch, None)
+            while future is not None:
+                response = future.result()
+                cursor = self._next_cursor(response)
+                future = executor.submit(fetch, cursor) if cursor else None
+                yield from response["scheduled_messages"]
+
+    async def iter_scheduled_messages_async(self, slack_client, latest=None, oldest=None, page_size: int = 100,
+                                            prefetch: bool = False) -> AsyncIterator[dict]:
+        """
+        Awaitable version of iter_scheduled_messages() for use with the Slack Bolt for Python's AsyncApp.
+        :param slack_client: an instance of the Slack Bolt for Python's AsyncApp.client (or any AsyncWebClient)
+        :param latest: (Optional) Ending date of range to look for scheduled messages as Unix timestamp or Python datetime object
+        :param oldest: (Optional) Starting date of range to look for scheduled messages as Unix timestamp or Python datetime object
+        :param page_size: (Optional) Integer; maximum number of scheduled messages fetched per request; defaults to 100
+        :param prefetch: (Optional) Boolean; request the next page while the current one is consumed
+        :return: Async iterator of scheduled messages
+        """
+        args = self._scheduled_messages_args(latest, oldest, page_size)
+
+        def fetch(cursor):
+            return self._send_async(slack_client, "chat_scheduledMessages_list",
+                                    {**args, "cursor": cursor} if cursor else args)
+
+        if not prefetch:
+            cursor = None
+            while True:
+                response = await fetch(cursor)
+                for scheduled_message in response["scheduled_messages"]:
+                    yield scheduled_message
+                cursor = self._next_cursor(response)
+                if not cursor:
+                    return
+
+        import asyncio
+
+        task = asyncio.ensure_future(fetch(None))
+        try:
+            while task is not None:
+                response = await task
+                cursor = self._next_cursor(response)
+                task = asyncio.ensure_future(fetch(cursor)) if cursor else None
+                for scheduled_message in response["scheduled_messages"]:
+                    yield scheduled_message
+        finally:
+            if task is not None:
+                task.cancel()
+
     def get_list_of_scheduled_messges(self, slack_client, latest=None, oldest=None) -> list:
         """
-        Fetches a list of all messages scheduled to be posted by the app.
+        Fetches a list of all messages scheduled to be posted by the app, across all pages. Use
+        iter_scheduled_messages() instead when there may be many of them.
         :param slack_client: an instance of the Slack Bolt for Python's app.client
         :param latest: (Optional) Ending date of range to look for scheduled messages as Unix timestamp  or Python datetime object
         :param oldest: (Optional) Starting  date of range to look for scheduled messages as Unix timestamp  or Python datetime object
         :return: A list of scheduled messages
         """
-        if isinstance(latest, datetime):
-            latest = latest.timestamp()
-        if isinstance(oldest, datetime):
-            latest = oldest.timestamp()
-
-        result = slack_client.chat_scheduledMessages_list(
-            channel=self._channel if self._channel else None,
-            latest=latest if latest else None,
-            oldest=oldest if oldest else None
-        )
-        return result["scheduled_messages"]
+        return list(self.iter_scheduled_messages(slack_client, latest, oldest))
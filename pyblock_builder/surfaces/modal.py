@@ -1,32 +1,70 @@
-import sys
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing_extensions import Self
-from pyblock_builder.objects.text import Text
+from pyblock_builder.delivery.dispatch import send, send_async
+from pyblock_builder.serialization import parser
+from pyblock_builder.serialization.encoder import dumps, loads
+from pyblock_builder.serialization.frozen import encode_view, has_frozen
+from pyblock_builder.surfaces.budget import MAX_BLOCKS
+from pyblock_builder.surfaces.surface import Surface
+from pyblock_builder.surfaces.validation import BlockKitValidationError, validate
+from pyblock_builder.surfaces.view_state import StateSchema
+from pyblock_builder.objects.text import label
 
 
-class Modal:
+class Modal(Surface):
     """
     A Python class representing a Modal surface from the Slack BlockKit UI framework
     """
+    __slots__ = ("_type", "_callback_id", "_private_metadata", "_external_id", "_rate_limiter", "_retry_policy",
+                 "_pre_encoded", "_validate_before_send", "_title", "_submit", "_close", "_clear_on_close",
+                 "_notify_on_close", "_submit_disabled")
+
     def __init__(self):
+        super().__init__(MAX_BLOCKS["modal"])
         self._type = "modal"
         self._callback_id = ""
-        self.blocks = []
         self._private_metadata = ""
         self._external_id = ""
-        self._title = {}
+        self._rate_limiter = None
+        self._retry_policy = None
+        self._pre_encoded = False
+        self._validate_before_send = False
+        self._title = None
         self._submit = None
         self._close = None
         self._clear_on_close = False
         self._notify_on_close = False
         self._submit_disabled = False
-        self.view = {
+
+    @property
+    def view(self) -> dict:
+        """
+        The view as a Slack API dict, built from the current attributes
+        """
+        view = {
             "type": self._type,
             "callback_id": self._callback_id,
             "blocks": self.blocks
         }
+        if self._private_metadata:
+            view["private_metadata"] = self._private_metadata
+        if self._external_id:
+            view["external_id"] = self._external_id
+        if self._title is not None:
+            view["title"] = self._title.json
+        if self._submit is not None:
+            view["submit"] = self._submit.json
+        if self._close is not None:
+            view["close"] = self._close.json
+        if self._clear_on_close:
+            view["clear_on_close"] = self._clear_on_close
+        if self._notify_on_close:
+            view["notify_on_close"] = self._notify_on_close
+        if self._submit_disabled:
+            view["submit_disabled"] = self._submit_disabled
+        return view
 
     def set_callback_id(self, callback_id: str) -> Self:
         """
@@ -36,7 +74,6 @@ class Modal:
         :return: self
         """
         self._callback_id = callback_id
-        self.view["callback_id"] = self._callback_id
         return self
 
     def set_external_id(self, external_id: str) -> Self:
@@ -46,7 +83,6 @@ class Modal:
         :return: self
         """
         self._external_id = external_id
-        self.view["external_id"] = self._external_id
         return self
 
     def set_private_metadata(self, metadata: str) -> Self:
@@ -56,28 +92,136 @@ class Modal:
         :return: self
         """
         self._private_metadata = metadata
-        self.view["private_metadata"] = self._private_metadata
         return self
 
-    def add_blocks(self, *blocks) -> Self:
+    def set_rate_limiter(self, rate_limiter) -> Self:
         """
-        (Required) Adds the blocks that define the content of the View
-        :param blocks: One or more blocks; max 100; use * when passing a list
+        (Optional) Paces all Web API calls made by this view through a client-side rate limiter.
+        :param rate_limiter: RateLimiter object, or None to disable
         :return: self
         """
-        for block in blocks:
-            self.blocks.append(block.block)
-        self.view["blocks"] = self.blocks
+        self._rate_limiter = rate_limiter
         return self
 
+    def set_retry_policy(self, retry_policy) -> Self:
+        """
+        (Optional) Retries Web API calls made by this view that fail with rate limit or transient server errors.
+        :param retry_policy: RetryPolicy object, or None to disable
+        :return: self
+        """
+        self._retry_policy = retry_policy
+        return self
+
+    def validate(self) -> list:
+        """
+        Checks the view against Slack's Block Kit rules in a single pass over it: required keys, maximum lengths and
+        item counts, which elements each block accepts, which blocks the surface accepts, and unique block_ids.
+        :return: List of (JSON pointer, message) tuples, i.e. ("/blocks/3/element", "missing required key"); empty
+        when the view is valid
+        """
+        return validate(self.view)
+
+    def validate_before_send(self) -> Self:
+        """
+        (Optional) Validates the view before every Web API call and raises BlockKitValidationError instead of sending
+        a view Slack would reject. See validate().
+        :return: self
+        """
+        self._validate_before_send = True
+        return self
+
+    def state_schema(self) -> StateSchema:
+        """
+        Derives the decoding plan of this modal's state from its elements, for reading view_submission and
+        block_actions payloads with ViewState. Build it once per modal definition rather than once per payload.
+        :return: StateSchema
+        """
+        return StateSchema.from_modal(self)
+
+    def send_pre_encoded(self) -> Self:
+        """
+        (Optional) Sends the view to the Web API as a JSON string encoded with orjson when it is installed, rather than
+        as a dict for the Slack client to encode with the standard library json module.
+        :return: self
+        """
+        self._pre_encoded = True
+        return self
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encodes the view to compact JSON with orjson when it is installed, or the standard library json module
+        otherwise. See pyblock_builder.serialization.set_backend().
+        :return: bytes
+        """
+        return dumps(self.view)
+
+    @classmethod
+    def from_dict(cls, view: dict) -> Modal:
+        """
+        Loads a view dict, i.e. body["view"] from an interaction payload or a view exported from Block Kit Builder.
+        Keys only the Web API sets, such as the view id, hash and state, are skipped. The blocks are loaded lazily and
+        render as the dicts they were loaded from until they are changed. See pyblock_builder.serialization.from_dict().
+        :param view: View dict of type "modal"
+        :return: Modal
+        """
+        if view.get("type") != "modal":
+            raise ValueError(f"Cannot load a view of type {view.get('type')} into a Modal")
+        return parser.from_dict(view, "surface")
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> Modal:
+        """
+        Decodes a JSON view and loads it. See from_dict().
+        :param data: String or bytes of JSON
+        :return: Modal
+        """
+        return cls.from_dict(loads(data))
+
+    def _view_body(self) -> dict | str:
+        """
+        Returns the view to send to the Web API: the view dict itself, or a JSON string when sending pre-encoded
+        views or when the view has frozen blocks, whose pre-encoded bytes are spliced in
+        :return: dict or str
+        """
+        if self._pre_encoded or has_frozen(self._blocks):
+            return encode_view(self.view)
+        return self.view
+
+    def _send(self, slack_client, client_method: str, kwargs: dict):
+        """
+        Calls a Web API method through the rate limiter and retry policy set on this instance
+        :param slack_client: an instance of the Slack Bolt for Python's app.client
+        :param client_method: String; name of the client method, i.e. "chat_postMessage"
+        :param kwargs: Arguments for the Web API method
+        :return: Slack API response
+        """
+        if self._validate_before_send:
+            violations = self.validate()
+            if violations:
+                raise BlockKitValidationError(violations)
+        return send(slack_client, client_method, kwargs, self._rate_limiter, self._retry_policy)
+
+    async def _send_async(self, slack_client, client_method: str, kwargs: dict):
+        """
+        Awaitable version of _send()
+        :param slack_client: an instance of the Slack Bolt for Python's AsyncApp.client (or any AsyncWebClient)
+        :param client_method: String; name of the client method, i.e. "chat_postMessage"
+        :param kwargs: Arguments for the Web API method
+        :return: Slack API response
+        """
+        if self._validate_before_send:
+            violations = self.validate()
+            if violations:
+                raise BlockKitValidationError(violations)
+        return await send_async(slack_client, client_method, kwargs, self._rate_limiter, self._retry_policy)
+
     def set_title(self, title_text: str) -> Self:
         """
         Sets the title that appears in the top-left corner of the Modal
         :param title_text: String; max 24 chars
         :return: self
         """
-        self._title = Text().set_text(title_text)
-        self.view["title"] = self._title.json
+        self._title = label(title_text)
         return self
 
     def set_submit_label(self, submit_text: str) -> Self:
@@ -87,8 +231,7 @@ class Modal:
         :param submit_text: String; max 24 chars
         :return: self
         """
-        self._submit = Text().set_text(submit_text)
-        self.view["submit"] = self._submit.json
+        self._submit = label(submit_text)
         return self
 
     def set_close_label(self, close_text: str) -> Self:
@@ -97,8 +240,7 @@ class Modal:
         :param close_text: String; max 24 chars
         :return: self
         """
-        self._close = Text().set_text(close_text)
-        self.view["close"] = self._close.json
+        self._close = label(close_text)
         return self
 
     def clear_on_close(self) -> Self:
@@ -107,7 +249,6 @@ class Modal:
         :return: self
         """
         self._clear_on_close = True
-        self.view["clear_on_close"] = self._clear_on_close
         return self
 
     def notify_on_close(self) -> Self:
@@ -117,7 +258,6 @@ class Modal:
         :return: self
         """
         self._notify_on_close = True
-        self.view["notify_on_close"] = self._notify_on_close
         return self
 
     def submit_disabled(self) -> Self:
@@ -127,9 +267,56 @@ class Modal:
         :return: self
         """
         self._submit_disabled = True
-        self.view["submit_disabled"] = self._submit_disabled
         return self
 
+    def _open_view_args(self, request_body) -> dict:
+        """
+        Builds the arguments for the views.open Web API method
+        :param request_body: the response passed to the app from the Slack API
+        :return: dict
+        """
+        return {
+            "trigger_id": request_body["trigger_id"],
+            "view_id": request_body["view"]["id"],
+            "hash": request_body["view"]["hash"],
+            "view": self._view_body()
+        }
+
+    def _update_view_args(self, request_body, view_id=None, exclude_hash=False) -> dict:
+        """
+        Builds the arguments for the views.update Web API method
+        :param request_body: the response passed to the app from the Slack API
+        :param view_id: (Optional) Required to update a view after the initial 3-second timeout
+        :param exclude_hash: (Optional) Can be used to disable the inclusion of a hash value
+        :return: dict
+        """
+        if not view_id:
+            view_id = request_body["view"]["id"]
+
+        if not exclude_hash:
+            return {
+                "view_id": view_id,
+                "hash": request_body["view"]["hash"],
+                "view": self._view_body()
+            }
+        return {
+            "view_id": view_id,
+            "view": self._view_body()
+        }
+
+    def _push_view_args(self, request_body) -> dict:
+        """
+        Builds the arguments for the views.push Web API method
+        :param request_body: the response passed to the app from the Slack API
+        :return: dict
+        """
+        return {
+            "trigger_id": request_body["trigger_id"],
+            "view_id": request_body["view"]["id"],
+            "hash": request_body["view"]["hash"],
+            "view": self._view_body()
+        }
+
     def open_view(self, request_body, slack_client):
         """
         Uses the attributes set on the class to generate a view payload and passes it to the views.open Web API method
@@ -138,12 +325,17 @@ class Modal:
         :param slack_client: an instance of the Slack Bolt for Python's app.client
         :return: Slack API response
         """
-        result = slack_client.views_open(
-            trigger_id=request_body["trigger_id"],
-            view_id=request_body["view"]["id"],
-            hash=request_body["view"]["hash"],
-            view=self.view
-        )
+        result = self._send(slack_client, "views_open", self._open_view_args(request_body))
+        return result
+
+    async def open_view_async(self, request_body, slack_client):
+        """
+        Awaitable version of open_view() for use with the Slack Bolt for Python's AsyncApp.
+        :param request_body: the response passed to the app from the Slack API
+        :param slack_client: an instance of the Slack Bolt for Python's AsyncApp.client (or any AsyncWebClient)
+        :return: Slack API response
+        """
+        result = await self._send_async(slack_client, "views_open", self._open_view_args(request_body))
         return result
 
     def update_view(self, request_body, slack_client, view_id=None, exclude_hash=False):
@@ -156,20 +348,21 @@ class Modal:
         :param exclude_hash: (Optional) Can be used to disable the inclusion of a hash value. May be necessary when updating a view after 3-second timeout
         :return: Slack API response
         """
-        if not view_id:
-            view_id = request_body["view"]["id"]
+        args = self._update_view_args(request_body, view_id, exclude_hash)
+        result = self._send(slack_client, "views_update", args)
+        return result
 
-        if not exclude_hash:
-            result = slack_client.views_update(
-                view_id=view_id,
-                hash=request_body["view"]["hash"],
-                view=self.view
-            )
-        else:
-            result = slack_client.views_update(
-                view_id=view_id,
-                view=self.view
-            )
+    async def update_view_async(self, request_body, slack_client, view_id=None, exclude_hash=False):
+        """
+        Awaitable version of update_view() for use with the Slack Bolt for Python's AsyncApp.
+        :param request_body: the response passed to the app from the Slack API
+        :param slack_client: an instance of the Slack Bolt for Python's AsyncApp.client (or any AsyncWebClient)
+        :param view_id: (Optional) Required to update a view after the initial 3-second timeout
+        :param exclude_hash: (Optional) Can be used to disable the inclusion of a hash value
+        :return: Slack API response
+        """
+        args = self._update_view_args(request_body, view_id, exclude_hash)
+        result = await self._send_async(slack_client, "views_update", args)
         return result
 
     def push_view(self, request_body, slack_client):
@@ -180,12 +373,17 @@ class Modal:
         :param slack_client: an instance of the Slack Bolt for Python's app.client
         :return: Slack API response
         """
-        result = slack_client.views_push(
-            trigger_id=request_body["trigger_id"],
-            view_id=request_body["view"]["id"],
-            hash=request_body["view"]["hash"],
-            view=self.view
-        )
+        result = self._send(slack_client, "views_push", self._push_view_args(request_body))
+        return result
+
+    async def push_view_async(self, request_body, slack_client):
+        """
+        Awaitable version of push_view() for use with the Slack Bolt for Python's AsyncApp.
+        :param request_body: the response passed to the app from the Slack API
+        :param slack_client: an instance of the Slack Bolt for Python's AsyncApp.client (or any AsyncWebClient)
+        :return: Slack API response
+        """
+        result = await self._send_async(slack_client, "views_push", self._push_view_args(request_body))
         return result
 
     def update_view_from_submission(self, ack):
@@ -0,0 +1,210 @@
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing_extensions import Self
+from pyblock_builder.serialization.frozen import Frozen
+from pyblock_builder.surfaces.block_index import BlockIndex
+from pyblock_builder.surfaces.budget import BlockBudget, BlockKitLimitError
+
+
+class Surface:
+    """
+    The blocks of a Message, Modal or AppHome, with the budget that measures them against Slack's limits and the
+    index that finds them by block_id or action_id. Subclasses add the fields and Web API calls of their surface.
+    """
+    __slots__ = ("_blocks", "_budget", "_strict_limits", "_index", "_auto_block_ids", "_next_block_id", "_shared")
+
+    # Slots of a subclass that clone() gives a shallow copy of rather than sharing, i.e. lists the clone appends to
+    _UNSHARED = ()
+
+    def __init__(self, max_blocks: int):
+        """
+        :param max_blocks: Integer; the most blocks the surface accepts, from MAX_BLOCKS
+        """
+        self._blocks = []
+        self._budget = BlockBudget(max_blocks)
+        self._strict_limits = False
+        self._index = BlockIndex()
+        self._auto_block_ids = None
+        self._next_block_id = 0
+        self._shared = None
+
+    @property
+    def blocks(self) -> list:
+        """
+        The blocks of the surface as Slack API dicts, built from the blocks added so far
+        """
+        return [block.block for block in self._blocks]
+
+    def add_blocks(self, *blocks) -> Self:
+        """
+        Adds one or more layout blocks to the surface. Required for views.
+        :param blocks: One or more blocks, i.e. Actions, Sections, Inputs, or frozen blocks from freeze(); max 50 for
+        a message and 100 for a view; use * when passing a list
+        :return: self
+        """
+        if self._strict_limits:
+            self._budget.catch_up(self._blocks)
+        for block in blocks:
+            if self._strict_limits:
+                measurement = self._budget.measure(block.block)
+                if measurement["violations"]:
+                    raise BlockKitLimitError("; ".join(measurement["violations"]))
+                self._budget.add(measurement)
+            if self._auto_block_ids is not None:
+                self._assign_block_id(block)
+            self._blocks.append(block)
+        return self
+
+    def auto_block_ids(self, prefix: str = "block_") -> Self:
+        """
+        (Optional) Gives every block without a block_id, including the ones already added, a block_id made of the
+        prefix and a counter, i.e. block_0, block_1. The same sequence of calls always produces the same block_ids, so
+        they can be used with get_block() and in interaction handlers. Frozen blocks keep the block_id they had.
+        :param prefix: (Optional) String; defaults to "block_"; should not be the start of any block_id set by hand
+        :return: self
+        """
+        self._auto_block_ids = prefix
+        for block in self._blocks:
+            self._assign_block_id(block)
+        self._index = BlockIndex()
+        return self
+
+    def _assign_block_id(self, block):
+        """
+        Gives a block the next automatic block_id if it has none and can be changed
+        """
+        if type(block) is not Frozen and block.block.get("block_id") is None:
+            block.set_block_id(f"{self._auto_block_ids}{self._next_block_id}")
+            self._next_block_id += 1
+
+    def clone(self) -> Self:
+        """
+        Copies the surface for a variant of it, i.e. one per user. The copy shares its block objects with this one
+        rather than copying them: a shared block is only copied, on either side, when it is fetched with get_block()
+        to be changed, so a variant costs memory for the blocks it changes and not for the others. Blocks replaced,
+        removed or inserted on one of them do not affect the other. Blocks must be changed through get_block() after
+        cloning, not through references kept from before.
+        :return: A new surface of the same class
+        """
+        import copy
+
+        self._index.catch_up(self._blocks)
+        shared = set(map(id, self._blocks))
+        if self._shared:
+            self._shared |= shared
+        else:
+            self._shared = shared
+        clone = copy.copy(self)
+        clone._blocks = list(self._blocks)
+        clone._budget = self._budget.copy()
+        clone._index = self._index.copy()
+        clone._shared = set(shared)
+        for name in self._UNSHARED:
+            setattr(clone, name, copy.copy(getattr(self, name)))
+        return clone
+
+    def get_block(self, key: str):
+        """
+        Finds a block by its block_id, or by the action_id of one of its elements, through an index kept alongside
+        the blocks rather than by scanning them
+        :param key: String; block_id or action_id
+        :return: The block object as it was added, i.e. a Section or a frozen block, or a copy of it made for this
+        surface if it was shared with a clone. Since it is fetched to be changed, the blocks are measured again the
+        next time budget() or strict mode needs them.
+        """
+        position = self._index.position(self._blocks, key)
+        block = self._blocks[position]
+        if self._shared and id(block) in self._shared and type(block) is not Frozen:
+            import copy
+
+            self._shared.discard(id(block))
+            block = self._blocks[position] = copy.deepcopy(block)
+        self._block_fetched(position)
+        return block
+
+    def _block_fetched(self, position: int):
+        """
+        Forgets what was measured of a block returned by get_block(), which may be changed in place
+        :param position: Integer; position of the block
+        """
+        self._budget.reset()
+
+    def replace_block(self, key: str, block) -> Self:
+        """
+        Replaces a block, found by its block_id or the action_id of one of its elements, with another one
+        :param key: String; block_id or action_id
+        :param block: Block object or frozen block
+        :return: self
+        """
+        position = self._index.position(self._blocks, key)
+        if self._auto_block_ids is not None:
+            self._assign_block_id(block)
+        if self._strict_limits:
+            self._budget.check((block,), position, len(self._blocks))
+        self._blocks[position] = block
+        self._index.replaced(position, block)
+        self._blocks_changed(position)
+        return self
+
+    def remove_block(self, key: str) -> Self:
+        """
+        Removes a block, found by its block_id or the action_id of one of its elements
+        :param key: String; block_id or action_id
+        :return: self
+        """
+        position = self._index.position(self._blocks, key)
+        del self._blocks[position]
+        self._index.removed(position)
+        self._blocks_changed(position)
+        return self
+
+    def insert_after(self, key: str, *blocks) -> Self:
+        """
+        Inserts blocks right after a block, found by its block_id or the action_id of one of its elements
+        :param key: String; block_id or action_id
+        :param blocks: One or more blocks or frozen blocks from freeze(); use * when passing a list
+        :return: self
+        """
+        position = self._index.position(self._blocks, key) + 1
+        if self._auto_block_ids is not None:
+            for block in blocks:
+                self._assign_block_id(block)
+        if self._strict_limits:
+            self._budget.check(blocks, position, len(self._blocks) + len(blocks))
+        self._blocks[position:position] = blocks
+        self._index.inserted(position, blocks)
+        self._blocks_changed(position)
+        return self
+
+    def _blocks_changed(self, position: int):
+        """
+        Measures the blocks again after some were replaced, removed or inserted rather than added at the end
+        :param position: Integer; position of the first block that changed
+        """
+        self._budget.reset()
+        if self._strict_limits:
+            self._budget.catch_up(self._blocks)
+
+    def strict_limits(self) -> Self:
+        """
+        (Optional) Makes add_blocks() raise BlockKitLimitError when a block would break one of Slack's Block Kit
+        limits, i.e. too many blocks or text that is too long, instead of finding out from the Web API later.
+        :return: self
+        """
+        self._budget.catch_up(self._blocks)
+        if self._budget.violations:
+            raise BlockKitLimitError("; ".join(self._budget.violations))
+        self._strict_limits = True
+        return self
+
+    def budget(self) -> dict:
+        """
+        Reports how much of Slack's Block Kit limits the blocks added so far use: the number of blocks and how many
+        are left, the approximate encoded size in bytes, the longest text, the longest option list, and any limits
+        already broken. Each block is measured once, the first time this is called after it was added (or as it is
+        added in strict mode), so this stays cheap to call as blocks are added.
+        :return: dict
+        """
+        self._budget.catch_up(self._blocks)
+        return self._budget.report()
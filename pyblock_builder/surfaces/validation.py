@@ -0,0 +1,277 @@
+from pyblock_builder.surfaces.budget import DEFAULT_MAX_OPTIONS, DEFAULT_MAX_TEXT, MAX_BLOCKS, MAX_ITEMS, MAX_TEXT
+
+
+class BlockKitValidationError(ValueError):
+    """
+    Raised by surfaces set to validate_before_send() when the view or message breaks one of Slack's Block Kit rules
+    """
+
+    def __init__(self, violations: list):
+        """
+        :param violations: List of (JSON pointer, message) tuples from validate()
+        """
+        self.violations = violations
+        super().__init__("; ".join(f"{pointer}: {message}" for pointer, message in violations))
+
+
+TEXT = frozenset(("plain_text", "mrkdwn"))
+PLAIN_TEXT = frozenset(("plain_text",))
+SELECTS = frozenset(("static_select", "external_select", "users_select", "conversations_select",
+                     "channels_select"))
+MULTI_SELECTS = frozenset("multi_" + select for select in SELECTS)
+BLOCKS = frozenset(("actions", "context", "divider", "file", "header", "image", "input", "rich_text", "section",
+                    "video"))
+
+# Block types each surface accepts
+SURFACE_BLOCKS = {
+    "message": BLOCKS,
+    "modal": BLOCKS - {"file"},
+    "home": BLOCKS - {"file"},
+}
+
+# Keys a block, element or object must have, by type. None, empty strings, dicts and lists count as missing.
+REQUIRED = {
+    "modal": ("title",),
+    "actions": ("elements",),
+    "context": ("elements",),
+    "file": ("external_id", "source"),
+    "header": ("text",),
+    "image": ("image_url", "alt_text"),
+    "input": ("label", "element"),
+    "video": ("alt_text", "title", "thumbnail_url", "video_url"),
+    "button": ("text",),
+    "checkboxes": ("options",),
+    "radio_buttons": ("options",),
+    "overflow": ("options",),
+    "option": ("text", "value"),
+    "option_group": ("label", "options"),
+    "confirm": ("title", "text", "confirm", "deny"),
+}
+
+# Keys of which a block, element or object must have at least one, by type
+REQUIRED_ONE_OF = {
+    "section": ("text", "fields"),
+    "static_select": ("options", "option_groups"),
+    "multi_static_select": ("options", "option_groups"),
+}
+
+# What a field may hold, by (type of the block, element or object holding it, field); None matches any type. A set
+# lists the accepted values of the "type" key, a string names the type of objects that have no "type" key of their own.
+CHILDREN = {
+    ("message", "blocks"): SURFACE_BLOCKS["message"],
+    ("modal", "blocks"): SURFACE_BLOCKS["modal"],
+    ("modal", "title"): PLAIN_TEXT,
+    ("modal", "submit"): PLAIN_TEXT,
+    ("modal", "close"): PLAIN_TEXT,
+    ("home", "blocks"): SURFACE_BLOCKS["home"],
+    ("actions", "elements"): frozenset(("button", "checkboxes", "datepicker", "datetimepicker", "overflow",
+                                        "radio_buttons", "timepicker")) | SELECTS | MULTI_SELECTS,
+    ("context", "elements"): frozenset(("image",)) | TEXT,
+    ("header", "text"): PLAIN_TEXT,
+    ("image", "title"): PLAIN_TEXT,
+    ("input", "label"): PLAIN_TEXT,
+    ("input", "hint"): PLAIN_TEXT,
+    ("input", "element"): frozenset(("checkboxes", "datepicker", "datetimepicker", "email_text_input",
+                                     "number_input", "plain_text_input", "radio_buttons", "timepicker",
+                                     "url_text_input")) | SELECTS | MULTI_SELECTS,
+    ("section", "text"): TEXT,
+    ("section", "fields"): TEXT,
+    ("section", "accessory"): frozenset(("button", "checkboxes", "datepicker", "image", "overflow", "radio_buttons",
+                                         "timepicker")) | SELECTS | MULTI_SELECTS,
+    ("video", "title"): PLAIN_TEXT,
+    ("video", "description"): PLAIN_TEXT,
+    ("button", "text"): PLAIN_TEXT,
+    ("option", "text"): TEXT,
+    ("option", "description"): TEXT,
+    ("option_group", "label"): PLAIN_TEXT,
+    ("confirm", "title"): PLAIN_TEXT,
+    ("confirm", "text"): TEXT,
+    ("confirm", "confirm"): PLAIN_TEXT,
+    ("confirm", "deny"): PLAIN_TEXT,
+    (None, "placeholder"): PLAIN_TEXT,
+    (None, "confirm"): "confirm",
+    (None, "options"): "option",
+    (None, "initial_option"): "option",
+    (None, "initial_options"): "option",
+    (None, "option_groups"): "option_group",
+}
+
+# Maximum length of a text object, on top of the ones the surface budgets track
+TEXT_LIMITS = {
+    **MAX_TEXT,
+    ("modal", "title"): 24,
+    ("modal", "submit"): 24,
+    ("modal", "close"): 24,
+    ("image", "title"): 2000,
+    ("video", "title"): 200,
+    ("option", "text"): 75,
+    ("option", "description"): 75,
+    ("option_group", "label"): 75,
+    ("confirm", "title"): 100,
+    ("confirm", "text"): 300,
+    ("confirm", "confirm"): 30,
+    ("confirm", "deny"): 30,
+    (None, "placeholder"): 150,
+}
+
+# Maximum number of items in a list field, on top of the ones the surface budgets track
+ITEM_LIMITS = {
+    **MAX_ITEMS,
+    **{(surface, "blocks"): limit for surface, limit in MAX_BLOCKS.items()},
+    (None, "options"): DEFAULT_MAX_OPTIONS,
+    (None, "initial_options"): DEFAULT_MAX_OPTIONS,
+    (None, "option_groups"): DEFAULT_MAX_OPTIONS,
+}
+
+# Maximum length of a string field, by (type of the block, element or object holding it, field)
+MAX_LENGTHS = {
+    ("message", "text"): 40000,
+    ("modal", "callback_id"): 255,
+    ("modal", "private_metadata"): 3000,
+    ("modal", "external_id"): 255,
+    ("home", "callback_id"): 255,
+    ("home", "private_metadata"): 3000,
+    ("home", "external_id"): 255,
+    ("button", "value"): 2000,
+    ("option", "value"): 150,
+    (None, "block_id"): 255,
+    (None, "action_id"): 255,
+    (None, "url"): 3000,
+    (None, "image_url"): 3000,
+    (None, "alt_text"): 2000,
+}
+
+
+class _Rule:
+    """
+    The rules of one type, compiled from the tables above so that checking a node needs a single dict lookup per key:
+    fields maps each key with a rule to either its maximum length or a (accepted types, text limit, item limit) tuple
+    """
+    __slots__ = ("required", "one_of", "fields")
+
+    def __init__(self, node_type):
+        self.required = REQUIRED.get(node_type, ())
+        self.one_of = REQUIRED_ONE_OF.get(node_type, ())
+        self.fields = _for_type(MAX_LENGTHS, node_type)
+        accepts = _for_type(CHILDREN, node_type)
+        texts = _for_type(TEXT_LIMITS, node_type)
+        items = _for_type(ITEM_LIMITS, node_type)
+        self.fields.update({field: (accepts[field], texts.get(field, DEFAULT_MAX_TEXT), items.get(field))
+                            for field in accepts})
+
+
+def _for_type(table: dict, node_type: str) -> dict:
+    """
+    Picks the entries of a (type, field) table that apply to a type, the type's own entries winning over None ones
+    """
+    entries = {field: value for (owner, field), value in table.items() if owner is None}
+    entries.update({field: value for (owner, field), value in table.items() if owner == node_type})
+    return entries
+
+
+def _compile() -> dict:
+    types = set(SURFACE_BLOCKS)
+    for accepts in CHILDREN.values():
+        types.update((accepts,) if isinstance(accepts, str) else accepts)
+    return {node_type: _Rule(node_type) for node_type in types - TEXT}
+
+
+_RULES = _compile()
+
+
+def validate(surface: dict, surface_type: str = None) -> list:
+    """
+    Checks a view or message payload against Slack's Block Kit rules in a single pass: required keys, maximum lengths
+    and item counts, which elements each block accepts, which blocks the surface accepts, and unique block_ids.
+    :param surface: View dict, i.e. Modal.view, or chat.* payload dict with the blocks as dicts
+    :param surface_type: (Optional) "modal", "home" or "message"; defaults to the "type" of the view
+    :return: List of (JSON pointer, message) tuples, i.e. ("/blocks/3/text", "missing required key"); empty when
+    the surface is valid
+    """
+    surface_type = surface_type or surface.get("type")
+    if surface_type not in SURFACE_BLOCKS:
+        raise ValueError(f"Unknown surface type: {surface_type}. Must be one of {', '.join(SURFACE_BLOCKS)}")
+    violations = []
+    _check(surface, _RULES[surface_type], (), violations)
+
+    blocks = surface.get("blocks")
+    if isinstance(blocks, list):
+        block_ids = set()
+        has_input = False
+        for index, block in enumerate(blocks):
+            if not isinstance(block, dict):
+                continue
+            block_id = block.get("block_id")
+            if block_id is not None:
+                if block_id in block_ids:
+                    violations.append((f"/blocks/{index}/block_id", f"duplicate block_id {block_id!r}"))
+                block_ids.add(block_id)
+            has_input = has_input or block.get("type") == "input"
+        if surface_type == "modal" and has_input and not surface.get("submit"):
+            violations.append(("/submit", "required when the modal has input blocks"))
+    return violations
+
+
+def _pointer(path: tuple) -> str:
+    """
+    Formats the nested (parent, key) tuples built during the traversal as a JSON pointer, i.e. /blocks/2/fields/0
+    """
+    keys = []
+    while path:
+        path, key = path
+        keys.append(str(key).replace("~", "~0").replace("/", "~1"))
+    return "/" + "/".join(reversed(keys))
+
+
+def _check(node: dict, rule: _Rule, path: tuple, violations: list):
+    """
+    Checks a block, element or object against its compiled rule, then each of its children against theirs. Text
+    objects, the most common children, are checked inline.
+    """
+    for key in rule.required:
+        if not node.get(key):
+            violations.append((_pointer((path, key)), "missing required key"))
+    if rule.one_of and not any(node.get(key) for key in rule.one_of):
+        violations.append((_pointer(path), f"must have one of {', '.join(rule.one_of)}"))
+
+    fields = rule.fields
+    for key, value in node.items():
+        spec = fields.get(key)
+        if spec is None:
+            continue
+        if type(spec) is int:
+            if type(value) is str and len(value) > spec:
+                violations.append((_pointer((path, key)), f"{len(value)} characters, limit is {spec}"))
+            continue
+        accepts, text_limit, item_limit = spec
+        if type(value) is list:
+            if item_limit is not None and len(value) > item_limit:
+                violations.append((_pointer((path, key)), f"{len(value)} items, limit is {item_limit}"))
+            items = value
+            list_path = (path, key)
+        elif value or (value is not None and key not in rule.required):
+            items = (value,)
+            list_path = None
+        else:
+            continue
+
+        for index, item in enumerate(items):
+            item_path = (list_path, index) if list_path is not None else (path, key)
+            if not isinstance(item, dict):
+                violations.append((_pointer(item_path), "must be an object"))
+            elif type(accepts) is str:
+                _check(item, _RULES[accepts], item_path, violations)
+            else:
+                item_type = item.get("type")
+                if item_type not in accepts:
+                    message = "missing type" if item_type is None else f"type {item_type!r} is not allowed here"
+                    violations.append((_pointer(item_path), message))
+                elif item_type == "plain_text" or item_type == "mrkdwn":
+                    text = item.get("text")
+                    if not text:
+                        violations.append((_pointer((item_path, "text")), "missing required key"))
+                    elif len(text) > text_limit:
+                        violations.append((_pointer((item_path, "text")),
+                                           f"{len(text)} characters, limit is {text_limit}"))
+                else:
+                    _check(item, _RULES[item_type], item_path, violations)
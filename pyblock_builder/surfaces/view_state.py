@@ -0,0 +1,238 @@
+from __future__ import annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from pyblock_builder.surfaces.modal import Modal
+from datetime import date, datetime, time, timezone
+
+
+def _value(state: dict):
+    return state.get("value")
+
+
+def _number(state: dict):
+    value = state.get("value")
+    if value is None or not value.strip():
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def _date(state: dict):
+    value = state.get("selected_date")
+    return date.fromisoformat(value) if value else None
+
+
+def _time(state: dict):
+    value = state.get("selected_time")
+    return time.fromisoformat(value) if value else None
+
+
+def _datetime(state: dict):
+    value = state.get("selected_date_time")
+    return datetime.fromtimestamp(value, tz=timezone.utc) if value is not None else None
+
+
+def _option(state: dict):
+    option = state.get("selected_option")
+    return option["value"] if option else None
+
+
+def _options(state: dict):
+    return [option["value"] for option in state.get("selected_options") or ()]
+
+
+def _key(key: str):
+    def decode(state: dict):
+        return state.get(key)
+    return decode
+
+
+# How the state of each element type is decoded: text inputs to their string, number inputs to int or float, date
+# and time pickers to date, time and timezone-aware UTC datetime objects, and menus to the selected value(s)
+DECODERS = {
+    "plain_text_input": _value,
+    "email_text_input": _value,
+    "url_text_input": _value,
+    "number_input": _number,
+    "datepicker": _date,
+    "timepicker": _time,
+    "datetimepicker": _datetime,
+    "static_select": _option,
+    "external_select": _option,
+    "radio_buttons": _option,
+    "multi_static_select": _options,
+    "multi_external_select": _options,
+    "checkboxes": _options,
+    "users_select": _key("selected_user"),
+    "multi_users_select": _key("selected_users"),
+    "conversations_select": _key("selected_conversation"),
+    "multi_conversations_select": _key("selected_conversations"),
+    "channels_select": _key("selected_channel"),
+    "multi_channels_select": _key("selected_channels"),
+    "rich_text_input": _key("rich_text_value"),
+}
+
+# Marks an action_id used by more than one block, which can only be looked up together with its block_id
+_AMBIGUOUS = object()
+_MISSING = object()
+
+
+class StateSchema:
+    """
+    The decoding plan of a modal's state: for each action_id, the block_id it is found under when the block sets
+    one, and the decoder for its element type. Build it once per modal definition, i.e. at import time next to the
+    function that builds the modal, and pass it to every ViewState of that modal.
+    """
+    __slots__ = ("_fields",)
+
+    def __init__(self):
+        self._fields = {}
+
+    @classmethod
+    def from_modal(cls, modal: Modal) -> StateSchema:
+        """
+        Derives the schema from the elements with an action_id in the input, section and actions blocks of a modal
+        :param modal: Modal, or any surface with a blocks property
+        :return: StateSchema
+        """
+        schema = cls()
+        for block in modal.blocks:
+            block_id = block.get("block_id")
+            elements = list(block.get("elements") or ())
+            elements.extend(element for element in (block.get("element"), block.get("accessory")) if element)
+            for element in elements:
+                action_id = element.get("action_id")
+                decoder = DECODERS.get(element.get("type"))
+                if action_id and decoder is not None:
+                    schema._fields[action_id] = (block_id, decoder) if action_id not in schema._fields else _AMBIGUOUS
+        return schema
+
+    def __contains__(self, action_id: str) -> bool:
+        return action_id in self._fields
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+
+class ViewState:
+    """
+    Read access to the state.values of a view_submission or block_actions payload, by action_id alone. Values are
+    decoded to Python types the first time they are read, and cached. With a StateSchema, action_ids whose block sets
+    its block_id are found without looking through the other blocks; the others are indexed in one pass over the
+    state the first time one of them is read.
+    """
+    __slots__ = ("_values", "_schema", "_index", "_decoded")
+
+    def __init__(self, values: dict, schema: StateSchema = None):
+        """
+        :param values: The state.values dict of a view, keyed by block_id then action_id
+        :param schema: (Optional) StateSchema of the modal, from StateSchema.from_modal() or Modal.state_schema()
+        """
+        self._values = values
+        self._schema = schema
+        self._index = None
+        self._decoded = {}
+
+    @classmethod
+    def from_payload(cls, payload: dict, schema: StateSchema = None) -> ViewState:
+        """
+        Reads the state of a view_submission or block_actions payload, i.e. the body passed to a Bolt listener
+        :param payload: Payload dict; the state of its view is used, or its own state for actions in messages
+        :param schema: (Optional) StateSchema of the modal
+        :return: ViewState
+        """
+        view = payload.get("view") or {}
+        state = view.get("state") or payload.get("state") or {}
+        return cls(state.get("values") or {}, schema)
+
+    def _build_index(self) -> dict:
+        index = {}
+        for block_id, actions in self._values.items():
+            for action_id in actions:
+                index[action_id] = block_id if action_id not in index else _AMBIGUOUS
+        self._index = index
+        return index
+
+    def _locate(self, action_id: str) -> tuple:
+        """
+        Finds the state of an action_id
+        :return: Tuple of the raw state dict and its decoder, which is None when the schema does not know the action_id
+        """
+        planned = self._schema._fields.get(action_id) if self._schema is not None else None
+        if planned is not None and planned is not _AMBIGUOUS:
+            block_id, decoder = planned
+            state = self._values.get(block_id, {}).get(action_id) if block_id is not None else None
+            if state is not None:
+                return state, decoder
+        else:
+            decoder = None
+        index = self._index if self._index is not None else self._build_index()
+        block_id = index.get(action_id)
+        if block_id is None:
+            raise KeyError(action_id)
+        if block_id is _AMBIGUOUS:
+            raise KeyError(f"{action_id} is used by more than one block; read it with value(block_id, action_id)")
+        return self._values[block_id][action_id], decoder
+
+    def __getitem__(self, action_id: str):
+        """
+        :param action_id: String; action_id of the element
+        :return: The decoded value of the element, i.e. a date for a datepicker or a list of values for checkboxes
+        """
+        value = self._decoded.get(action_id, _MISSING)
+        if value is not _MISSING:
+            return value
+        state, decoder = self._locate(action_id)
+        value = self._decoded[action_id] = (decoder or DECODERS.get(state.get("type"), _value))(state)
+        return value
+
+    def get(self, action_id: str, default=None):
+        """
+        :param action_id: String; action_id of the element
+        :param default: (Optional) Returned when no block has the action_id
+        :return: The decoded value of the element, or default
+        """
+        try:
+            return self[action_id]
+        except KeyError:
+            return default
+
+    def value(self, block_id: str, action_id: str):
+        """
+        Reads an element by block_id and action_id, for action_ids used by more than one block
+        :param block_id: String; block_id of the block
+        :param action_id: String; action_id of the element
+        :return: The decoded value of the element
+        """
+        state = self._values[block_id][action_id]
+        return DECODERS.get(state.get("type"), _value)(state)
+
+    def raw(self, action_id: str) -> dict:
+        """
+        :param action_id: String; action_id of the element
+        :return: The undecoded state dict of the element, i.e. {"type": "timepicker", "selected_time": "09:30",
+        "timezone": "Europe/Paris"}
+        """
+        return self._locate(action_id)[0]
+
+    def to_dict(self) -> dict:
+        """
+        Decodes every element whose action_id is used by a single block
+        :return: Dict of action_id to decoded value
+        """
+        index = self._index if self._index is not None else self._build_index()
+        return {action_id: self[action_id] for action_id, block_id in index.items() if block_id is not _AMBIGUOUS}
+
+    def __contains__(self, action_id: str) -> bool:
+        index = self._index if self._index is not None else self._build_index()
+        return action_id in index
+
+    def __iter__(self):
+        index = self._index if self._index is not None else self._build_index()
+        return iter(index)
+
+    def __len__(self) -> int:
+        index = self._index if self._index is not None else self._build_index()
+        return len(index)
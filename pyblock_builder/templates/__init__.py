@@ -0,0 +1,14 @@
+from pyblock_builder import _lazy
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .template import Slot, Template
+
+_EXPORTS = {
+    "Slot": ".template",
+    "Template": ".template",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = _lazy.lazy_module(__name__, _EXPORTS)
@@ -0,0 +1,136 @@
+import copy
+import re
+
+_SLOT_PATTERN = re.compile(r"\{\{slot:([A-Za-z_][A-Za-z0-9_]*)\}\}")
+
+
+class Slot(str):
+    """
+    A named placeholder that can be passed to any builder method expecting a string, i.e.
+    Text().set_text(Slot("user_name")). Slots may also be embedded in longer strings, such as
+    md.bold(Slot("user_name")) or f"Hello {Slot('user_name')}", and are filled in by Template.render().
+    """
+    def __new__(cls, name: str):
+        if not name.isidentifier():
+            raise ValueError(f"Invalid slot name: {name!r}. Must be a valid Python identifier.")
+        slot = super().__new__(cls, f"{{{{slot:{name}}}}}")
+        slot.name = name
+        return slot
+
+    def __getnewargs__(self):
+        return (self.name,)
+
+    def __repr__(self):
+        return f"Slot({self.name!r})"
+
+
+def _compile(value, slots: set):
+    """
+    Compiles a JSON value into a render function, or returns None if the value contains no slots and can be reused
+    as is.
+    :param value: dict, list, str or any other JSON value
+    :param slots: Set the names of all slots found are added to
+    :return: Callable taking the dict of slot values, or None
+    """
+    if isinstance(value, dict):
+        dynamic = []
+        for key, item in value.items():
+            render = _compile(item, slots)
+            if render is not None:
+                dynamic.append((key, render))
+        if not dynamic:
+            return None
+
+        def render_dict(values):
+            rendered = value.copy()
+            for key, render in dynamic:
+                rendered[key] = render(values)
+            return rendered
+        return render_dict
+
+    if isinstance(value, list):
+        dynamic = []
+        for index, item in enumerate(value):
+            render = _compile(item, slots)
+            if render is not None:
+                dynamic.append((index, render))
+        if not dynamic:
+            return None
+
+        def render_list(values):
+            rendered = value.copy()
+            for index, render in dynamic:
+                rendered[index] = render(values)
+            return rendered
+        return render_list
+
+    if isinstance(value, str):
+        segments = _SLOT_PATTERN.split(value)
+        if len(segments) == 1:
+            return None
+        names = segments[1::2]
+        slots.update(names)
+        if segments[0] == "" and segments[2] == "" and len(segments) == 3:
+            name = names[0]
+            return lambda values: values[name]
+        literals = segments[0::2]
+
+        def render_str(values):
+            out = [literals[0]]
+            for name, literal in zip(names, literals[1:]):
+                out.append(str(values[name]))
+                out.append(literal)
+            return "".join(out)
+        return render_str
+
+    return None
+
+
+class Template:
+    """
+    A surface compiled once into a render plan. Build a Message, Modal or AppHome as usual with Slot placeholders in
+    place of the values that change, then call render() with the values to get a ready payload without re-creating
+    any builder objects. Parts of the payload without slots are shared between renders and must not be mutated.
+    """
+    def __init__(self, surface):
+        """
+        :param surface: Message, Modal or AppHome object, or an already generated payload dict; blocks encoded as a
+        JSON string are decoded first
+        """
+        if isinstance(surface, dict):
+            payload = surface
+        elif hasattr(surface, "to_payload"):
+            payload = surface.to_payload()
+        else:
+            payload = surface.view
+        if isinstance(payload.get("blocks"), str):
+            # Slots are filled in on the JSON values, not the encoded text, so that values are escaped when the
+            # rendered payload is encoded
+            import json
+
+            payload = {**payload, "blocks": json.loads(payload["blocks"])}
+        self._slots = set()
+        self._payload = copy.deepcopy(payload)
+        self._render = _compile(self._payload, self._slots)
+
+    @property
+    def slots(self) -> frozenset:
+        """
+        The names of all slots used in the template.
+        """
+        return frozenset(self._slots)
+
+    def render(self, **values) -> dict:
+        """
+        Fills in the slots of the template. A slot standing alone as a value is replaced by the given value as is;
+        a slot embedded in a longer string is replaced by its str().
+        :param values: A value for each slot name
+        :return: For a Message, the arguments for chat.postMessage (or the method its post() would use); for a Modal
+        or AppHome, the view
+        """
+        missing = self._slots.difference(values)
+        if missing:
+            raise KeyError(f"Missing values for slots: {', '.join(sorted(missing))}")
+        if self._render is None:
+            return self._payload
+        return self._render(values)
@@ -0,0 +1,92 @@
+import unittest
+from pyblock_builder.delivery import RateLimiter
+from pyblock_builder.surfaces import Message
+from tests.helpers import FakeClient
+
+
+class FakeClock:
+    """A clock that only moves when slept on"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Tests for the RateLimiter class"""
+
+    def test_tier_burst_then_paced(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep).set_tier_limit(3, 60, burst=2)
+
+        delays = [limiter.acquire("chat.update") for _ in range(4)]
+
+        self.assertEqual([0.0, 0.0, 1.0, 1.0], delays)
+        self.assertEqual(2.0, clock.now)
+
+    def test_per_channel_limit(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep).set_tier_limit(4, 6000, burst=100)
+
+        self.assertEqual(0.0, limiter.reserve("chat.postMessage", "C1"))
+        self.assertEqual(0.0, limiter.reserve("chat.postMessage", "C2"))
+        self.assertEqual(1.0, limiter.reserve("chat.postMessage", "C1"))
+
+    def test_post_is_only_paced_per_channel(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+
+        self.assertEqual(0.0, sum(limiter.acquire("chat.postMessage", f"C{n}") for n in range(1000)))
+
+    def test_workspace_limit(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep).set_workspace_limit(120, burst=2)
+
+        delays = [limiter.acquire("chat.postMessage", f"C{n}") for n in range(4)]
+
+        self.assertEqual([0.0, 0.0, 0.5, 0.5], delays)
+        self.assertEqual(0.5, limiter.reserve("chat.postMessage"))
+
+    def test_refilled_channel_buckets_are_dropped(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+
+        for n in range(2000):
+            limiter.reserve("chat.postMessage", f"C{n}")
+            clock.now += 0.01
+
+        self.assertLess(len(limiter._channel_buckets), 512)
+        self.assertEqual(0.99, round(limiter.reserve("chat.postMessage", "C1999"), 2))
+
+    def test_disable_per_channel_limit(self):
+        clock = FakeClock()
+        limiter = (RateLimiter(clock=clock, sleep=clock.sleep)
+                   .set_tier_limit(4, 6000, burst=100)
+                   .disable_per_channel_limit())
+
+        self.assertEqual(0.0, limiter.reserve("chat.postMessage", "C1"))
+        self.assertEqual(0.0, limiter.reserve("chat.postMessage", "C1"))
+
+    def test_unknown_method_is_not_limited(self):
+        limiter = RateLimiter(clock=FakeClock())
+
+        self.assertEqual(0.0, limiter.reserve("users.info"))
+
+    def test_message_post_consults_limiter(self):
+        clock = FakeClock()
+        client = FakeClient(clock)
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        test_message = Message().set_channel("C1").set_text("status").set_rate_limiter(limiter)
+
+        for _ in range(3):
+            test_message.post(client)
+
+        self.assertEqual([0.0, 1.0, 2.0], client.times)
+        self.assertEqual(["C1"] * 3, [kwargs["channel"] for _, kwargs in client.calls])
@@ -0,0 +1,110 @@
+import asyncio
+import unittest
+from pyblock_builder.delivery import RetryPolicy
+from pyblock_builder.surfaces import AppHome
+
+
+class FakeResponse(dict):
+    """Mimics the SlackResponse attached to a SlackApiError"""
+
+    def __init__(self, status_code, error, headers=None):
+        super().__init__(ok=False, error=error)
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeApiError(Exception):
+    def __init__(self, response):
+        super().__init__(response["error"])
+        self.response = response
+
+
+class FlakyClient:
+    """Fails with the given errors before succeeding"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def views_publish(self, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"ok": True}
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Tests for the RetryPolicy class"""
+
+    def setUp(self):
+        self.slept = []
+        self.policy = RetryPolicy(sleep=self.slept.append, rng=lambda: 0.0)
+
+    def test_honors_retry_after(self):
+        client = FlakyClient(FakeApiError(FakeResponse(429, "ratelimited", {"Retry-After": "7"})))
+
+        result = self.policy.run(lambda: client.views_publish())
+
+        self.assertEqual({"ok": True}, result)
+        self.assertEqual([7.0], self.slept)
+        self.assertEqual(1, self.policy.counters["rate_limited"])
+        self.assertEqual(1, self.policy.counters["retries"])
+
+    def test_backs_off_exponentially_on_server_errors(self):
+        client = FlakyClient(*(FakeApiError(FakeResponse(503, "service_unavailable")) for _ in range(3)))
+
+        self.policy.run(lambda: client.views_publish())
+
+        self.assertEqual([0.5, 1.0, 2.0], self.slept)
+        self.assertEqual(3, self.policy.counters["server_errors"])
+
+    def test_does_not_retry_other_errors(self):
+        client = FlakyClient(FakeApiError(FakeResponse(200, "channel_not_found")))
+
+        with self.assertRaises(FakeApiError):
+            self.policy.run(lambda: client.views_publish())
+        self.assertEqual(1, client.calls)
+
+    def test_gives_up_after_max_total_delay(self):
+        self.policy.set_max_total_delay(10)
+        client = FlakyClient(*(FakeApiError(FakeResponse(429, "ratelimited", {"Retry-After": "6"})) for _ in range(2)))
+
+        with self.assertRaises(FakeApiError):
+            self.policy.run(lambda: client.views_publish())
+        self.assertEqual([6.0], self.slept)
+        self.assertEqual(1, self.policy.counters["gave_up"])
+
+    def test_publish_view_raises_when_retries_run_out(self):
+        class Logger:
+            def __init__(self):
+                self.errors = []
+
+            def error(self, message):
+                self.errors.append(message)
+
+        client = FlakyClient(*(ConnectionError("reset") for _ in range(3)))
+        logger = Logger()
+        app_home = AppHome().set_retry_policy(self.policy.set_max_attempts(2))
+
+        with self.assertRaises(ConnectionError):
+            app_home.publish_view(client, {"type": "app_home_opened", "user": "U1"}, logger)
+        self.assertEqual(2, client.calls)
+        self.assertEqual(["Error publishing home tab: reset"], logger.errors)
+
+    def test_async_publish_view_retries(self):
+        async def no_sleep(seconds):
+            self.slept.append(seconds)
+
+        class AsyncFlakyClient(FlakyClient):
+            async def views_publish(self, **kwargs):
+                return FlakyClient.views_publish(self, **kwargs)
+
+        policy = RetryPolicy(async_sleep=no_sleep, rng=lambda: 0.0)
+        client = AsyncFlakyClient(ConnectionError("reset"))
+        app_home = AppHome().set_retry_policy(policy)
+
+        result = asyncio.run(app_home.publish_view_async(client, {"type": "app_home_opened", "user": "U1"}, None))
+
+        self.assertEqual({"ok": True}, result)
+        self.assertEqual(2, client.calls)
+        self.assertEqual(1, policy.counters["connection_errors"])
@@ -0,0 +1,42 @@
+"""
+Fakes and builders shared by the test modules, imported as tests.helpers from the repository root
+"""
+from pyblock_builder.blocks import Section
+from pyblock_builder.elements import Button
+
+
+class FakeClient:
+    """Records the Web API calls made through it, and their times if given a clock"""
+
+    def __init__(self, clock=None):
+        self.clock = clock
+        self.calls = []
+        self.times = []
+
+    def _record(self, method, kwargs):
+        self.calls.append((method, kwargs))
+        if self.clock is not None:
+            self.times.append(self.clock())
+        return {"ok": True}
+
+    def __getattr__(self, method):
+        def call(**kwargs):
+            return self._record(method, kwargs)
+        return call
+
+
+class FakeAsyncClient(FakeClient):
+    """Records the Web API calls made through it, AsyncWebClient style"""
+
+    def __getattr__(self, method):
+        async def call(**kwargs):
+            return self._record(method, kwargs)
+        return call
+
+
+def meeting(n):
+    """A Section with a block_id and a button with an action_id, both numbered n"""
+    return (Section()
+            .set_block_id(f"meeting_{n}")
+            .set_text(f"Meeting {n}")
+            .add_accessory(Button().set_label("Join").set_action_id(f"join_{n}")))
@@ -0,0 +1,66 @@
+import subprocess
+import sys
+import unittest
+
+
+def modules_loaded_by(statement):
+    """Runs the statement in a fresh interpreter and returns the modules it imported"""
+    output = subprocess.run(
+        [sys.executable, "-c", f"import sys; {statement}; print('\\n'.join(sys.modules))"],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+class TestLazyImports(unittest.TestCase):
+    """Tests that the subpackages only import the modules that are used"""
+
+    def test_importing_one_element_skips_the_rest(self):
+        modules = modules_loaded_by("from pyblock_builder.elements import Button")
+
+        self.assertIn("pyblock_builder.elements.button", modules)
+        self.assertNotIn("pyblock_builder.elements.select_menu", modules)
+        self.assertNotIn("pyblock_builder.blocks.section", modules)
+
+    def test_elements_and_blocks_skip_mrkdwn(self):
+        for statement in ("from pyblock_builder.elements import Button; Button().set_label('Go')",
+                          "from pyblock_builder.blocks import Input, Section; Section().set_text('*Hi*')",
+                          "from pyblock_builder.objects import Option; Option.from_columns(['a'], ['1'], mrkdwn=True)"):
+            modules = modules_loaded_by(statement)
+
+            self.assertNotIn("pyblock_builder.mrkdwn", modules)
+            self.assertNotIn("pyblock_builder.mrkdwn.md", modules)
+
+    def test_md_skips_the_other_mrkdwn_modules(self):
+        modules = modules_loaded_by("from pyblock_builder.mrkdwn import md, bold; bold('a')")
+
+        self.assertIn("pyblock_builder.mrkdwn.md", modules)
+        for module in ("markdown", "splitter", "writer"):
+            self.assertNotIn(f"pyblock_builder.mrkdwn.{module}", modules)
+
+    def test_no_heavy_dependencies_at_import(self):
+        modules = modules_loaded_by("from pyblock_builder.surfaces import Message, Modal, AppHome")
+
+        for heavy in ("asyncio", "typing", "typing_extensions", "json", "concurrent.futures"):
+            self.assertNotIn(heavy, modules)
+
+    def test_all_exports_resolve(self):
+        import pyblock_builder.blocks as blocks
+        import pyblock_builder.elements as elements
+        import pyblock_builder.objects as objects
+        import pyblock_builder.surfaces as surfaces
+
+        for package in (blocks, elements, objects, surfaces):
+            for name in package.__all__:
+                self.assertEqual(name, getattr(package, name).__name__)
+            with self.assertRaises(AttributeError):
+                getattr(package, "DoesNotExist")
+
+    def test_mrkdwn_exports_resolve(self):
+        import pyblock_builder.mrkdwn as mrkdwn
+
+        for name in mrkdwn._EXPORTS:
+            self.assertEqual(name, getattr(mrkdwn, name).__name__)
+        self.assertTrue(callable(mrkdwn.bold))
+        with self.assertRaises(AttributeError):
+            getattr(mrkdwn, "DoesNotExist")
@@ -0,0 +1,101 @@
+import unittest
+from pyblock_builder.blocks import Divider, Header, Section
+from pyblock_builder.mrkdwn import md, markdown_to_blocks, markdown_to_mrkdwn
+
+
+class TestInline(unittest.TestCase):
+    """Tests for converting inline Markdown to mrkdwn"""
+
+    def test_emphasis(self):
+        self.assertEqual("*bold* and *bold*", markdown_to_mrkdwn("**bold** and __bold__"))
+        self.assertEqual("_it_ and _it_", markdown_to_mrkdwn("*it* and _it_"))
+        self.assertEqual("~gone~ and _*both*_", markdown_to_mrkdwn("~~gone~~ and ***both***"))
+        self.assertEqual("*bold with _it_ inside*", markdown_to_mrkdwn("**bold with *it* inside**"))
+
+    def test_unmatched_delimiters_are_kept(self):
+        self.assertEqual("snake_case_name", markdown_to_mrkdwn("snake_case_name"))
+        self.assertEqual("**open and _closed_", markdown_to_mrkdwn("**open and *closed*"))
+        self.assertEqual("a * b", markdown_to_mrkdwn("a * b"))
+        self.assertEqual("*not it*", markdown_to_mrkdwn(r"\*not it\*"))
+
+    def test_code_spans(self):
+        self.assertEqual("run `rm -rf **tmp**` now", markdown_to_mrkdwn("run `rm -rf **tmp**` now"))
+        self.assertEqual("`a ` b`", markdown_to_mrkdwn("`` a ` b ``"))
+        self.assertEqual("`&lt;div&gt;`", markdown_to_mrkdwn("`<div>`"))
+        self.assertEqual("``no close", markdown_to_mrkdwn("``no close"))
+
+    def test_links(self):
+        self.assertEqual("see <https://example.com/a?x=1&amp;y=2|the *docs*>",
+                         markdown_to_mrkdwn('see [the **docs**](https://example.com/a?x=1&y=2 "Docs")'))
+        self.assertEqual("<https://example.com>", markdown_to_mrkdwn("[](https://example.com)"))
+        self.assertEqual("<https://example.com/graph.png|graph>",
+                         markdown_to_mrkdwn("![graph](https://example.com/graph.png)"))
+        self.assertEqual("<https://example.com> <mailto:ops@example.com|ops@example.com>",
+                         markdown_to_mrkdwn("<https://example.com> <ops@example.com>"))
+
+    def test_text_is_escaped(self):
+        self.assertEqual("a &lt; b &amp;&amp; c &gt; d, &amp; &copy;",
+                         markdown_to_mrkdwn("a < b && c > d, &amp; &copy;"))
+
+    def test_line_breaks(self):
+        self.assertEqual("one two\nthree", markdown_to_mrkdwn("one\ntwo  \nthree"))
+        self.assertEqual("one\ntwo", markdown_to_mrkdwn("one\\\ntwo"))
+
+
+class TestBlocks(unittest.TestCase):
+    """Tests for converting the block structure of Markdown to mrkdwn"""
+
+    def test_headings_and_rules(self):
+        self.assertEqual("*Disk full*\n\nText\n\n---\n\n*Steps*",
+                         markdown_to_mrkdwn("## Disk **full** ##\nText\n\n***\nSteps\n-----"))
+
+    def test_nested_lists(self):
+        text = "- one\n  - two\n    continued\n    - three\n- four\n\n1. first\n2) second"
+
+        self.assertEqual("• one\n    ◦ two continued\n        ▪ three\n• four\n\n1. first\n2) second",
+                         markdown_to_mrkdwn(text))
+
+    def test_code_blocks(self):
+        self.assertEqual("```if a &lt; b:\n    pass```", markdown_to_mrkdwn("```python\nif a < b:\n    pass\n```"))
+        self.assertEqual("Text\n\n```indented```", markdown_to_mrkdwn("Text\n\n    indented"))
+        self.assertEqual("1. Check\n```df -h```\n2. Clean",
+                         markdown_to_mrkdwn("1. Check\n   ```\n   df -h\n   ```\n2. Clean"))
+        self.assertEqual("```# not a heading```", markdown_to_mrkdwn("~~~\n# not a heading"))
+
+    def test_block_quotes(self):
+        self.assertEqual(">Note: *careful* with this\n>\n>nested",
+                         markdown_to_mrkdwn("> Note: **careful**\nwith this\n>\n> > nested"))
+
+    def test_auto_escape(self):
+        md.enable_auto_escape()
+        try:
+            section = Section().set_text(markdown_to_mrkdwn("**a** & b"))
+        finally:
+            md.disable_auto_escape()
+        self.assertEqual("*a* &amp; b", section.block["text"]["text"])
+
+
+class TestMarkdownToBlocks(unittest.TestCase):
+    """Tests for converting Markdown to Header, Divider and Section blocks"""
+
+    def test_blocks(self):
+        blocks = markdown_to_blocks("# Runbook: `db`\nIntro **text**\n\n- step\n\n---\n\n## Rollback\nUndo it")
+
+        self.assertEqual([Header, Section, Divider, Header, Section], [type(block) for block in blocks])
+        self.assertEqual({"type": "plain_text", "text": "Runbook: db"}, blocks[0].block["text"])
+        self.assertEqual("Intro *text*\n\n• step", blocks[1].block["text"]["text"])
+        self.assertEqual("Undo it", blocks[4].block["text"]["text"])
+
+    def test_long_text_is_split(self):
+        heading = "x" * 200
+        blocks = markdown_to_blocks(f"# {heading}\n\n" + "\n\n".join(f"Paragraph {n} " * 20 for n in range(50)))
+
+        self.assertTrue(all(type(block) is Section for block in blocks))
+        self.assertEqual(f"*{heading}*", blocks[0].block["text"]["text"].split("\n")[0])
+        self.assertGreater(len(blocks), 1)
+        for block in blocks:
+            self.assertLessEqual(len(block.block["text"]["text"]), 3000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from pyblock_builder.blocks import Section
+from pyblock_builder.mrkdwn import md
+from pyblock_builder.objects import Fields, Option, Text
+
+
+class TestEscape(unittest.TestCase):
+    """Tests for escaping mrkdwn control characters"""
+
+    def test_escape(self):
+        self.assertEqual("Q&amp;A &lt;b&gt; &amp;amp;", md.escape("Q&A <b> &amp;"))
+        self.assertEqual("Plain text", md.escape("Plain text"))
+        self.assertIs(str, type(md.escape("a < b")))
+
+    def test_escape_all(self):
+        texts = ["Ann", "<!channel>", "R&D", "", "Bo > Al"]
+
+        self.assertEqual([md.escape(text) for text in texts], md.escape_all(texts))
+        self.assertEqual(["a", "b"], md.escape_all(iter(["a", "b"])))
+        self.assertEqual(["a\0&lt;", "b"], md.escape_all(["a\0<", "b"]))
+        self.assertEqual([], md.escape_all([]))
+
+    def test_helpers_do_not_escape_by_default(self):
+        self.assertEqual("*<b>*", md.bold("<b>"))
+        self.assertEqual("<https://example.com|R&D>", md.link("https://example.com", "R&D"))
+        self.assertEqual("*<b>*", Section().set_text("*<b>*").block["text"]["text"])
+
+
+class TestAutoEscape(unittest.TestCase):
+    """Tests for the opt-in auto-escape mode of the helpers and mrkdwn Text objects"""
+
+    def setUp(self):
+        md.enable_auto_escape()
+
+    def tearDown(self):
+        md.disable_auto_escape()
+
+    def test_helpers_escape_their_arguments(self):
+        self.assertEqual("*&lt;!channel&gt;*", md.bold("<!channel>"))
+        self.assertEqual("<https://example.com?a=1&amp;b=2|R&amp;D>",
+                         md.link("https://example.com?a=1&b=2", "R&D"))
+        self.assertEqual("• &lt;a&gt;\n• b", md.bullet_list(["<a>", "b"]))
+        self.assertEqual(">1 &lt; 2\n>ok", md.blockquote("1 < 2\nok"))
+
+    def test_nested_helpers_are_not_escaped_twice(self):
+        self.assertEqual("*<@U123>*", md.bold(md.user("U123")))
+        self.assertEqual("_<https://example.com|&lt;home&gt;>_", md.italic(md.link("https://example.com", "<home>")))
+        self.assertIsInstance(md.bold("x"), md.Escaped)
+
+    def test_concatenation_escapes_plain_strings(self):
+        self.assertEqual("*Ann* &amp; <@U1>", md.bold("Ann") + " & " + md.user("U1"))
+        self.assertIsInstance("<" + md.bold("x"), md.Escaped)
+
+    def test_mrkdwn_text_is_escaped(self):
+        self.assertEqual("a &lt; b", Text().set_text("a < b").as_mrkdwn().json["text"])
+        self.assertEqual("a &lt; b", Text().as_mrkdwn().set_text("a < b").as_mrkdwn().json["text"])
+        self.assertEqual("a < b", Text().set_text("a < b").json["text"])
+        section = Section().set_text(md.bold("<x>") + " " + md.user("U1"))
+        self.assertEqual("*&lt;x&gt;* <@U1>", section.block["text"]["text"])
+        self.assertEqual("1 &lt; 2", Fields().add_field("1 < 2")._fields[0].json["text"])
+
+    def test_mrkdwn_options_are_escaped(self):
+        options = Option.from_columns(["<a>", md.bold("b")], ["1", "2"], mrkdwn=True).json
+
+        self.assertEqual(["&lt;a&gt;", "*b*"], [option["text"]["text"] for option in options])
+        self.assertEqual("<a>", Option.from_columns(["<a>"], ["1"]).json[0]["text"]["text"])
+
+
+if __name__ == "__main__":
+    unittest.main()
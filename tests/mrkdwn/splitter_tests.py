@@ -0,0 +1,70 @@
+import unittest
+from pyblock_builder.blocks import Section
+from pyblock_builder.mrkdwn import split_sections, split_text
+
+
+class TestSplitText(unittest.TestCase):
+    """Tests for splitting long mrkdwn into chunks within the Text limit"""
+
+    def test_short_text_is_one_chunk(self):
+        self.assertEqual(["*Hello*\nworld"], list(split_text("*Hello*\nworld")))
+        self.assertEqual([], list(split_text("")))
+
+    def test_chunks_end_at_line_breaks(self):
+        lines = [f"line {n:02d}" for n in range(20)]
+
+        chunks = list(split_text("\n".join(lines), limit=30))
+        self.assertEqual(lines, "\n".join(chunks).split("\n"))
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk), 30)
+
+    def test_long_line_is_not_cut_inside_spans(self):
+        line = " ".join(f"see <https://example.com/{n}|page {n}> and *bold {n} text* _it {n}_" for n in range(50))
+
+        chunks = list(split_text(line, limit=100))
+        self.assertEqual(line, "".join(chunks))
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk), 100)
+            self.assertEqual(chunk.count("<"), chunk.count(">"))
+            self.assertEqual(0, chunk.count("*") % 2)
+            self.assertEqual(0, chunk.count("_") % 2)
+
+    def test_word_longer_than_limit(self):
+        self.assertEqual(["a" * 10, "a" * 10, "a" * 5], list(split_text("a" * 25, limit=10)))
+        self.assertEqual(["ab ", "<" + "x" * 12, "> cd"], list(split_text("ab <" + "x" * 12 + "> cd", limit=13)))
+
+    def test_code_blocks_are_reopened(self):
+        text = "Logs:\n```\n" + "\n".join(f"log line {n}" for n in range(30)) + "\n```\nDone"
+
+        chunks = list(split_text(text, limit=80))
+        self.assertGreater(len(chunks), 3)
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk), 80)
+            self.assertEqual(0, chunk.count("```") % 2, chunk)
+        self.assertTrue(chunks[1].startswith("```log line"))
+        self.assertEqual(["log line 29\n```", "Done"], [chunks[-2][-15:], chunks[-1]])
+
+    def test_long_line_in_code_block(self):
+        text = "```" + "word " * 40 + "```"
+
+        chunks = list(split_text(text, limit=50))
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk), 50)
+            self.assertTrue(chunk.startswith("```") and chunk.endswith("```"), chunk)
+        self.assertEqual("word " * 40, "".join(chunk[3:-3] for chunk in chunks))
+
+    def test_lines_from_an_iterable(self):
+        lines = [f"line {n}\n" for n in range(10)]
+
+        self.assertEqual(["".join(lines).rstrip("\n")], list(split_text(iter(lines))))
+
+    def test_split_sections(self):
+        sections = list(split_sections("\n".join("x" * 20 for _ in range(5)), limit=50))
+
+        self.assertEqual(3, len(sections))
+        self.assertTrue(all(isinstance(section, Section) for section in sections))
+        self.assertEqual("mrkdwn", sections[0].block["text"]["type"])
+
+
+if __name__ == "__main__":
+    unittest.main()
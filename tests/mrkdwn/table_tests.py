@@ -0,0 +1,67 @@
+import unittest
+from pyblock_builder.mrkdwn import md
+
+
+class TestTable(unittest.TestCase):
+    """Tests for rendering columns as paginated monospaced tables"""
+
+    def test_table(self):
+        pages = md.table([["api", "worker"], [120, 7], ["ok", "degraded"]], headers=["service", "requests", "status"])
+
+        self.assertEqual(["```service  requests  status\n"
+                          "-------  --------  --------\n"
+                          "api           120  ok\n"
+                          "worker          7  degraded```"], pages)
+
+    def test_align(self):
+        page = md.table([["a", "bbb"], ["c", "d"]], align=["right", "center"])[0]
+        self.assertEqual("```  a  c\nbbb  d```", page)
+
+        page = md.table([["a", "bbb"], [1, 22]], align="<")[0]
+        self.assertEqual("```a    1\nbbb  22```", page)
+
+        with self.assertRaises(ValueError):
+            md.table([["a"]], align="diagonal")
+
+    def test_pages_fit_limit(self):
+        columns = [[f"service-{n}" for n in range(500)], list(range(500))]
+
+        pages = md.table(columns, headers=["service", "n"], limit=300)
+        self.assertGreater(len(pages), 10)
+        for page in pages:
+            self.assertLessEqual(len(page), 300)
+            self.assertTrue(page.startswith("```service        n\n"))
+            self.assertTrue(page.endswith("```"))
+        rows = [line for page in pages for line in page.strip("`").split("\n")[2:]]
+        self.assertEqual([f"service-{n}".ljust(11) + "  " + str(n).rjust(3) for n in range(500)], rows)
+
+    def test_max_pages(self):
+        columns = [[f"service-{n}" for n in range(500)], list(range(500))]
+
+        pages = md.table(columns, limit=300, max_pages=2)
+        self.assertEqual(2, len(pages))
+        self.assertLessEqual(len(pages[-1]), 300)
+        last = pages[-1].strip("`").split("\n")
+        shown = sum(page.count("\n") + 1 for page in pages) - 1
+        self.assertEqual(f"… {500 - shown} more rows", last[-1])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            md.table([["a", "b"], ["c"]])
+        with self.assertRaises(ValueError):
+            md.table([["a"]], headers=["a", "b"])
+        with self.assertRaises(ValueError):
+            md.table([["x" * 50]], limit=40)
+
+    def test_auto_escape(self):
+        md.enable_auto_escape()
+        try:
+            page = md.table([["<a>", "b"]], headers=["R&D"])[0]
+        finally:
+            md.disable_auto_escape()
+
+        self.assertEqual("```R&amp;D\n---\n&lt;a&gt;\nb```", page)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from pyblock_builder.blocks import Section
+from pyblock_builder.mrkdwn import MrkdwnWriter, md
+
+
+class TestMrkdwnWriter(unittest.TestCase):
+    """Tests for writing mrkdwn documents into chunks within the Text limit"""
+
+    def test_same_markup_as_helpers(self):
+        writer = (MrkdwnWriter()
+                  .blockquote("Summary\nAll good")
+                  .line().bold("Owner").text(" ").user("U1").text(" ").link("https://example.com", "docs")
+                  .bullet_list(["a", "b"])
+                  .dashed_list(["c"])
+                  .codeblock("x = 1"))
+
+        expected = "\n".join((md.blockquote("Summary\nAll good"),
+                              f"{md.bold('Owner')} {md.user('U1')} {md.link('https://example.com', 'docs')}",
+                              md.bullet_list(["a", "b"]), md.dashed_list(["c"]), md.codeblock("x = 1")))
+        self.assertEqual([expected], list(writer.chunks()))
+
+    def test_chunks_are_cut_at_line_ends(self):
+        writer = MrkdwnWriter(limit=30)
+        for n in range(10):
+            writer.bullet().bold(f"item {n}").text(" done")
+
+        chunks = list(writer.chunks())
+        self.assertEqual("\n".join(f"• *item {n}* done" for n in range(10)), "\n".join(chunks))
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk), 30)
+            self.assertTrue(chunk.startswith("• "))
+        self.assertEqual(0, len(writer))
+        self.assertEqual([], list(writer.chunks()))
+
+    def test_long_line_is_cut_between_fragments(self):
+        writer = MrkdwnWriter(limit=10).line().bold("abc").bold("defg").bold("hi")
+
+        self.assertEqual(["*abc*", "*defg**hi*"], list(writer.chunks()))
+
+    def test_fragment_longer_than_limit(self):
+        chunks = list(MrkdwnWriter(limit=10).text("ok").line("x" * 25).chunks())
+
+        self.assertEqual(["ok", "x" * 10, "x" * 10, "x" * 5], chunks)
+
+    def test_drain(self):
+        writer = MrkdwnWriter(limit=20)
+        writer.line("first line here").line("second line")
+
+        self.assertEqual(["first line here"], writer.drain())
+        self.assertEqual([], writer.drain())
+        self.assertEqual(["second line"], list(writer.chunks()))
+
+    def test_sections(self):
+        writer = MrkdwnWriter(limit=20)
+        writer.line("first line here").line("second line")
+
+        sections = list(writer.sections())
+        self.assertTrue(all(isinstance(section, Section) for section in sections))
+        self.assertEqual(["first line here", "second line"], [section.block["text"]["text"] for section in sections])
+
+    def test_auto_escape(self):
+        md.enable_auto_escape()
+        try:
+            writer = MrkdwnWriter().line("a < b").bold("<!here>").user("U1")
+            section = next(writer.sections())
+        finally:
+            md.disable_auto_escape()
+
+        self.assertEqual("a &lt; b*&lt;!here&gt;*<@U1>", section.block["text"]["text"])
+
+
+if __name__ == "__main__":
+    unittest.main()
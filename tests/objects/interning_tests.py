@@ -0,0 +1,58 @@
+import json
+import unittest
+from pyblock_builder.elements import StaticSelectMenu
+from pyblock_builder.objects import InternPool, Option, Text, enable_interning, disable_interning
+from pyblock_builder.surfaces import Modal
+
+
+class TestInternPool(unittest.TestCase):
+    """Tests for interning of shared Text and Option objects"""
+
+    def test_json_is_byte_identical(self):
+        pool = InternPool()
+
+        self.assertEqual(json.dumps(Text().set_text("Severity").json), json.dumps(pool.text("Severity").json))
+        self.assertEqual(json.dumps(Text().set_text("*Bold*").as_mrkdwn().json),
+                         json.dumps(pool.text("*Bold*", mrkdwn=True).json))
+        self.assertEqual(json.dumps(Option().set_text("UTC").set_value("utc").set_description("Coordinated").json),
+                         json.dumps(pool.option("UTC", "utc", description="Coordinated").json))
+
+    def test_identical_content_is_shared(self):
+        pool = InternPool()
+
+        self.assertIs(pool.option("SEV1", "1"), pool.option("SEV1", "1"))
+        self.assertIsNot(pool.option("SEV1", "1"), pool.option("SEV1", "one"))
+        self.assertIsNot(pool.text("SEV1"), pool.text("SEV1", mrkdwn=True))
+
+    def test_shared_objects_are_read_only(self):
+        pool = InternPool()
+
+        with self.assertRaises(TypeError):
+            pool.text("Team").as_mrkdwn()
+        with self.assertRaises(TypeError):
+            pool.option("Team", "team").set_value("other")
+
+    def test_least_recently_used_is_evicted(self):
+        pool = InternPool(max_entries=2)
+        first = pool.text("a")
+        pool.text("b")
+        pool.text("a")
+        pool.text("c")
+
+        self.assertIs(first, pool.text("a"))
+        self.assertEqual(2, len(pool))
+        self.assertEqual({"hits": 2, "misses": 3, "evicted": 1}, pool.counters)
+
+    def test_enable_interning_shares_labels(self):
+        pool = enable_interning()
+        try:
+            modal = Modal().set_title("Report")
+            menu = StaticSelectMenu().set_placeholder_text("Pick a team").set_options(Option().set_text("Core"))
+            other = StaticSelectMenu().set_placeholder_text("Pick a team")
+        finally:
+            disable_interning()
+
+        self.assertIs(menu._placeholder, other._placeholder)
+        self.assertEqual({"type": "plain_text", "text": "Report"}, modal.view["title"])
+        self.assertEqual(1, pool.counters["hits"])
+        self.assertIsNot(StaticSelectMenu().set_placeholder_text("Pick a team")._placeholder, menu._placeholder)
@@ -0,0 +1,108 @@
+import unittest
+from pyblock_builder.elements import MultiStaticSelect, StaticSelectMenu
+from pyblock_builder.objects import Option, OptionGroup, OptionList
+
+
+class FakeArray:
+    """Stands in for a NumPy array, which hands out its values through tolist()"""
+
+    def __init__(self, values):
+        self.values = values
+
+    def tolist(self):
+        return list(self.values)
+
+    def __iter__(self):
+        raise AssertionError("columns should be converted with tolist()")
+
+
+class TestBulkOptions(unittest.TestCase):
+    """Tests for the bulk option constructors"""
+
+    def test_from_columns_matches_chained_setters(self):
+        chained = (StaticSelectMenu()
+                   .set_options(Option().set_text("Core").set_value("1").set_description("Platform"),
+                                Option().set_text("Web").set_value("2")))
+
+        bulk = StaticSelectMenu.from_columns(["Core", "Web"], ["1", "2"], ["Platform", None])
+
+        self.assertEqual(chained.json, bulk.json)
+        self.assertEqual(MultiStaticSelect().set_options(Option().set_text("Core").set_value("1")).json,
+                         MultiStaticSelect.from_columns(["Core"], ["1"]).json)
+
+    def test_from_columns_accepts_arrays(self):
+        options = Option.from_columns(FakeArray(["Core", "Web"]), FakeArray([1, 2]))
+
+        self.assertEqual(["1", "2"], [option["value"] for option in options.json])
+
+    def test_from_records(self):
+        options = Option.from_records([
+            ("Core", "1"),
+            ("Web", "2", "Frontend"),
+            {"text": "Docs", "value": "3", "url": "u"},
+        ])
+
+        self.assertEqual([
+            {"text": {"type": "plain_text", "text": "Core"}, "value": "1"},
+            {"text": {"type": "plain_text", "text": "Web"}, "value": "2",
+             "description": {"type": "plain_text", "text": "Frontend"}},
+            {"text": {"type": "plain_text", "text": "Docs"}, "value": "3", "url": "u"},
+        ], options.json)
+
+    def test_option_list_is_a_sequence_of_options(self):
+        options = Option.from_columns(["Core", "Web", "Docs"], ["1", "2", "3"])
+
+        self.assertEqual(3, len(options))
+        self.assertEqual(Option().set_text("Web").set_value("2").json, options[1].json)
+        self.assertIsInstance(options[1:], OptionList)
+        self.assertEqual(options.json, StaticSelectMenu().set_options(*options).json["options"])
+
+    def test_mrkdwn_texts_are_escaped_once(self):
+        from pyblock_builder.mrkdwn import md
+
+        md.enable_auto_escape()
+        try:
+            options = Option.from_columns(["R&D", "Ops"], ["1", "2"], mrkdwn=True)
+            sliced = options[:1]
+            option = options[0]
+        finally:
+            md.disable_auto_escape()
+
+        self.assertEqual("R&amp;D", options.json[0]["text"]["text"])
+        self.assertEqual(options.json[:1], sliced.json)
+        self.assertEqual(options.json[0], option.json)
+
+    def test_descriptions_are_converted_and_escaped(self):
+        from pyblock_builder.mrkdwn import md
+
+        self.assertEqual({"type": "plain_text", "text": "42"},
+                         Option.from_columns(["Core"], ["1"], FakeArray([42])).json[0]["description"])
+        md.enable_auto_escape()
+        try:
+            options = Option.from_columns(["Core", "Web"], ["1", "2"], [None, "Q&A <team>"], mrkdwn=True)
+            option = options[1]
+            sliced = options[1:]
+        finally:
+            md.disable_auto_escape()
+
+        self.assertNotIn("description", options.json[0])
+        self.assertEqual({"type": "mrkdwn", "text": "Q&amp;A &lt;team&gt;"}, options.json[1]["description"])
+        self.assertEqual(options.json[1], option.json)
+        self.assertEqual(options.json[1:], sliced.json)
+
+    def test_from_mapping(self):
+        groups = OptionGroup.from_mapping({
+            "Teams": {"Core": "1"},
+            "Sites": [("Paris", "par")],
+            "Other": [Option().set_text("None").set_value("0")],
+        })
+
+        self.assertEqual(
+            [OptionGroup().set_label("Teams").set_options(Option().set_text("Core").set_value("1")).json,
+             OptionGroup().set_label("Sites").set_options(Option().set_text("Paris").set_value("par")).json,
+             OptionGroup().set_label("Other").set_options(Option().set_text("None").set_value("0")).json],
+            [group.json for group in groups])
+
+    def test_columns_must_have_the_same_length(self):
+        with self.assertRaises(ValueError):
+            Option.from_columns(["Core", "Web"], ["1"])
@@ -0,0 +1,61 @@
+import json
+import unittest
+from pyblock_builder.blocks import Divider, Section
+from pyblock_builder.elements import Button
+from pyblock_builder.serialization import dumps, get_backend, set_backend
+from pyblock_builder.surfaces import AppHome, Message, Modal
+from tests.helpers import FakeClient
+
+
+class TestEncoder(unittest.TestCase):
+    """Tests for the pluggable JSON encoder"""
+
+    def tearDown(self):
+        set_backend("auto")
+
+    def test_backends_agree(self):
+        view = (AppHome()
+                .add_blocks(Section().set_text("Café ☕").add_accessory(Button().set_label("Go")), Divider())
+                .view)
+
+        set_backend("json")
+        stdlib = dumps(view)
+        set_backend("auto")
+
+        self.assertEqual(view, json.loads(stdlib))
+        self.assertEqual(view, json.loads(dumps(view)))
+        self.assertNotIn(b" ", dumps({"a": [1, 2]}))
+
+    def test_custom_backend(self):
+        set_backend(lambda value: b"encoded")
+
+        self.assertEqual("<lambda>", get_backend())
+        self.assertEqual(b"encoded", Divider().to_json_bytes())
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            set_backend("ujson")
+
+    def test_to_json_bytes(self):
+        section = Section().set_text("hello")
+        modal = Modal().set_title("Title").add_blocks(section)
+        message = Message().set_channel("C123").add_blocks(section.freeze())
+
+        self.assertEqual(section.block, json.loads(section.to_json_bytes()))
+        self.assertEqual(Button().set_label("Go").json, json.loads(Button().set_label("Go").to_json_bytes()))
+        self.assertEqual(modal.view, json.loads(modal.to_json_bytes()))
+        self.assertEqual({"channel": "C123", "blocks": [section.block]}, json.loads(message.to_json_bytes()))
+
+    def test_send_pre_encoded(self):
+        client = FakeClient()
+        message = Message().set_channel("C123").add_blocks(Section().set_text("hello")).send_pre_encoded()
+        message.post(client)
+        app_home = AppHome().add_blocks(Divider()).send_pre_encoded()
+
+        blocks = client.calls[0][1]["blocks"]
+        view = app_home._publish_view_args({"type": "app_home_opened", "user": "U1"})["view"]
+
+        self.assertIsInstance(blocks, str)
+        self.assertEqual(message.blocks, json.loads(blocks))
+        self.assertIsInstance(view, str)
+        self.assertEqual(app_home.view, json.loads(view))
@@ -0,0 +1,65 @@
+import json
+import unittest
+from unittest import mock
+from pyblock_builder.blocks import Actions, Context, Divider, Section
+from pyblock_builder.elements import Button
+from pyblock_builder.objects import Text
+from pyblock_builder.serialization import Frozen
+from pyblock_builder.surfaces import AppHome, Message
+
+
+class TestFrozen(unittest.TestCase):
+    """Tests for frozen block and element fragments"""
+
+    def test_freeze_block(self):
+        footer = Context().add_elements(Text().set_text("Sent by the digest bot"))
+        frozen = footer.freeze()
+
+        self.assertEqual(footer.block, frozen)
+        self.assertEqual(footer.block, json.loads(frozen.encoded))
+        self.assertIs(frozen, frozen.block)
+
+    def test_frozen_is_read_only(self):
+        frozen = Divider().freeze()
+
+        with self.assertRaises(TypeError):
+            frozen["block_id"] = "divider"
+
+    def test_freeze_is_a_snapshot(self):
+        section = Section().set_text("before")
+        frozen = section.freeze()
+        section.set_text("after")
+
+        self.assertEqual("before", frozen["text"]["text"])
+
+    def test_frozen_element_in_block(self):
+        button = Button().set_label("Open").set_action_id("open").freeze()
+        actions = Actions().add_elements(button)
+
+        self.assertEqual([button], actions.block["elements"])
+
+    def test_message_splices_frozen_blocks(self):
+        footer = Context().add_elements(Text().set_text("footer")).freeze()
+        test_message = Message().set_channel("C1").add_blocks(Section().set_text("body"), footer)
+
+        blocks = test_message._encoded(test_message.to_payload())["blocks"]
+
+        self.assertIsInstance(blocks, str)
+        self.assertEqual([Section().set_text("body").block, footer], json.loads(blocks))
+        self.assertEqual([Section().set_text("body").block, footer], test_message.to_payload()["blocks"])
+
+    def test_app_home_splices_frozen_blocks(self):
+        app_home = AppHome().set_callback_id("home").add_blocks(Divider().freeze(), Section().set_text("body"))
+
+        view = app_home._publish_view_args({"type": "app_home_opened", "user": "U1"})["view"]
+
+        self.assertIsInstance(view, str)
+        self.assertEqual(app_home.view, json.loads(view))
+
+    def test_plain_blocks_are_sent_as_dicts(self):
+        app_home = AppHome().add_blocks(Divider())
+        view = app_home.view
+
+        with mock.patch.object(AppHome, "view", new_callable=mock.PropertyMock, return_value=view):
+            self.assertIs(view, app_home._publish_view_args({"type": "app_home_opened", "user": "U1"})["view"])
+        self.assertIsInstance(Frozen({"type": "divider"}), dict)
@@ -0,0 +1,134 @@
+"""
+Compares the JSON of every builder, key order included, with the JSON the builders produced before they were rewritten
+to render on demand. golden_payloads.json was generated by running payloads() against the original builders; only
+setters that existed then are called, so the same function runs against both. The original builders emitted optional
+keys in the order their setters were called and the current ones in a fixed order, so the setters are called here in
+that fixed order.
+"""
+import json
+import os
+import unittest
+from pyblock_builder.blocks import Actions, Context, Divider, File, Header, Image, Input, Section
+from pyblock_builder.elements import (Button, ChannelsSelectMenu, Checkboxes, ConversationsSelectMenu, DatePicker,
+                                      DatetimePicker, EmailInput, ImageElement, MultiChannelsSelect,
+                                      MultiConversationsSelect, MultiStaticSelect, MultiUsersSelect, NumberInput,
+                                      OverflowMenu, PlainTextInput, RadioButtons, StaticSelectMenu, TimePicker,
+                                      UrlInput, UsersSelectMenu)
+from pyblock_builder.objects import (ConfirmationDialog, ConversationsFilter, DispatchActionConfig, Fields, Option,
+                                     OptionGroup, Text)
+from pyblock_builder.surfaces import AppHome, Modal
+
+GOLDEN = os.path.join(os.path.dirname(__file__), "golden_payloads.json")
+
+
+def options(prefix, n=2):
+    return [Option().set_text(f"{prefix} {i}").set_value(f"{prefix}_{i}") for i in range(n)]
+
+
+def confirm():
+    return (ConfirmationDialog()
+            .set_title("Sure?")
+            .set_text("This cannot be undone")
+            .set_confirm_label("Yes")
+            .set_deny_label("No")
+            .danger())
+
+
+def payloads():
+    """
+    Builds one of each builder with every setter called, plus the defaults
+    :return: dict of name to JSON-ready dict
+    """
+    built = {
+        "text": Text().set_text("Hello").json,
+        "text_mrkdwn": Text().set_text("*Hello*").as_mrkdwn().is_verbatim().json,
+        "text_emoji": Text().set_text("Hello").escape_emojis().json,
+        "option": Option().set_text("One").set_value("1").set_description("First").set_url("https://x/1").json,
+        "option_mrkdwn": Option().set_text("*One*", mrkdwn=True).set_value("1").json,
+        "option_group": OptionGroup().set_label("Group").set_options(*options("g")).json,
+        "confirm": confirm().json,
+        "confirm_primary": ConfirmationDialog().set_title("t").set_text("x").primary().json,
+        "filter": ConversationsFilter().include("im", "public").exclude_external_shared_channels().exclude_bot_users()
+        .json,
+        "dispatch": DispatchActionConfig().set_triggers("on_enter_pressed", "on_character_entered").json,
+        "fields": Fields().add_field("a").add_field("b", mrkdwn=False).fields,
+        "button": Button().set_action_id("go").set_label("Go").set_value("v").set_url("https://x").primary()
+        .set_confirm_dialog(confirm()).set_accessibility_label("Go now").json,
+        "button_default": Button().json,
+        "checkboxes": Checkboxes().set_action_id("c").set_options(*options("c")).set_initial_options(*options("c", 1))
+        .set_confirm_dialog(confirm()).focus_on_load().json,
+        "date_picker": DatePicker().set_action_id("d").set_initial_date("2024-01-02").set_placeholder_text("Day")
+        .set_confirm_dialog(confirm()).focus_on_load().json,
+        "datetime_picker": DatetimePicker().set_action_id("dt").set_initial_date_time("1700000000")
+        .set_confirm_dialog(confirm()).focus_on_load().json,
+        "email_input": EmailInput().set_action_id("e").set_initial_value("a@b.c").set_placeholder_text("Email")
+        .set_dispatch_action_config(DispatchActionConfig().set_triggers("on_enter_pressed")).focus_on_load().json,
+        "image_element": ImageElement().set_image_url("https://x/y.png").set_alt_text("y").json,
+        "multi_static": MultiStaticSelect().set_action_id("ms").set_confirm_dialog(confirm())
+        .set_placeholder_text("Pick").set_max_selected_items(2).set_options(*options("m"))
+        .set_initial_options(*options("m", 1)).focus_on_load().json,
+        "multi_static_groups": MultiStaticSelect().set_option_groups(OptionGroup().set_label("G")
+                                                                     .set_options(*options("g"))).json,
+        "multi_users": MultiUsersSelect().set_action_id("mu").set_initial_users(["U1", "U2"]).json,
+        "multi_conversations": MultiConversationsSelect().set_action_id("mc").set_placeholder_text("Pick")
+        .set_initial_conversations(["C1"]).default_to_current_conversation().json,
+        "multi_channels": MultiChannelsSelect().set_action_id("mch").set_initial_channels(["C1"]).json,
+        "number_input": NumberInput().set_action_id("n").disable_decimals()
+        .set_dispatch_action_config(DispatchActionConfig().set_triggers("on_enter_pressed")).set_initial_value("2")
+        .set_min_value(1).set_max_value(9).set_placeholder_text("Count").focus_on_load().json,
+        "overflow": OverflowMenu().set_action_id("o").set_options(*options("o")).set_confirm_dialog(confirm()).json,
+        "plain_text_input": PlainTextInput().set_action_id("p").enable_multiline()
+        .set_dispatch_action_config(DispatchActionConfig().set_triggers("on_enter_pressed")).set_initial_value("x")
+        .set_min_length(1).set_max_length(9).set_placeholder_text("Type").focus_on_load().json,
+        "radio_buttons": RadioButtons().set_action_id("r").set_options(*options("r"))
+        .set_initial_option(options("r", 1)[0]).set_confirm_dialog(confirm()).focus_on_load().json,
+        "static_select": StaticSelectMenu().set_action_id("s").set_confirm_dialog(confirm())
+        .set_placeholder_text("Pick").set_options(*options("s")).set_initial_option(options("s", 1)[0])
+        .focus_on_load().json,
+        "static_select_groups": StaticSelectMenu().set_option_groups(OptionGroup().set_label("G")
+                                                                     .set_options(*options("g"))).json,
+        "users_select": UsersSelectMenu().set_action_id("u").set_placeholder_text("Who").set_initial_user("U1").json,
+        "conversations_select": ConversationsSelectMenu().set_action_id("cs").set_confirm_dialog(confirm())
+        .set_placeholder_text("Where").enable_response_url().set_initial_conversation("C1")
+        .default_to_current_conversation().json,
+        "conversations_select_default": ConversationsSelectMenu().json,
+        "channels_select": ChannelsSelectMenu().set_action_id("ch").set_confirm_dialog(confirm())
+        .set_placeholder_text("Where").set_initial_channel("C1").enable_response_url().json,
+        "channels_select_default": ChannelsSelectMenu().json,
+        "time_picker": TimePicker().set_action_id("t").set_initial_time("09:30").set_placeholder_text("When")
+        .set_confirm_dialog(confirm()).focus_on_load().set_timezone("Europe/Paris").json,
+        "url_input": UrlInput().set_action_id("url").set_initial_value("https://x").set_placeholder_text("Link")
+        .set_dispatch_action_config(DispatchActionConfig().set_triggers("on_enter_pressed")).focus_on_load().json,
+        "actions": Actions().set_block_id("a").add_elements(Button().set_label("Go"), OverflowMenu()).block,
+        "context": Context().set_block_id("c").add_elements(Text().set_text("x"), ImageElement()).block,
+        "divider": Divider().set_block_id("d").block,
+        "file": File().set_block_id("f").set_external_id("F1").set_source("remote").block,
+        "header": Header().set_block_id("h").set_text("Title").block,
+        "image": Image().set_block_id("i").set_image_url("https://x/y.png").set_alt_text("y").set_title("Y").block,
+        "input": Input().set_block_id("in").set_label("Label").add_element(PlainTextInput()).set_dispatch_action(True)
+        .set_hint("Hint").set_optional(True).block,
+        "section": Section().set_block_id("s").set_text("Hello").add_accessory(Button().set_label("Go")).block,
+        "section_plain": Section().set_text("Hello", mrkdwn=False).set_fields(Fields().add_field("a")).block,
+        "modal": Modal().set_callback_id("cb").set_private_metadata("meta").set_external_id("ext").set_title("Title")
+        .set_submit_label("Submit").set_close_label("Close").clear_on_close().notify_on_close().submit_disabled()
+        .add_blocks(Divider(), Section().set_text("Body")).view,
+        "modal_default": Modal().view,
+        "app_home": AppHome().set_callback_id("cb").set_private_metadata("meta").set_external_id("ext")
+        .add_blocks(Header().set_text("Home"), Divider()).view,
+        "app_home_default": AppHome().view,
+    }
+    return built
+
+
+class TestGolden(unittest.TestCase):
+    """Tests that the builders still produce the JSON they did before rendering on demand"""
+
+    def test_payloads_match_baseline(self):
+        with open(GOLDEN) as golden:
+            expected = json.load(golden)
+        actual = payloads()
+
+        self.assertEqual(list(expected), list(actual))
+        for name, payload in actual.items():
+            with self.subTest(name):
+                self.assertEqual(json.dumps(expected[name]), json.dumps(payload))
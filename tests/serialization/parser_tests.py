@@ -0,0 +1,86 @@
+import json
+import unittest
+from pyblock_builder.blocks import Actions, Divider, Input, Section
+from pyblock_builder.elements import Button, StaticSelectMenu
+from pyblock_builder.objects import ConfirmationDialog, Fields, Option
+from pyblock_builder.serialization import LazyNode, from_dict, from_json
+from pyblock_builder.surfaces import AppHome, Message, Modal
+
+
+def ticket_modal():
+    return (Modal()
+            .set_title("Ticket")
+            .set_submit_label("Submit")
+            .set_callback_id("ticket")
+            .add_blocks(
+                Section().set_text("*Hello*").set_fields(Fields().add_field("a").add_field("b", mrkdwn=False)),
+                Input().set_label("Priority").add_element(
+                    StaticSelectMenu().set_action_id("priority").set_options(
+                        Option().set_text("High").set_value("high"), Option().set_text("Low").set_value("low"))),
+                Actions().add_elements(Button().set_label("Go").set_action_id("go").set_confirm_dialog(
+                    ConfirmationDialog().set_title("Sure?").set_text("Really").set_confirm_label("Yes")
+                    .set_deny_label("No")))
+            ))
+
+
+class TestParser(unittest.TestCase):
+    """Tests for loading Slack API dicts into builder objects"""
+
+    def test_round_trip(self):
+        view = ticket_modal().view
+        response_view = {**view, "id": "V123", "hash": "1.2", "state": {"values": {}}}
+
+        modal = Modal.from_dict(response_view)
+
+        self.assertIsInstance(modal, Modal)
+        self.assertEqual(view, modal.view)
+        self.assertEqual(view, Modal.from_json(json.dumps(view)).view)
+
+    def test_children_are_lazy(self):
+        view = ticket_modal().view
+        modal = Modal.from_dict(view)
+
+        self.assertTrue(all(type(block) is LazyNode for block in modal._blocks))
+        self.assertFalse(any(block.materialized for block in modal._blocks))
+        self.assertIs(view["blocks"][1], modal.blocks[1])
+
+    def test_changing_a_child_materializes_it(self):
+        modal = Modal.from_dict(ticket_modal().view)
+
+        modal._blocks[0].set_text("Changed")
+        modal._blocks[1]._element.set_placeholder_text("Pick one")
+
+        view = modal.view
+        self.assertEqual({"type": "mrkdwn", "text": "Changed"}, view["blocks"][0]["text"])
+        self.assertEqual(["a", "b"], [field["text"] for field in view["blocks"][0]["fields"]])
+        self.assertEqual("Pick one", view["blocks"][1]["element"]["placeholder"]["text"])
+        self.assertEqual(ticket_modal().view["blocks"][1]["element"]["options"],
+                         view["blocks"][1]["element"]["options"])
+        self.assertFalse(modal._blocks[2].materialized)
+
+    def test_from_dict_dispatches_on_type(self):
+        self.assertIsInstance(from_dict({"type": "divider"}), Divider)
+        self.assertIsInstance(from_dict({"type": "button", "text": {}}), Button)
+        self.assertEqual({"type": "button", "text": {}, "value": "", "action_id": ""},
+                         from_dict({"type": "button", "text": {}, "value": "", "action_id": ""}).json)
+        self.assertIsInstance(from_dict({"type": "home", "blocks": []}), AppHome)
+        self.assertIsInstance(from_dict({"text": {"type": "plain_text", "text": "x"}, "value": "x"}, "option"), Option)
+        confirm = ConfirmationDialog().set_title("T").set_text("t").set_confirm_label("Y").set_deny_label("N").json
+        self.assertEqual(confirm, from_dict(confirm, "confirm").json)
+
+    def test_unknown_types(self):
+        app_home = AppHome.from_dict({"type": "home", "blocks": [{"type": "rich_text", "elements": []}]})
+
+        self.assertEqual([{"type": "rich_text", "elements": []}], app_home.blocks)
+        with self.assertRaises(ValueError):
+            app_home._blocks[0].materialize()
+        with self.assertRaises(ValueError):
+            Modal.from_dict({"type": "home", "blocks": []})
+
+    def test_message(self):
+        payload = Message().set_channel("C1").set_text("fallback").add_blocks(Divider()).to_payload("post")
+
+        message = from_json(json.dumps(payload), "message")
+
+        self.assertIsInstance(message, Message)
+        self.assertEqual(payload, {**message.to_payload("post"), "blocks": message.blocks})
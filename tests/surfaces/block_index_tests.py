@@ -0,0 +1,124 @@
+import unittest
+from pyblock_builder.blocks import Actions, Divider, Header
+from pyblock_builder.elements import Button
+from pyblock_builder.surfaces import AppHome, BlockKitLimitError, Message, Modal
+from tests.helpers import FakeClient, meeting
+
+SURFACES = (AppHome, Modal, Message)
+
+
+class TestBlockIndex(unittest.TestCase):
+    """Tests for looking up and changing blocks by block_id and action_id"""
+
+    def test_get_block(self):
+        for surface_class in SURFACES:
+            surface = surface_class().add_blocks(*[meeting(n) for n in range(5)])
+
+            self.assertIs(surface._blocks[3], surface.get_block("meeting_3"))
+            self.assertIs(surface._blocks[2], surface.get_block("join_2"))
+            with self.assertRaises(KeyError):
+                surface.get_block("meeting_9")
+
+    def test_index_follows_add_blocks(self):
+        for surface_class in SURFACES:
+            surface = surface_class().add_blocks(meeting(0))
+            surface.get_block("meeting_0")
+            surface.add_blocks(meeting(1))
+
+            self.assertIs(surface._blocks[1], surface.get_block("join_1"))
+
+    def test_replace_remove_insert(self):
+        for surface in (AppHome(), Modal(), Message()):
+            surface.add_blocks(*[meeting(n) for n in range(4)])
+
+            surface.replace_block("join_1", Header().set_block_id("header").set_text("Moved"))
+            surface.remove_block("meeting_0")
+            surface.insert_after("header", Divider().set_block_id("divider"), meeting(9))
+
+            self.assertEqual(["header", "divider", "meeting_9", "meeting_2", "meeting_3"],
+                             [block["block_id"] for block in surface.blocks])
+            self.assertIs(surface._blocks[3], surface.get_block("join_2"))
+            with self.assertRaises(KeyError):
+                surface.get_block("join_1")
+
+    def test_message_caches_follow_changes(self):
+        message = Message().set_channel("C1").add_blocks(meeting(0), meeting(1))
+        before = message.fingerprint()
+        self.assertEqual("meeting_1", message.to_payload()["blocks"][1]["block_id"])
+
+        message.replace_block("meeting_1", meeting(2))
+
+        self.assertNotEqual(before, message.fingerprint())
+        self.assertEqual("meeting_2", message.to_payload()["blocks"][1]["block_id"])
+
+    def test_index_is_updated_in_place(self):
+        for surface_class in SURFACES:
+            surface = surface_class().add_blocks(*[meeting(n) for n in range(6)], Divider().set_block_id("meeting_2"))
+            surface.get_block("meeting_0")
+
+            surface.replace_block("meeting_1", meeting(7))
+            self.assertFalse(surface._index._stale)
+            surface.insert_after("meeting_7", Divider().set_block_id("divider"))
+            surface.remove_block("meeting_3")
+            surface.remove_block("meeting_2")
+            surface.replace_block("join_4", meeting(4))
+
+            positions = {}
+            for position, block in enumerate(surface.blocks):
+                positions.setdefault(block["block_id"], position)
+                if "accessory" in block:
+                    positions.setdefault(block["accessory"]["action_id"], position)
+            for key, position in positions.items():
+                self.assertEqual(position, surface._index.position(surface._blocks, key), key)
+
+    def test_get_block_changes_are_sent(self):
+        client = FakeClient()
+        message = (Message()
+                   .set_channel("C1")
+                   .set_ts("1.2")
+                   .add_blocks(meeting(0), Actions().add_elements(Button().set_label("Join").set_action_id("rsvp")))
+                   .suppress_unchanged_updates())
+        message.update(client)
+        message.budget()
+
+        message.get_block("rsvp").add_elements(Button().set_label("Decline").set_action_id("decline"))
+        result = message.update(client)
+
+        self.assertNotIn("unchanged", result)
+        self.assertEqual(2, len(client.calls[1][1]["blocks"][1]["elements"]))
+        message.get_block("meeting_0").set_text("m" * 3001)
+        self.assertEqual(3001, message.budget()["longest_text"])
+
+    def test_modal_view_follows_get_block(self):
+        modal = Modal().set_title("Week").add_blocks(meeting(0), meeting(1)).strict_limits()
+        modal.budget()
+
+        modal.get_block("join_1").set_text("m" * 3001)
+
+        self.assertEqual("m" * 3001, modal.view["blocks"][1]["text"]["text"])
+        self.assertEqual(3001, modal.budget()["longest_text"])
+
+    def test_auto_block_ids(self):
+        for surface_class in SURFACES:
+            def build():
+                return (surface_class()
+                        .add_blocks(Header().set_text("Week"), meeting(0))
+                        .auto_block_ids()
+                        .add_blocks(Divider(), Actions().add_elements(Button().set_label("New"))))
+
+            ids = [block["block_id"] for block in build().blocks]
+
+            self.assertEqual(["block_0", "meeting_0", "block_1", "block_2"], ids)
+            self.assertEqual(ids, [block["block_id"] for block in build().blocks])
+            self.assertEqual("divider", build().get_block("block_1").block["type"])
+
+    def test_strict_limits_apply_to_inserts(self):
+        for surface, limit in ((Message(), 50), (Modal(), 100), (AppHome(), 100)):
+            surface.add_blocks(*[meeting(n) for n in range(limit)]).strict_limits()
+
+            with self.assertRaises(BlockKitLimitError):
+                surface.insert_after("meeting_0", Divider())
+            with self.assertRaises(BlockKitLimitError):
+                surface.replace_block("meeting_0", Header().set_text("h" * 151))
+            surface.remove_block("meeting_0").insert_after("meeting_1", Divider())
+            self.assertEqual(limit, surface.budget()["blocks"])
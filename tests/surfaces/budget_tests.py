@@ -0,0 +1,55 @@
+import json
+import unittest
+from pyblock_builder.blocks import Actions, Divider, Header, Section
+from pyblock_builder.elements import Button, StaticSelectMenu
+from pyblock_builder.objects import Option
+from pyblock_builder.surfaces import AppHome, BlockKitLimitError, Message, Modal
+
+
+class TestBlockBudget(unittest.TestCase):
+    """Tests for the Block Kit limit accounting of surfaces"""
+
+    def test_budget_report(self):
+        menu = StaticSelectMenu.from_columns([f"Team {i}" for i in range(12)], range(12))
+        app_home = AppHome().add_blocks(Section().set_text("x" * 40).add_accessory(menu), Divider())
+
+        budget = app_home.budget()
+
+        self.assertEqual(2, budget["blocks"])
+        self.assertEqual(98, budget["blocks_left"])
+        self.assertEqual(40, budget["longest_text"])
+        self.assertEqual(12, budget["most_options"])
+        self.assertEqual([], budget["violations"])
+        self.assertEqual(len(json.dumps(app_home.blocks, separators=(",", ":"))), budget["bytes"])
+
+    def test_budget_is_incremental(self):
+        message = Message().add_blocks(Divider())
+        message.budget()
+        message.add_blocks(Header().set_text("h" * 151))
+
+        self.assertEqual(["blocks[1].text.text: 151 characters, limit is 150"], message.budget()["violations"])
+
+    def test_violations_are_reported(self):
+        message = Message().add_blocks(*[Divider() for _ in range(51)])
+        actions = Actions().add_elements(*[Button().set_label(str(i)) for i in range(26)])
+
+        self.assertEqual(["blocks: 51 blocks, limit is 50"], message.budget()["violations"])
+        self.assertEqual(["blocks[0].elements: 26 items, limit is 25"],
+                         Modal().add_blocks(actions).budget()["violations"])
+
+    def test_strict_limits_raise_at_add_time(self):
+        modal = Modal().strict_limits().add_blocks(Section().set_text("fine"))
+        menu = StaticSelectMenu().set_options(*[Option().set_text(str(i)).set_value(str(i)) for i in range(101)])
+
+        with self.assertRaises(BlockKitLimitError):
+            modal.add_blocks(Section().set_text("x" * 3001))
+        with self.assertRaises(BlockKitLimitError):
+            modal.add_blocks(Section().set_text("menu").add_accessory(menu))
+        self.assertEqual(1, modal.budget()["blocks"])
+        self.assertEqual(1, len(modal.blocks))
+
+    def test_strict_limits_checks_existing_blocks(self):
+        message = Message().add_blocks(Section().set_text("x" * 3001))
+
+        with self.assertRaises(BlockKitLimitError):
+            message.strict_limits()
@@ -0,0 +1,81 @@
+import unittest
+from pyblock_builder.blocks import Divider, Header
+from pyblock_builder.elements import Button
+from pyblock_builder.surfaces import AppHome, Message, Modal
+from tests.helpers import meeting
+
+
+class TestClone(unittest.TestCase):
+    """Tests for copy-on-write clones of surfaces"""
+
+    def test_clone_shares_blocks(self):
+        modal = Modal().set_title("Week").add_blocks(*[meeting(n) for n in range(3)])
+        clone = modal.clone()
+
+        self.assertEqual(modal.view, clone.view)
+        self.assertIsNot(modal._blocks, clone._blocks)
+        for original, cloned in zip(modal._blocks, clone._blocks):
+            self.assertIs(original, cloned)
+
+    def test_changed_block_is_copied(self):
+        for surface in (AppHome(), Modal().set_title("Week"), Message().set_channel("C1")):
+            surface.add_blocks(*[meeting(n) for n in range(3)])
+            before = surface.blocks
+            clone = surface.clone()
+
+            clone.get_block("meeting_1").set_text("Moved")
+            clone.get_block("join_2").add_accessory(Button().set_label("Leave").set_action_id("leave_2"))
+
+            self.assertEqual(before, surface.blocks)
+            self.assertEqual("Moved", clone.blocks[1]["text"]["text"])
+            self.assertEqual("leave_2", clone.blocks[2]["accessory"]["action_id"])
+            self.assertIs(surface._blocks[0], clone._blocks[0])
+            self.assertIs(clone._blocks[1], clone.get_block("meeting_1"))
+
+    def test_original_changes_do_not_reach_clone(self):
+        app_home = AppHome().add_blocks(meeting(0), meeting(1))
+        clone = app_home.clone()
+
+        app_home.get_block("meeting_0").set_text("Cancelled")
+        app_home.remove_block("meeting_1")
+
+        self.assertEqual("Meeting 0", clone.blocks[0]["text"]["text"])
+        self.assertEqual(2, len(clone.blocks))
+        self.assertEqual(1, len(app_home.blocks))
+
+    def test_structural_changes(self):
+        app_home = AppHome().add_blocks(meeting(0), meeting(1))
+        clone = (app_home.clone()
+                 .replace_block("meeting_0", Header().set_block_id("header").set_text("Week"))
+                 .insert_after("header", Divider())
+                 .add_blocks(meeting(2)))
+
+        self.assertEqual(["meeting_0", "meeting_1"], [block["block_id"] for block in app_home.blocks])
+        self.assertEqual(["header", None, "meeting_1", "meeting_2"],
+                         [block.get("block_id") for block in clone.blocks])
+        self.assertIs(clone._blocks[3], clone.get_block("join_2"))
+        self.assertEqual(2, app_home.budget()["blocks"])
+        self.assertEqual(4, clone.budget()["blocks"])
+
+    def test_frozen_blocks_stay_shared(self):
+        app_home = AppHome().add_blocks(meeting(0).freeze())
+        clone = app_home.clone()
+
+        self.assertIs(app_home._blocks[0], clone.get_block("meeting_0"))
+
+    def test_message_clone(self):
+        message = Message().set_channel("C1").set_text("Week").add_blocks(meeting(0))
+        message.fingerprint()
+        message.to_payload()
+        clone = message.clone().set_channel("C2")
+        clone.attachments.append({"text": "Extra"})
+        clone.get_block("meeting_0").set_text("Moved")
+
+        self.assertEqual("C1", message.to_payload()["channel"])
+        self.assertEqual("C2", clone.to_payload()["channel"])
+        self.assertEqual([], message.attachments)
+        self.assertEqual("Meeting 0", message.to_payload()["blocks"][0]["text"]["text"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,251 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+from datetime import datetime, timezone
+from pyblock_builder.surfaces import Message
+from pyblock_builder.blocks import Section, Divider
+from pyblock_builder.delivery import UpdateDeduplicator
+from tests.helpers import FakeAsyncClient, FakeClient
+
+
+class PagedClient:
+    """Serves scheduled messages in pages of two, linked by cursors"""
+
+    def __init__(self, total):
+        self.messages = [{"id": f"Q{i}"} for i in range(total)]
+        self.requests = []
+
+    def chat_scheduledMessages_list(self, **kwargs):
+        self.requests.append(kwargs)
+        start = int(kwargs.get("cursor", 0))
+        next_cursor = str(start + 2) if start + 2 < len(self.messages) else ""
+        return {
+            "ok": True,
+            "scheduled_messages": self.messages[start:start + 2],
+            "response_metadata": {"next_cursor": next_cursor}
+        }
+
+
+class TestMessageSurface(unittest.TestCase):
+    """Tests for the Message surface class"""
+
+    def test_post_payload(self):
+        test_message = (Message()
+                        .set_channel("C123")
+                        .set_text("fallback")
+                        .add_blocks(Section().set_text("This is a test section."), Divider())
+                        )
+        client = FakeClient()
+        test_message.post(client)
+
+        expected = ("chat_postMessage", {
+            "channel": "C123",
+            "text": "fallback",
+            "blocks": [
+                {
+                    'type': 'section',
+                    'text': {
+                        'type': 'mrkdwn',
+                        'text': 'This is a test section.'
+                    }
+                },
+                {
+                    'type': 'divider'
+                }
+            ]
+        })
+
+        self.assertEqual([expected], client.calls)
+
+    def test_payload_only_contains_accepted_keys(self):
+        test_message = (Message()
+                        .set_channel("C123")
+                        .set_user("U123")
+                        .set_text("fallback")
+                        .set_ts("1700000000.000100")
+                        .set_icon_emoji(":smile:")
+                        .deliver_ephemeral()
+                        )
+
+        self.assertEqual({"channel": "C123", "user": "U123", "text": "fallback", "icon_emoji": ":smile:"},
+                         test_message.to_payload())
+        self.assertEqual({"channel": "C123", "ts": "1700000000.000100"}, test_message.to_payload("delete"))
+        self.assertEqual({"channel": "C123", "ts": "1700000000.000100", "text": "fallback"},
+                         test_message.to_payload("update"))
+
+    def test_disabled_defaults_are_sent(self):
+        test_message = Message().set_channel("C123").disable_mrkdwn().disable_unfurl_media()
+
+        self.assertEqual({"channel": "C123", "mrkdwn": False, "unfurl_media": False}, test_message.to_payload())
+
+    def test_setters_invalidate_cached_payload(self):
+        test_message = Message().set_channel("C123").set_text("first")
+        self.assertEqual("first", test_message.to_payload()["text"])
+
+        test_message.set_text("second")
+        self.assertEqual("second", test_message.to_payload()["text"])
+
+        test_message.post_at("1700000000")
+        self.assertEqual({"channel": "C123", "post_at": "1700000000", "text": "second"}, test_message.to_payload())
+
+    def test_block_changes_reach_next_update(self):
+        section = Section().set_text("v1")
+        test_message = Message().set_channel("C123").set_ts("1.2").add_blocks(section)
+        client = FakeClient()
+
+        test_message.update(client)
+        section.set_text("v2")
+        test_message.update(client)
+
+        self.assertEqual(["v1", "v2"], [kwargs["blocks"][0]["text"]["text"] for _, kwargs in client.calls])
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            Message().to_payload("archive")
+
+    def test_post_async_matches_post(self):
+        test_message = Message().set_channel("C123").set_text("fallback").set_ts("1.2")
+        client = FakeClient()
+        async_client = FakeAsyncClient()
+
+        test_message.post(client)
+        test_message.update(client)
+        asyncio.run(test_message.post_async(async_client))
+        asyncio.run(test_message.update_async(async_client))
+
+        self.assertEqual(client.calls, async_client.calls)
+
+    def test_post_many(self):
+        test_message = Message().set_channel("C123").set_text("announcement")
+        client = FakeClient()
+
+        results = list(test_message.post_many(client, ["C1", "C2", "C3"], workers=2))
+
+        self.assertEqual({"C1", "C2", "C3"}, {result.channel for result in results})
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual({"C1", "C2", "C3"}, {kwargs["channel"] for _, kwargs in client.calls})
+        self.assertEqual("C123", test_message.to_payload()["channel"])
+
+    def test_post_many_async_reports_failures(self):
+        class FailingClient:
+            async def chat_postMessage(self, **kwargs):
+                if kwargs["channel"] == "C2":
+                    raise RuntimeError("channel_not_found")
+                return {"ok": True}
+
+        async def collect():
+            return [result async for result in
+                    Message().set_text("announcement").post_many_async(FailingClient(), ["C1", "C2", "C3"])]
+
+        results = {result.channel: result for result in asyncio.run(collect())}
+
+        self.assertTrue(results["C1"].ok)
+        self.assertFalse(results["C2"].ok)
+        self.assertIsInstance(results["C2"].error, RuntimeError)
+
+    def test_iter_scheduled_messages_follows_cursor(self):
+        for prefetch in (False, True):
+            client = PagedClient(5)
+            test_message = Message().set_channel("C123")
+
+            ids = [m["id"] for m in test_message.iter_scheduled_messages(client, page_size=2, prefetch=prefetch)]
+
+            self.assertEqual(["Q0", "Q1", "Q2", "Q3", "Q4"], ids)
+            self.assertEqual([None, "2", "4"], [request.get("cursor") for request in client.requests])
+            self.assertTrue(all(request["channel"] == "C123" for request in client.requests))
+
+    def test_iter_scheduled_messages_is_lazy(self):
+        client = PagedClient(10)
+
+        iterator = Message().iter_scheduled_messages(client, page_size=2)
+        next(iterator)
+
+        self.assertEqual(1, len(client.requests))
+
+    def test_iter_scheduled_messages_async(self):
+        class AsyncPagedClient(PagedClient):
+            async def chat_scheduledMessages_list(self, **kwargs):
+                return PagedClient.chat_scheduledMessages_list(self, **kwargs)
+
+        async def collect(prefetch):
+            return [m["id"] async for m in
+                    Message().iter_scheduled_messages_async(AsyncPagedClient(3), prefetch=prefetch)]
+
+        self.assertEqual(["Q0", "Q1", "Q2"], asyncio.run(collect(False)))
+        self.assertEqual(["Q0", "Q1", "Q2"], asyncio.run(collect(True)))
+
+    def test_scheduled_messages_datetime_range(self):
+        client = PagedClient(1)
+        oldest = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        Message().get_list_of_scheduled_messges(client, oldest=oldest)
+
+        self.assertEqual(oldest.timestamp(), client.requests[0]["oldest"])
+        self.assertNotIn("latest", client.requests[0])
+
+    def test_suppress_unchanged_updates(self):
+        deduplicator = UpdateDeduplicator()
+        client = FakeClient()
+
+        def status_message(status):
+            return (Message()
+                    .set_channel("C123")
+                    .set_ts("1.2")
+                    .set_text(status)
+                    .add_blocks(Section().set_text(f"Status: {status}"))
+                    .suppress_unchanged_updates(deduplicator))
+
+        status_message("green").update(client)
+        result = status_message("green").update(client)
+        status_message("red").update(client)
+
+        self.assertTrue(result["unchanged"])
+        self.assertEqual(["green", "red"], [kwargs["text"] for _, kwargs in client.calls])
+        self.assertEqual({"sent": 2, "suppressed": 1, "evicted": 0}, deduplicator.counters)
+
+    def test_update_deduplicator_evicts_least_recent(self):
+        deduplicator = UpdateDeduplicator(max_entries=2)
+        deduplicator.record(("C1", "1"), b"a")
+        deduplicator.record(("C2", "1"), b"b")
+        deduplicator.is_unchanged(("C1", "1"), b"a")
+        deduplicator.record(("C3", "1"), b"c")
+
+        self.assertTrue(deduplicator.is_unchanged(("C1", "1"), b"a"))
+        self.assertFalse(deduplicator.is_unchanged(("C2", "1"), b"b"))
+
+    def test_fingerprint_follows_blocks(self):
+        section = Section().set_text("one")
+        test_message = Message().set_channel("C123").add_blocks(section)
+        first = test_message.fingerprint()
+        section.set_text("two")
+        second = test_message.fingerprint()
+        test_message.add_blocks(Divider())
+
+        self.assertNotEqual(first, second)
+        self.assertNotEqual(second, test_message.fingerprint())
+        section.set_text("one")
+        self.assertNotEqual(first, test_message.fingerprint())
+        self.assertEqual(first, Message().set_channel("C123").add_blocks(Section().set_text("one")).fingerprint())
+
+    def test_fingerprint_reuses_block_digests(self):
+        client = FakeClient()
+        test_message = (Message()
+                        .set_channel("C123")
+                        .set_ts("1.2")
+                        .add_blocks(*[Section().set_text(str(i)).set_block_id(f"b{i}") for i in range(3)])
+                        .suppress_unchanged_updates())
+        test_message.update(client)
+        first = test_message.fingerprint()
+
+        with mock.patch("json.dumps", wraps=json.dumps) as dumps:
+            self.assertTrue(test_message.update(client)["unchanged"])
+        self.assertEqual(1, dumps.call_count)
+
+        test_message.get_block("b1").set_text("changed")
+        with mock.patch("json.dumps", wraps=json.dumps) as dumps:
+            self.assertNotEqual(first, test_message.fingerprint())
+        self.assertEqual(2, dumps.call_count)
+        test_message.remove_block("b2").add_blocks(Section().set_text("2").set_block_id("b2"))
+        test_message.get_block("b1").set_text("1")
+        self.assertEqual(first, test_message.fingerprint())
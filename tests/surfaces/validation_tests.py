@@ -0,0 +1,121 @@
+import asyncio
+import unittest
+from unittest import mock
+from pyblock_builder.blocks import Actions, Context, Divider, File, Input, Section
+from pyblock_builder.elements import Button, PlainTextInput, StaticSelectMenu
+from pyblock_builder.objects import Option
+from pyblock_builder.surfaces import AppHome, BlockKitValidationError, Message, Modal, validate
+from tests.helpers import FakeAsyncClient, FakeClient
+
+
+class TestValidation(unittest.TestCase):
+    """Tests for the Block Kit validator"""
+
+    def test_valid_modal(self):
+        modal = (Modal()
+                 .set_title("Ticket")
+                 .set_submit_label("Submit")
+                 .add_blocks(Section().set_text("Hello"),
+                             Input().set_label("Summary").add_element(PlainTextInput().set_action_id("summary")),
+                             Actions().add_elements(Button().set_label("Go").set_action_id("go"))))
+
+        self.assertEqual([], modal.validate())
+
+    def test_missing_required_keys(self):
+        app_home = AppHome().add_blocks(Divider(), Section(), Actions().add_elements(Button().set_action_id("go")))
+
+        self.assertEqual([("/blocks/1", "must have one of text, fields"),
+                          ("/blocks/2/elements/0/text", "missing required key")], app_home.validate())
+
+    def test_disallowed_types(self):
+        block = Input().set_label("Pick").add_element(Button().set_label("No"))
+        app_home = AppHome().add_blocks(block, File().set_external_id("F1"))
+
+        self.assertEqual([("/blocks/0/element", "type 'button' is not allowed here"),
+                          ("/blocks/1", "type 'file' is not allowed here")], app_home.validate())
+        self.assertEqual([("/blocks/0/element", "type 'button' is not allowed here")],
+                         Message().add_blocks(block, File().set_external_id("F1")).validate())
+
+    def test_limits(self):
+        menu = StaticSelectMenu().set_options(Option().set_text("o" * 76).set_value("1"))
+        app_home = AppHome().add_blocks(
+            Section().set_text("s" * 3001).set_block_id("b").add_accessory(menu),
+            Context().add_elements(*[Button().set_label(str(i)) for i in range(11)]).set_block_id("b"))
+
+        violations = validate(app_home.view)
+
+        self.assertIn(("/blocks/0/text/text", "3001 characters, limit is 3000"), violations)
+        self.assertIn(("/blocks/0/accessory/options/0/text/text", "76 characters, limit is 75"), violations)
+        self.assertIn(("/blocks/1/elements", "11 items, limit is 10"), violations)
+        self.assertIn(("/blocks/1/elements/10", "type 'button' is not allowed here"), violations)
+        self.assertIn(("/blocks/1/block_id", "duplicate block_id 'b'"), violations)
+
+    def test_modal_rules(self):
+        modal = Modal().set_title("t" * 25).add_blocks(Input().set_label("Summary").add_element(PlainTextInput()))
+
+        self.assertEqual([("/title/text", "25 characters, limit is 24"),
+                          ("/submit", "required when the modal has input blocks")], modal.validate())
+        self.assertEqual([("/title", "missing required key")], validate({"type": "modal", "blocks": []}))
+
+    def test_frozen_blocks(self):
+        actions = Actions().add_elements(Button().set_label("Go").set_action_id("go").freeze())
+        message = Message().add_blocks(Section().set_text("Hello").freeze(), actions.freeze(), Section().freeze())
+
+        self.assertEqual([("/blocks/2", "must have one of text, fields")], message.validate())
+        self.assertEqual([], Message().add_blocks(actions).validate())
+
+    def test_plain_dicts(self):
+        payload = {"text": "fallback", "blocks": [{"type": "section", "fields": ["a"]},
+                                                  {"type": "image", "image_url": "https://x/y.png", "alt_text": ""}]}
+
+        self.assertEqual([("/blocks/0/fields/0", "must be an object"),
+                          ("/blocks/1/alt_text", "missing required key")], validate(payload, "message"))
+        with self.assertRaises(ValueError):
+            validate({"blocks": []})
+
+    def test_validate_before_send(self):
+        client = FakeClient()
+        message = Message().set_channel("C1").add_blocks(Section()).validate_before_send()
+
+        with self.assertRaises(BlockKitValidationError) as raised:
+            message.post(client)
+        self.assertEqual([("/blocks/0", "must have one of text, fields")], raised.exception.violations)
+        self.assertEqual([], client.calls)
+
+        message.delete(client)
+        self.assertEqual(["chat_delete"], [method for method, _ in client.calls])
+
+    def test_validate_before_send_async(self):
+        client = FakeAsyncClient()
+        modal = Modal().set_title("Ticket").add_blocks(Section()).validate_before_send()
+        request_body = {"trigger_id": "T1", "view": {"id": "V1", "hash": "h"}}
+
+        with self.assertRaises(BlockKitValidationError):
+            asyncio.run(modal.open_view_async(request_body, client))
+        self.assertEqual([], client.calls)
+
+    def test_validate_before_send_method(self):
+        client = FakeClient()
+        message = Message().set_channel("C1").set_ts("1.2").deliver_ephemeral().add_blocks(Section().set_text("Hi"))
+
+        with mock.patch.object(Message, "validate", autospec=True, return_value=[]) as validate_message:
+            message.validate_before_send().update(client)
+            message.post(client)
+        self.assertEqual([mock.call(message, "update"), mock.call(message, "ephemeral")],
+                         validate_message.call_args_list)
+
+    def test_post_many_validates_once(self):
+        client = FakeClient()
+        message = Message().add_blocks(Section().set_text("Hi")).validate_before_send()
+
+        with mock.patch.object(Message, "validate", autospec=True, return_value=[]) as validate_message:
+            results = list(message.post_many(client, ["C1", "C2", "C3"]))
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual([mock.call(message, "post")], validate_message.call_args_list)
+
+        message.add_blocks(Section())
+        with self.assertRaises(BlockKitValidationError):
+            list(message.post_many(client, ["C4", "C5"]))
+        with self.assertRaises(BlockKitValidationError):
+            asyncio.run(message.post_many_async(FakeAsyncClient(), ["C4", "C5"]).__anext__())
+        self.assertEqual(3, len(client.calls))
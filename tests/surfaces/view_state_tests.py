@@ -0,0 +1,103 @@
+import unittest
+from datetime import date, datetime, time, timezone
+from pyblock_builder.blocks import Actions, Input
+from pyblock_builder.elements import (Button, Checkboxes, DatePicker, DatetimePicker, NumberInput, PlainTextInput,
+                                      StaticSelectMenu, TimePicker)
+from pyblock_builder.objects import Option
+from pyblock_builder.surfaces import Modal, StateSchema, ViewState
+
+
+def ticket_modal():
+    return (Modal()
+            .set_title("Ticket")
+            .set_submit_label("Submit")
+            .add_blocks(
+                Input().set_block_id("summary_block").set_label("Summary")
+                .add_element(PlainTextInput().set_action_id("summary")),
+                Input().set_label("Due").add_element(DatePicker().set_action_id("due")),
+                Input().set_label("Priority").add_element(StaticSelectMenu().set_action_id("priority").set_options(
+                    Option().set_text("High").set_value("high"))),
+                Input().set_label("Tags").add_element(Checkboxes().set_action_id("tags").set_options(
+                    Option().set_text("Bug").set_value("bug"), Option().set_text("UI").set_value("ui"))),
+                Input().set_label("Count").add_element(NumberInput().set_action_id("count")),
+                Input().set_label("At").add_element(TimePicker().set_action_id("at")),
+                Input().set_label("When").add_element(DatetimePicker().set_action_id("when")),
+                Actions().add_elements(Button().set_label("Go").set_action_id("go"))
+            ))
+
+
+def submission():
+    return {
+        "type": "view_submission",
+        "view": {"state": {"values": {
+            "summary_block": {"summary": {"type": "plain_text_input", "value": "Broken login"}},
+            "b2": {"due": {"type": "datepicker", "selected_date": "2024-05-01"}},
+            "b3": {"priority": {"type": "static_select",
+                                "selected_option": {"text": {"type": "plain_text", "text": "High"},
+                                                    "value": "high"}}},
+            "b4": {"tags": {"type": "checkboxes", "selected_options": [
+                {"text": {"type": "plain_text", "text": "Bug"}, "value": "bug"}]}},
+            "b5": {"count": {"type": "number_input", "value": "3"}},
+            "b6": {"at": {"type": "timepicker", "selected_time": "09:30", "timezone": "Europe/Paris"}},
+            "b7": {"when": {"type": "datetimepicker", "selected_date_time": 1714550400}},
+        }}}
+    }
+
+
+class TestViewState(unittest.TestCase):
+    """Tests for reading the state of interaction payloads"""
+
+    def test_typed_values(self):
+        for schema in (None, ticket_modal().state_schema()):
+            state = ViewState.from_payload(submission(), schema)
+
+            self.assertEqual("Broken login", state["summary"])
+            self.assertEqual(date(2024, 5, 1), state["due"])
+            self.assertEqual("high", state["priority"])
+            self.assertEqual(["bug"], state["tags"])
+            self.assertEqual(3, state["count"])
+            self.assertEqual(time(9, 30), state["at"])
+            self.assertEqual(datetime(2024, 5, 1, 8, 0, tzinfo=timezone.utc), state["when"])
+            self.assertEqual("Europe/Paris", state.raw("at")["timezone"])
+
+    def test_schema_finds_known_block_ids_without_indexing(self):
+        schema = ticket_modal().state_schema()
+        state = ViewState.from_payload(submission(), schema)
+
+        self.assertEqual("Broken login", state["summary"])
+        self.assertIsNone(state._index)
+        self.assertIn("when", schema)
+        self.assertNotIn("go", schema)
+
+    def test_missing_and_empty_values(self):
+        payload = {"view": {"state": {"values": {"b": {"due": {"type": "datepicker", "selected_date": None},
+                                                       "tags": {"type": "checkboxes", "selected_options": []},
+                                                       "count": {"type": "number_input", "value": ""},
+                                                       "size": {"type": "number_input", "value": " "}}}}}}
+        state = ViewState.from_payload(payload)
+
+        self.assertIsNone(state["due"])
+        self.assertEqual([], state["tags"])
+        self.assertIsNone(state["count"])
+        self.assertIsNone(state["size"])
+        self.assertIsNone(state.get("summary"))
+        with self.assertRaises(KeyError):
+            state["summary"]
+        self.assertEqual({"due": None, "tags": [], "count": None, "size": None}, state.to_dict())
+        self.assertEqual(["due", "tags", "count", "size"], list(state))
+
+    def test_action_id_in_several_blocks(self):
+        values = {"a": {"name": {"type": "plain_text_input", "value": "first"}},
+                  "b": {"name": {"type": "plain_text_input", "value": "second"}}}
+        state = ViewState(values)
+
+        with self.assertRaises(KeyError):
+            state["name"]
+        self.assertEqual("second", state.value("b", "name"))
+
+    def test_block_actions_in_messages(self):
+        payload = {"type": "block_actions", "state": {"values": {"b": {"go": {"type": "users_select",
+                                                                             "selected_user": "U1"}}}}}
+
+        self.assertEqual("U1", ViewState.from_payload(payload)["go"])
+        self.assertEqual(0, len(StateSchema()))
@@ -0,0 +1,64 @@
+import unittest
+from pyblock_builder.blocks import Section, Header, Divider
+from pyblock_builder.elements import Button
+from pyblock_builder.mrkdwn import md
+from pyblock_builder.surfaces import Message, Modal
+from pyblock_builder.templates import Slot, Template
+
+
+class TestTemplate(unittest.TestCase):
+    """Tests for the Template class"""
+
+    def test_render_matches_builder_output(self):
+        def build(user_name, value):
+            return (Modal()
+                    .set_title("Digest")
+                    .add_blocks(
+                        Header().set_text(user_name),
+                        Section().set_text(f"Hello {md.bold(user_name)}").add_accessory(
+                            Button().set_label("Open").set_value(value)
+                        ),
+                        Divider()
+                    ))
+
+        template = Template(build(Slot("user_name"), Slot("value")))
+
+        self.assertEqual({"user_name", "value"}, template.slots)
+        self.assertEqual(build("Ann", "42").view, template.render(user_name="Ann", value="42"))
+
+    def test_message_template(self):
+        template = Template(Message().set_channel(Slot("channel")).set_text("Update"))
+
+        self.assertEqual({"channel": "D1", "text": "Update"}, template.render(channel="D1"))
+
+    def test_template_is_independent_of_surface(self):
+        test_message = Message().set_channel(Slot("channel")).add_blocks(Section().set_text("static"))
+        template = Template(test_message)
+        test_message.blocks[0]["text"]["text"] = "changed"
+
+        self.assertEqual("static", template.render(channel="C1")["blocks"][0]["text"]["text"])
+
+    def test_values_are_escaped_when_encoded(self):
+        import json
+
+        test_message = (Message()
+                        .set_channel("C1")
+                        .add_blocks(Section().set_text(f"Hi {Slot('name')}").freeze(), Divider().freeze())
+                        .send_pre_encoded())
+        template = Template(test_message)
+        name = 'Ann "the admin"\nSmith'
+
+        rendered = template.render(name=name)
+
+        self.assertEqual(f"Hi {name}", json.loads(json.dumps(rendered))["blocks"][0]["text"]["text"])
+        self.assertEqual(rendered, Template(test_message._encoded(test_message.to_payload())).render(name=name))
+
+    def test_missing_slot(self):
+        template = Template(Message().set_channel(Slot("channel")))
+
+        with self.assertRaises(KeyError):
+            template.render()
+
+    def test_invalid_slot_name(self):
+        with self.assertRaises(ValueError):
+            Slot("user name")